@@ -20,19 +20,20 @@ if __name__ == "__main__":
     cnt2_sum = 0
     cnt3_sum = 0
     tables = db.show_tables()
+    table_columns = db.columns_of(tables)  # One query for the columns of all tables
     diff_sum = 0
     diff_cnt = 0
     for table in tables:
         version_num = db.entry_count(table)
         total_version_num += version_num
 
-        columns = db.show_columns(table)
+        columns = table_columns[table]
         if 'tag date' in columns and 'npm date' in columns:
             cnt1_sum += db.entry_count(table, condition="`tag date` IS NOT NULL AND `npm date` IS NOT NULL AND `tag date` > `npm date`")
             cnt2_sum += db.entry_count(table, condition="`tag date` IS NOT NULL AND `npm date` IS NOT NULL AND `tag date` < `npm date`")
             cnt3_sum += db.entry_count(table, condition="`tag date` IS NOT NULL AND `npm date` IS NOT NULL AND `tag date` = `npm date`")
 
-            res = db.select_all(table, ['tag date', 'npm date'], condition="`tag date` IS NOT NULL AND `npm date` IS NOT NULL")
+            res = db.iter_rows(table, ['tag date', 'npm date'], condition="`tag date` IS NOT NULL AND `npm date` IS NOT NULL")
             for entry in res:
                 diff = (entry['npm date'] - entry['tag date']).days
                 diff_cnt += 1
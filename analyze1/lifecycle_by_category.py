@@ -10,7 +10,7 @@ from utils.sqlHelper import ConnDatabase
 from utils.logger import getLogger
 from utils.stat import Distribution as Dist
 from utils.globalv import CATEGORY_LIST
-db = ConnDatabase('Libraries')
+db = ConnDatabase('Libraries', cache=True)
 logger = getLogger()
 
 TABLE = 'libs_cdnjs_all_4_20u'
@@ -27,6 +27,7 @@ def analyze(category, total=False):
     start_update_sum_list = [0] * SPAN      # the number of cumulative libraries that start to update of each year
     keep_update_list = [0] * SPAN           # the number of libraries that keep updateing of each year
     
+    # Filtered by MySQL (its collation decides which categories match); repeated queries are served by cache=True
     if total:
         res = db.select_all(TABLE, ['created', 'first tag date', 'last tag date'])
     else:
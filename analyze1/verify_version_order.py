@@ -18,14 +18,16 @@ if __name__ == "__main__":
     table_cnt = 0
     version_cnt = 0
     total_version_num = 0
-    for table in  db.show_tables():
-        columns = db.show_columns(table)
+    tables = db.show_tables()
+    table_columns = db.columns_of(tables)  # One query for the columns of all tables
+    for table in tables:
+        columns = table_columns[table]
         if 'tag date' not in columns or 'estimate date' not in columns or 'npm date' not in columns:
             continue
         old_date = None
         
         wrong_order = False
-        res = db.select_all(table, ['tag date', 'estimate date', 'npm date', 'version'], return_as='tuple')
+        res = db.iter_rows(table, ['tag date', 'estimate date', 'npm date', 'version'], return_as='tuple')
         for entry in res:
             npm_date = entry[2]
             v_date = entry[0]
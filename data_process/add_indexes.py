@@ -0,0 +1,65 @@
+# Add the missing indexes on the lookup keys of the existing tables (one-off)
+# Tables created by create_if_not_exists in the crawl scripts have no keys, so every
+# `WHERE libname=%s`, `version=%s` or `synk=%s` scans the whole table.
+
+import re
+import sys
+from pathlib import Path
+parent_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(parent_dir))
+from utils.sqlHelper import ConnDatabase, is_duplicate_entry
+from utils.logger import getLogger
+logger = getLogger()
+
+# (table name pattern, fields, unique)
+# Unique keys are the ones used by upsert_many; fall back to a plain index on duplicates.
+LIBRARY_INDEXES = [
+    (r'libs_cdnjs_all_4_20', ['libname'], False),
+    (r'libs_cdnjs_all_4_20', ['github'], False),
+    (r'libs_cdnjs_all_4_20u', ['libname'], False),
+    (r'libs_cdnjs_all_4_20u', ['npm'], False),
+    (r'vulnerabilities', ['synk'], True),
+    (r'vulnerabilities', ['libname'], False),
+    (r'HITS_\d{4}Q\d', ['libname'], True),
+    (r'tags_5_11', ['libname'], False),
+]
+# Every per-library table in these databases
+VERSION_DATABASES = ['version_npm', 'version_gh']
+VERSION_INDEX = (['version'], True)
+
+
+def add_index(db: ConnDatabase, table: str, fields: list, unique: bool) -> None:
+    try:
+        if db.ensure_index(table, fields, unique=unique):
+            logger.info(f"Added {'unique ' if unique else ''}index on {table} ({', '.join(fields)}).")
+    except Exception as e:
+        if not (unique and is_duplicate_entry(e)):
+            logger.warning(f"Failed to index {table} ({', '.join(fields)}): {e}")
+            return
+        logger.warning(f"{table} ({', '.join(fields)}) has duplicated entries. Add a non-unique index instead.")
+        add_index(db, table, fields, False)
+
+
+def index_database(db: ConnDatabase, rules: list) -> None:
+    tables = db.show_tables()
+    columns = db.columns_of(tables)
+    for i, table in enumerate(tables):
+        for pattern, fields, unique in rules:
+            if re.fullmatch(pattern, table) and all(field in columns[table] for field in fields):
+                add_index(db, table, fields, unique)
+        logger.leftTimeEstimator(len(tables) - i)
+
+
+if __name__ == '__main__':
+    db = ConnDatabase('Libraries')
+    index_database(db, LIBRARY_INDEXES)
+    db.close()
+
+    fields, unique = VERSION_INDEX
+    for database_name in VERSION_DATABASES:
+        logger.info(f"Indexing the tables in {database_name}.")
+        db = ConnDatabase(database_name)
+        index_database(db, [(r'.*', fields, unique)])
+        db.close()
+
+    logger.timecost()
@@ -0,0 +1,24 @@
+# Copy the per-library version tables (version_npm, version_gh, Releases_4_26, Tags_4_26)
+# into the consolidated `versions` table of the version store (one-off, safe to re-run).
+# Usage: python migrate_versions.py [source ...]    (default: all sources)
+
+import sys
+from pathlib import Path
+parent_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(parent_dir))
+from utils.versionStore import VersionStore, SOURCES
+from utils.logger import getLogger
+logger = getLogger()
+
+
+if __name__ == '__main__':
+    sources = sys.argv[1:] or list(SOURCES)
+    store = VersionStore()
+    for source in sources:
+        database_name = SOURCES[source][0]
+        logger.info(f"Migrating {database_name} into the version store as '{source}'.")
+        total = store.migrate(source, logger=logger)
+        logger.info(f"Copied {total} versions of {len(store.libs(source))} libraries from {database_name}.")
+    store.close()
+
+    logger.timecost()
@@ -0,0 +1,32 @@
+# Export the Libraries, version_npm and version_gh tables used by the analyses into a
+# Parquet snapshot, or import a snapshot into local SQLite databases.
+# Usage: python snapshot.py export [folder]
+#        python snapshot.py import [folder]    then run the analyses with DB_BACKEND=sqlite
+
+import sys
+from pathlib import Path
+parent_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(parent_dir))
+from utils.snapshot import export_snapshot, import_snapshot
+from utils.logger import getLogger
+logger = getLogger()
+
+SNAPSHOT_DIR = parent_dir / 'snapshot'
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in ('export', 'import'):
+        print("Usage: python snapshot.py export|import [folder]")
+        sys.exit(1)
+    snapshot_dir = sys.argv[2] if len(sys.argv) > 2 else str(SNAPSHOT_DIR)
+
+    if sys.argv[1] == 'export':
+        manifest = export_snapshot(snapshot_dir, logger=logger)
+        total = sum(len(tables) for tables in manifest['databases'].values())
+        logger.info(f"Exported {total} tables to {snapshot_dir}.")
+    else:
+        counts = import_snapshot(snapshot_dir, logger=logger)
+        for database_name, rows in counts.items():
+            logger.info(f"{database_name}: {rows} rows.")
+
+    logger.timecost()
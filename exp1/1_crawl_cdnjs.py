@@ -13,9 +13,14 @@ parent_dir = Path(__file__).resolve().parent.parent
 sys.path.append(str(parent_dir))
 from utils.sqlHelper import ConnDatabase
 from utils.logger import getLogger
+from utils.api_reader import GitHubGraphQLReader, GitHubAPIReader
 
 db = ConnDatabase('Libraries')
 logger = getLogger()
+gh_reader = GitHubGraphQLReader(logger=logger)
+# REST fallback for the repositories GraphQL could not read. Unchanged repositories
+# are revalidated with conditional requests, which don't count against the rate limit
+rest_reader = GitHubAPIReader(logger=logger, cache=True, revalidate=True)
 
 
 # Github API rate limit: 5000/hr
@@ -27,34 +32,18 @@ OUTPUT_TABLE = 'libs_cdnjs_all_4_20'
 CRAWL_START = 0
 CRAWL_END = 100000
 CRAWL_INTERVAL = 0.2    # sleep seconds between iterations
+GITHUB_BATCH = 100      # libraries whose GitHub information is read together
 
-MEMORY_DICT = {}
+MEMORY_DICT = {}        # github_direct -> repository information read through the REST fallback
 
-def readurl(url:str) -> object:
-    # Github API rate limit: 5000/hr
-    # Token generation: https://github.com/settings/tokens
-    GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
-
-    req = Request(url)
-    req.add_header('Authorization', f'token {GITHUB_TOKEN}')
-    res = None
-    try:
-        res = json.loads(urlopen(req).read())
-    except KeyboardInterrupt:
-        pass
-    except:
-        logger.warning(f"{url} is an invalid url. Or github token is outdated.")
-    return res
-
-
-def update_github_info(libname, lib_info):
+def github_repo(libname, lib_info):
+    """Return the "owner/repo" of the library's GitHub repository, or None."""
     try:
         raw_url = lib_info['repository']['url']
     except:
         logger.warning(f'{libname} doesn\'t have repository information.')
         return 
 
-    # Get star from Github API
     ptr = raw_url.find('github.com')
     if ptr == -1:
         logger.warning('Not a github domain.')
@@ -66,95 +55,70 @@ def update_github_info(libname, lib_info):
     if raw_url[-1] == '/':
         raw_url = raw_url[:-1]
 
-    github_direct = raw_url[ptr+11:]
-    github_api_url = f'https://api.github.com/repos/{github_direct}'
+    return raw_url[ptr+11:]
+
+
+def readurl(url:str) -> object:
+    res, should_stop = rest_reader.read_url(url)
+    if should_stop:
+        logger.warning(f"{url} is an invalid url. Or github token is outdated.")
+    return res
+
+
+def read_github_info_rest(github_direct):
+    """
+    Read the repository information through the REST API, in the format of GitHubGraphQLReader.read_repos.
+
+    The tags are read with GitHubGraphQLReader.read_tags under the canonical repository name,
+    so that the first and last tag are chosen by commit date as in read_repos. If they
+    cannot be read, the tag fields are None and the tag columns are left as they are.
+    """
+    if github_direct in MEMORY_DICT:
+        # Prevent duplicate queries on the same github url
+        return MEMORY_DICT[github_direct]
+
+    repo_info = readurl(f'https://api.github.com/repos/{github_direct}')
+    info = None
+    if repo_info:
+        full_name = repo_info['full_name']
+        tags = gh_reader.read_tags([full_name]).get(full_name)  # Newest commit first
+        info = {
+            'name_with_owner': full_name,
+            'stargazers_count': repo_info['stargazers_count'],
+            'created_at': repo_info['created_at'],
+            'updated_at': repo_info['updated_at'],
+            'tag_count': len(tags) if tags is not None else None,
+            'first_tag': tags[-1] if tags else None,
+            'last_tag': tags[0] if tags else None,
+        }
+    MEMORY_DICT[github_direct] = info
+    return info
+
+
+def update_github_info(libname, github_direct, repo_info):
+    """Store the star, dates and tag information read by GitHubGraphQLReader.read_repos."""
     github_url = f'github.com/{github_direct}'
-    
-    repo_info = readurl(github_api_url)
     if not repo_info:
+        # e.g. URLs with extra path segments, or queries GraphQL gave up on
+        repo_info = read_github_info_rest(github_direct)
+    if not repo_info:
+        logger.warning(f"{github_url} is an invalid url. Or github token is outdated.")
         return
-    
-    # Update star information
-    star = 0
-    created = None
-    updated = None
-    if repo_info['stargazers_count']:
-        star = repo_info['stargazers_count']
-    if repo_info['created_at']:
-        created = repo_info['created_at'][:10]
-    if repo_info['updated_at']:
-        updated = repo_info['updated_at'][:10]
-    db.upsert(
-            table_name=OUTPUT_TABLE,
-            data={'libname': libname,
-                'star': star,
-                'github': github_url, 
-                'created': created, 
-                'updated': updated},
-            condition_fields="libname"
-        )
-    
-    # Update tag information
-    if github_url in MEMORY_DICT:
-        # Prevent duplicate query on the same github url
-        lib_entry = MEMORY_DICT[github_url]
-        db.upsert(
-            table_name=OUTPUT_TABLE,
-            data={'libname': libname,
-                '# tag': lib_entry[0],
-                'first tag name': lib_entry[1], 
-                'first tag date': lib_entry[2], 
-                'last tag name': lib_entry[3], 
-                'last tag date': lib_entry[4]},
-            condition_fields="libname"
-        )
-        return
-    
-    page_no = 1
-    tag_no = 0
-    first_tag = None
-    last_tag = None
-    while(True):
-
-        tag_url = f'https://api.github.com/repos/{github_direct}/tags?page={page_no}'
-        tag_info_list = readurl(tag_url)
-        logger.info(f'Reading the data from {tag_url} ...')
-
-        if tag_info_list and isinstance(tag_info_list, list) and len(tag_info_list) > 0:
-            tag_no += len(tag_info_list)
-            if not last_tag:
-                last_tag = tag_info_list[0]
-            first_tag = tag_info_list[-1]
-        else:
-            break
-
-        page_no += 1
-
-    first_tag_date = None
-    first_tag_name = None
-    if first_tag:
-        first_tag_name = first_tag['name']
-        first_commit_info = readurl(first_tag['commit']['url'])
-        if first_commit_info:
-            first_tag_date = first_commit_info['commit']['author']['date'][:10]
-    last_tag_date = None
-    last_tag_name = None
-    if last_tag:
-        last_tag_name = last_tag['name']
-        last_commit_info = readurl(last_tag['commit']['url'])
-        if last_commit_info:
-            last_tag_date = last_commit_info['commit']['author']['date'][:10]
-    db.upsert(
-        table_name=OUTPUT_TABLE,
-        data={'libname': libname,
-               '# tag': tag_no,
-               'first tag name': first_tag_name, 
-               'first tag date': first_tag_date, 
-               'last tag name': last_tag_name, 
-               'last tag date': last_tag_date},
-        condition_fields="libname"
-    )
-    MEMORY_DICT[github_url] = [tag_no, first_tag_name, first_tag_date, last_tag_name, last_tag_date]
+
+    data = {'libname': libname,
+            'star': repo_info['stargazers_count'] or 0,
+            'github': github_url, 
+            'created': repo_info['created_at'][:10] if repo_info['created_at'] else None, 
+            'updated': repo_info['updated_at'][:10] if repo_info['updated_at'] else None}
+    if repo_info['tag_count'] is not None:
+        first_tag = repo_info['first_tag']
+        last_tag = repo_info['last_tag']
+        data.update({'# tag': repo_info['tag_count'],
+                     'first tag name': first_tag['name'] if first_tag else None, 
+                     'first tag date': first_tag['date'][:10] if first_tag and first_tag['date'] else None, 
+                     'last tag name': last_tag['name'] if last_tag else None, 
+                     'last tag date': last_tag['date'][:10] if last_tag and last_tag['date'] else None})
+    db.upsert(table_name=OUTPUT_TABLE, data=data, condition_fields="libname")
     
 def update_basic_info(libname, lib_info):
     url = lib_info['homepage'] if 'homepage' in lib_info else None
@@ -200,24 +164,27 @@ if __name__ == '__main__':
     res = urlopen(f'https://api.cdnjs.com/libraries')
     lib_list = json.loads(res.read())['results']
     lib_num = len(lib_list)
-    cnt = 0
-
-    for lib_entry in lib_list:
-        cnt += 1
-        if cnt < CRAWL_START:
-            continue
-        if cnt > CRAWL_END:
-            break
-        libname = lib_entry['name']
-        cdnjs = f'https://cdnjs.com/libraries/{libname}'
-        res = urlopen(f'https://api.cdnjs.com/libraries/{libname}')
-        lib_info = json.loads(res.read())
-
-        update_github_info(libname, lib_info)    
-        update_basic_info(libname, lib_info)
-
-        logger.info(f'{libname} finished. ({cnt} / {lib_num})')
-        time.sleep(CRAWL_INTERVAL)
+
+    lib_entries = list(enumerate(lib_list, start=1))[max(CRAWL_START - 1, 0):CRAWL_END]
+    for start in range(0, len(lib_entries), GITHUB_BATCH):
+        chunk = []
+        for cnt, lib_entry in lib_entries[start:start + GITHUB_BATCH]:
+            libname = lib_entry['name']
+            res = urlopen(f'https://api.cdnjs.com/libraries/{libname}')
+            lib_info = json.loads(res.read())
+            chunk.append((cnt, libname, lib_info, github_repo(libname, lib_info)))
+            time.sleep(CRAWL_INTERVAL)
+
+        # Stars, dates and tags of the whole chunk in a few GraphQL queries
+        repo_infos = gh_reader.read_repos({repo for *_, repo in chunk if repo})
+
+        for cnt, libname, lib_info, repo in chunk:
+            cdnjs = f'https://cdnjs.com/libraries/{libname}'
+            if repo:
+                update_github_info(libname, repo, repo_infos.get(repo))
+            update_basic_info(libname, lib_info)
+
+            logger.info(f'{libname} finished. ({cnt} / {lib_num})')
 
 
     db.close()
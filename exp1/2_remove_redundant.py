@@ -19,41 +19,17 @@ db.clone_table_structure(OLD_TABLE , NEW_TABLE)
 
 # Get the columns from source table (excluding 'id')
 columns = db.show_columns(OLD_TABLE)
-if 'id' in columns:
+has_id = 'id' in columns
+if has_id:
     columns.remove('id')
 if 'github' not in columns:
     raise ValueError("Source table has no 'github' column")
 
-unique_count = 0
-
-
-# Get records with non-empty github values
-query = f"""
-    SELECT `{'`, `'.join(columns)}` 
-    FROM `{OLD_TABLE}` 
-    WHERE `github` IS NOT NULL AND `github` != ''
-"""
-res = db.fetchall(query)
-
-for record in res:
-    github_value = record[columns.index('github')]
-    
-    # Check if this github value already exists in new table
-    exists = db.fetchone(
-        f"SELECT 1 FROM `{NEW_TABLE}` WHERE `github` = %s LIMIT 1",
-        (github_value,)
-    )
-    
-    if not exists:
-        # Insert into new table
-        columns_str = "`, `".join(columns)
-        placeholders = ", ".join(["%s"] * len(columns))
-        insert_query = f"""
-            INSERT INTO `{NEW_TABLE}` (`{columns_str}`)
-            VALUES ({placeholders})
-        """
-        db.execute(insert_query, record)
-        unique_count += 1
+# Copy the first record of every non-empty github value in one statement, by id if the
+# table has one, else by cdnjs rank (the table created by 1_crawl_cdnjs.py has no id)
+unique_count = db.dedupe_into(
+    OLD_TABLE, NEW_TABLE, 'github', keep='first', order_by='id' if has_id else 'cdnjs rank', fields=columns,
+    condition="`github` IS NOT NULL AND `github` != ''"
+)
 
 print(f"Found {unique_count} unique GitHub entries so far")
-
@@ -18,6 +18,7 @@ logger = getLogger()
 TABLE = 'libs_cdnjs_all_4_20u'
 CRAWL_START = 1
 CRAWL_INTERVAL = 0.1    # sleep seconds between iterations
+FLUSH_EVERY = 100       # queued updates written at once; restart from the last "Flushed" CRAWL_START
 
 def get_normalized_github_urls_from_db():
     """
@@ -81,28 +82,41 @@ def crawl_jsdelivr_hits():
     normalized_urls = get_normalized_github_urls_from_db()
     
     cnt = 1
-    for normalized_url, libname in normalized_urls.items():
-        if cnt < CRAWL_START:
-            cnt += 1
-            continue
+    # Queue the updates and write them in bulk, so the loop waits on the API only.
+    # They are written by the flushes below only, so the logged CRAWL_START is what is committed.
+    queued = 0
+    with db.write_behind(max_rows=None, max_delay=None):
+        for normalized_url, libname in normalized_urls.items():
+            if cnt < CRAWL_START:
+                cnt += 1
+                continue
 
-        hits = get_jsdelivr_hits(libname)
+            hits = get_jsdelivr_hits(libname)
         
-        if hits is not None:
-            db.update(TABLE, 
-                      data={'# hits': hits}, 
-                      condition="`libname`=%s", 
-                      condition_values=(libname,))
-            logger.info(f"{cnt}: Updated {libname}: {hits} hits")
-        else:
-            logger.warning(f"{cnt}: Package not found on jsDelivr: {libname}")
+            if hits is not None:
+                db.update(TABLE, 
+                          data={'# hits': hits}, 
+                          condition="`libname`=%s", 
+                          condition_values=(libname,))
+                logger.info(f"{cnt}: Queued {libname}: {hits} hits")
+                queued += 1
+            else:
+                logger.warning(f"{cnt}: Package not found on jsDelivr: {libname}")
         
-        # Be polite with rate limiting
-        time.sleep(CRAWL_INTERVAL)
+            if queued >= FLUSH_EVERY:
+                written = db.flush()
+                logger.info(f"Flushed {written} updates. Next CRAWL_START: {cnt + 1}")
+                queued = 0
+
+            # Be polite with rate limiting
+            time.sleep(CRAWL_INTERVAL)
+
+            cnt += 1
 
-        cnt += 1
+            logger.leftTimeEstimator(len(normalized_urls) - cnt)
 
-        logger.leftTimeEstimator(len(normalized_urls) - cnt)
+        written = db.flush()
+    logger.info(f"Flushed {written} updates. All libraries are updated.")
 
 if __name__ == "__main__":
     
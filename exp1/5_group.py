@@ -25,13 +25,11 @@ def process_libraries():
     db.add_column(TABLE, "group", "varchar(100)", after_column='libname')
     libraries = db.select_all(TABLE, ['libname', 'category', 'description'])
     
+    groups = {}
     for lib in libraries:
         libname, category = lib['libname'], lib['category']
-        group = getGroup(category)
-        db.update(TABLE, 
-                  data={'group': group}, 
-                  condition='libname=%s', 
-                  condition_values=(libname,)) 
+        groups[libname] = {'group': getGroup(category)}
+    db.update_many(TABLE, 'libname', groups)
         
 
 if __name__ == "__main__":
@@ -39,6 +39,7 @@ def process_libraries():
 
     libraries = db.select_all(TABLE, ['created', 'updated', 'libname', 'first tag date', 'last tag date', '# versions', "# tag"])
     
+    stats = {}
     for lib in libraries:
         libname, created, updated, first_tag_date, last_tag_date, v_num, tag_num = lib['libname'], lib['created'], lib['updated'], lib['first tag date'], lib['last tag date'], lib['# versions'], lib['# tag']
         
@@ -65,13 +66,12 @@ def process_libraries():
         # span_per_tag = span_days
         
 
-        db.update(TABLE, 
-                  data={'span': span_days, 
-                        "abandoned": abaondoned, 
-                        "span per tag": span_per_tag,
-                        "span per version": span_per_version}, 
-                  condition='libname=%s', 
-                  condition_values=(libname,)) 
+        stats[libname] = {'span': span_days, 
+                          "abandoned": abaondoned, 
+                          "span per tag": span_per_tag,
+                          "span per version": span_per_version}
+    
+    db.update_many(TABLE, 'libname', stats)
         
 
 if __name__ == "__main__":
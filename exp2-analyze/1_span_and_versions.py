@@ -10,6 +10,7 @@ from utils.sqlHelper import ConnDatabase
 from utils.logger import getLogger
 from utils.api_reader import commonReader
 from datetime import date
+import numpy as np
 
 current_time = date.today()
 logger = getLogger()
@@ -41,63 +42,56 @@ if __name__ == '__main__':
 
     npm_libnames = db_npm.show_tables()
     gh_libnames = db_gh.show_tables()
+
+    # Read the version tables of many libraries per query, as typed arrays
+    version_fields = ['version', 'year hits', 'tag date', 'estimate date']
+    dtypes = {'year hits': 'int64', 'tag date': 'datetime64[D]', 'estimate date': 'datetime64[D]'}
+    npm_versions = db_npm.read_many_tables([entry['npm'] for entry in libs if entry['npm']], version_fields,
+                                           return_as='arrays', dtypes=dtypes)
+    gh_versions = db_gh.read_many_tables([entry['libname'] for entry in libs if not entry['npm']], version_fields,
+                                         return_as='arrays', dtypes=dtypes)
+    today = np.datetime64(current_time, 'D')
         
     for i, entry in enumerate(libs):
         # Iterate through libraries
         libname, npm_name = entry['libname'], entry['npm']
         if npm_name:
             # npm library
-            if npm_name not in db_npm.show_tables():
+            if npm_name not in npm_versions:
                 logger.warning(f"Failed to retrieve the version information of {libname} ({npm_name}) from database 'version_npm'.")
                 continue
-            res = db_npm.select_all(npm_name, ['version', 'year hits', 'tag date', 'estimate date'], return_as='tuple')
+            res = npm_versions[npm_name]
         
         else:
-            if libname not in db_gh.show_tables():
+            if libname not in gh_versions:
                 logger.warning(f"Failed to retrieve the version information of {libname} from database 'version_gh'.")
                 continue
-            res = db_gh.select_all(libname, ['version', 'year hits', 'tag date', 'estimate date'], return_as='tuple')
+            res = gh_versions[libname]
+        versions, hits = res['version'], res['year hits']
+        vdates = np.where(np.isnat(res['tag date']), res['estimate date'], res['tag date'])
+        missing = np.isnat(vdates)
+        if missing.any():
+            logger.error(f"{libname} {versions[missing][0]} does not have date info.")
+            exit(0)
+
         first_version, first_version_date, latest_version, latest_version_date = None, None, None, None
-        total_hits = 0
+        total_hits = int(hits.sum())
         distance_to_latest = 0
         distance_to_current = 0
-        
-        for j, entry in enumerate(res):
-            version, hits, tag_date, e_date = entry[0], entry[1], entry[2], entry[3]
-            vdate = tag_date or e_date
-            if not vdate:
-                logger.error(f"{libname} {version} does not have date info.")
-                exit(0)
-            if j == 0:
-                latest_version = version
-                latest_version_date = vdate
-                first_version = version
-                first_version_date = vdate
-
-            if latest_version_date < vdate:
-                latest_version = version
-                latest_version_date = vdate
-
-            if first_version_date > vdate:
-                first_version = version
-                first_version_date = vdate
-
-        for j, entry in enumerate(res):
-            version, hits, tag_date, e_date = entry[0], entry[1], entry[2], entry[3]
-            vdate = tag_date or e_date
-
-            total_hits += hits
-            distance_to_current += (current_time - vdate).days * hits
-            distance_to_latest += (latest_version_date - vdate).days * hits
-            
         span = 0
-        if first_version_date and latest_version_date:
+        if len(versions) > 0:
+            # First occurrence of the earliest and of the latest date
+            first, latest = vdates.argmin(), vdates.argmax()
+            first_version, first_version_date = versions[first], vdates[first].item()
+            latest_version, latest_version_date = versions[latest], vdates[latest].item()
+            distance_to_current = int(((today - vdates).astype('int64') * hits).sum())
+            distance_to_latest = int(((vdates[latest] - vdates).astype('int64') * hits).sum())
             span = (latest_version_date - first_version_date).days
 
         db.upsert(DATA_TABLE, data={
             'libname': libname,
             'npm': npm_name,
-            '# versions': len(res),
+            '# versions': len(versions),
             'first version': first_version,
             'first version date': first_version_date,
             'latest version': latest_version,
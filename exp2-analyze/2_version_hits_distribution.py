@@ -14,6 +14,7 @@ from utils.sqlHelper import ConnDatabase
 from utils.logger import getLogger
 from utils.api_reader import commonReader
 from datetime import date
+import numpy as np
 
 current_time = date.today()
 logger = getLogger()
@@ -48,42 +49,45 @@ if __name__ == '__main__':
 
     npm_libnames = db_npm.show_tables()
     gh_libnames = db_gh.show_tables()
+
+    # Read the hits of many libraries per query, as typed arrays
+    dtypes = {'year hits': 'int64'}
+    npm_hits = db_npm.read_many_tables([entry['npm'] for entry in libs if entry['npm']], ['year hits'],
+                                       order_by='year hits', descending=True, return_as='arrays', dtypes=dtypes)
+    gh_hits = db_gh.read_many_tables([entry['libname'] for entry in libs if not entry['npm']], ['year hits'],
+                                     order_by='year hits', descending=True, return_as='arrays', dtypes=dtypes)
         
     for i, entry in enumerate(libs):
         # Iterate through libraries
         libname, npm_name = entry['libname'], entry['npm']
         if npm_name:
             # npm library
-            if npm_name not in db_npm.show_tables():
+            if npm_name not in npm_hits:
                 logger.warning(f"Failed to retrieve the version information of {libname} ({npm_name}) from database 'version_npm'.")
                 continue
-            res = db_npm.select_all(npm_name, ['year hits'], return_as='tuple', order_by='year hits', descending=True)
-            total_hits = db_npm.fetchone(f'SELECT SUM(`year hits`) FROM `{npm_name}`')[0]
+            hits = npm_hits[npm_name]['year hits']
         
         else:
-            if libname not in db_gh.show_tables():
+            if libname not in gh_hits:
                 logger.warning(f"Failed to retrieve the version information of {libname} from database 'version_gh'.")
                 continue
-            res = db_gh.select_all(libname, ['year hits'], return_as='tuple', order_by='year hits', descending=True)
-            total_hits = db_gh.fetchone(f'SELECT SUM(`year hits`) FROM `{libname}`')[0]
+            hits = gh_hits[libname]['year hits']
 
+        total_hits = int(hits.sum())
         if total_hits == 0:
             logger.warning(f"Total hits of {libname} is 0.")
             continue
 
-        # Calculate how many versions are needed to reach the hits thresholds
-        cumulative_hits = 0
-        distribution = [0] * len(THRESHOLDS)
-        for j, entry in enumerate(res):
-            cumulative_hits += entry[0]
-            for k, threshold in enumerate(THRESHOLDS):
-                if distribution[k] == 0 and cumulative_hits / total_hits >= threshold:
-                    distribution[k] = j + 1
+        # Calculate how many versions are needed to reach the hits thresholds:
+        # the first position where the cumulative share of hits reaches each threshold
+        cumulative_share = np.cumsum(hits) / total_hits
+        positions = np.searchsorted(cumulative_share, THRESHOLDS, side='left')
+        distribution = [int(p) + 1 if p < len(hits) else 0 for p in positions]
 
         db.upsert(DATA_TABLE, data={
             'libname': libname,
             'npm': npm_name,
-            '# versions': len(res),
+            '# versions': len(hits),
             'year hits': total_hits,
             '.50': distribution[0],
             '.60': distribution[1],
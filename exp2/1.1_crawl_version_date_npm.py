@@ -49,14 +49,15 @@ if __name__ == '__main__':
         # Update to the table
         res = db2.select_all(npm_name, ["version"], condition="`npm date` IS NULL")
         matched_num = 0
-        for entry2 in res:
-            version_tag = entry2['version']
-            if version_tag in version_time_dict:
-                date = version_time_dict[version_tag]
-                db2.update(npm_name, data={'npm date': date[:10]}, condition="`version`=%s", condition_values=(version_tag,))
-                matched_num += 1
-            else:
-                logger.warning(f'{version_tag} does not have a matched one in npm.')
+        with db2.batch(commit_every=500):
+            for entry2 in res:
+                version_tag = entry2['version']
+                if version_tag in version_time_dict:
+                    date = version_time_dict[version_tag]
+                    db2.update(npm_name, data={'npm date': date[:10]}, condition="`version`=%s", condition_values=(version_tag,))
+                    matched_num += 1
+                else:
+                    logger.warning(f'{version_tag} does not have a matched one in npm.')
         
         logger.info(f"{npm_name} is updated. {matched_num}/{len(res)} versions are matched.")
         logger.leftTimeEstimator(len(libs) - i)
\ No newline at end of file
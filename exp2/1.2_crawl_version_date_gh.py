@@ -56,7 +56,7 @@ def crawl_tag_date():
     for i, entry in enumerate(libs):
         libname, npm_name = entry['libname'], entry['npm']
 
-        if npm_name not in db2.show_tables():
+        if not db2.has_table(npm_name):
             logger.warning(f"{npm_name} has no records in the database 'version_npm'.")
             continue
 
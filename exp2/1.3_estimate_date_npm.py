@@ -104,10 +104,10 @@ if __name__ == '__main__':
     libs = db.select_all(LIB_TABLE, ['npm', 'github'], condition='`npm` IS NOT NULL')
     for i, libentry in enumerate(libs):
         npm_name, github_direct = libentry['npm'], libentry['github'][11:]
-        if npm_name not in db2.show_tables():
+        if not db2.has_table(npm_name):
             logger.warning(f"Failed to retrieve the version information of {npm_name} from database 'version_npm'.")
             continue
-        if 'tag date' not in db2.show_columns(npm_name):
+        if not db2.has_column(npm_name, 'tag date'):
             logger.warning(f"Table {npm_name} does not have the column `tag date`.")
             continue
         if db2.entry_count(npm_name, condition="`tag date` IS NULL AND `estimate date` IS NULL") == 0:
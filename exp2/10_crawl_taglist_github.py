@@ -1,10 +1,6 @@
 # Crawl GitHub tags of each library
 
 import os
-from datetime import datetime
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlparse
 from dotenv import load_dotenv
 load_dotenv()
 import json
@@ -14,7 +10,9 @@ parent_dir = Path(__file__).resolve().parent.parent
 sys.path.append(str(parent_dir))
 from utils.sqlHelper import ConnDatabase
 from utils.logger import getLogger
+from utils.api_reader import GitHubAPIReader
 logger = getLogger()
+reader = GitHubAPIReader(logger=logger, cache=True, revalidate=True)
 db = ConnDatabase('Libraries')
 
 LIB_TABLE = 'libs_cdnjs_all_4_20u'
@@ -23,43 +21,12 @@ TAG_TABLE = 'tags_5_11'
 START_LIB = 'FastActive'
 
 def readurl(url:str) -> object:
-    # Github API rate limit: 5000/hr
-    # Token generation: https://github.com/settings/tokens
-    GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
-
-    req = Request(url)
-    req.add_header('Authorization', f'token {GITHUB_TOKEN}')
-    res = None
-    try:
-        response = urlopen(req)
-        # Get rate limit info from headers
-        rate_limit_remaining = response.getheader('X-RateLimit-Remaining')
-        rate_limit = response.getheader('X-RateLimit-Limit')
-        
-
-        logger.info(f"Requests remaining: {rate_limit_remaining}/{rate_limit}")
-
-        if int(rate_limit_remaining) <= 0:
-            logger.warning('1')
-            reset_timestamp = response.getheader('X-RateLimit-Reset')  # UTC epoch seconds
-            logger.warning('2')
-            # Convert to datetime object
-            reset_time = datetime.fromtimestamp(reset_timestamp)
-            logger.warning('3')
-
-            # Format as readable string
-            formatted_time = reset_time.strftime('%Y-%m-%d %H:%M:%S %Z')
-            logger.warning('4')
-            logger.warning(f"API rate limit exceeded. Limit resets at: {formatted_time}")
-            logger.warning('5')
-            exit(0)
-            logger.warning('6')
-
-        res = json.loads(response.read())
-    except KeyboardInterrupt:
-        pass
-    except:
-        logger.warning(f"{url} is an invalid url. Or github token is outdated.")
+    # Github API rate limit: 5000/hr; the reader waits for the reset when it is exceeded.
+    # Unchanged tag pages are revalidated with conditional requests, which don't count against it.
+    res, should_stop = reader.read_url(url)
+    if should_stop:
+        logger.warning(f"Stop crawling at {url}. Github token is outdated or the API is unreachable.")
+        exit(0)
     return res
 
 if __name__ == '__main__':
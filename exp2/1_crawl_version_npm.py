@@ -1,4 +1,6 @@
 # Crawl the hits of the past year of all versions of all libraries through jsDelivr
+# The per-library tables get a unique key on `version` (added by upsert_many); a table
+# that already holds duplicated versions is written row by row instead.
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -6,15 +8,17 @@ import sys
 from pathlib import Path
 parent_dir = Path(__file__).resolve().parent.parent
 sys.path.append(str(parent_dir))
-from utils.sqlHelper import ConnDatabase
+import MySQLdb
+from utils.sqlHelper import ConnDatabase, is_duplicate_entry
 from utils.logger import getLogger
 from utils.api_reader import commonReader
 logger = getLogger()
 db = ConnDatabase('Libraries')
 db2 = ConnDatabase('version_npm')
-reader = commonReader(logger=logger)
 
 LIB_TABLE = 'libs_cdnjs_all_4_20u'
+CONCURRENCY = 16    # parallel jsDelivr requests
+reader = commonReader(logger=logger, per_host=CONCURRENCY)
 
 
 if __name__ == '__main__':
@@ -49,19 +53,32 @@ if __name__ == '__main__':
                 `year hits` bigint  DEFAULT NULL
             ''')
         
+        # One request per version, CONCURRENCY at a time
+        stats = reader.read_many(
+            [{'libname': libname, 'source': "npm", 'version_tag': version_tag, 'period': "year"} for version_tag in version_list],
+            concurrency=CONCURRENCY
+        )
         rank = 1
-        for version_tag in version_list:
+        rows = []
+        for version_tag, data in zip(version_list, stats):
             hits = 0
-            data = reader.read_jsDelivr(libname, "npm", version_tag, "year")
             if data:
                 hits = data['hits']['total']
-            db2.upsert(libname, data={
+            rows.append({
                 'version': version_tag,
                 'jsDelivr rank': rank,
                 'year hits': hits
-            }, condition_fields="version")
+            })
 
             rank += 1
+        try:
+            db2.upsert_many(libname, rows, key_fields="version")
+        except MySQLdb.Error as e:
+            if not is_duplicate_entry(e):
+                raise
+            logger.warning(f"{libname} has duplicated versions, so it cannot get a unique key. Upsert row by row.")
+            for row in rows:
+                db2.upsert(libname, row, condition_fields="version")
         
         logger.info(f"Complete {libname}. In total {len(version_list)} versions.")
         logger.leftTimeEstimator(len(libs) - i)
@@ -56,7 +56,7 @@ def crawl_tag_date():
     for i, entry in enumerate(libs):
         libname = entry['libname']
 
-        if libname not in db2.show_tables():
+        if not db2.has_table(libname):
             logger.warning(f"{libname} has no records in the database 'version_gh'.")
             continue
 
@@ -104,10 +104,10 @@ if __name__ == '__main__':
     libs = db.select_all(LIB_TABLE, ['libname', 'github'], condition='`npm` IS NULL')
     for i, libentry in enumerate(libs):
         libname, github_direct = libentry['libname'], libentry['github'][11:]
-        if libname not in db2.show_tables():
+        if not db2.has_table(libname):
             logger.warning(f"Failed to retrieve the version information of {libname} from database 'version_gh'.")
             continue
-        if 'tag date' not in db2.show_columns(libname):
+        if not db2.has_column(libname, 'tag date'):
             logger.warning(f"Table {libname} does not have the column `tag date`.")
             continue
         if db2.entry_count(libname, condition="`tag date` IS NULL AND `estimate date` IS NULL") == 0:
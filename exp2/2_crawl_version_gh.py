@@ -12,9 +12,10 @@ from utils.api_reader import commonReader
 logger = getLogger()
 db = ConnDatabase('Libraries')
 db_gh = ConnDatabase('version_gh')
-reader = commonReader(logger=logger, debug=True)
 
 LIB_TABLE = 'libs_cdnjs_all_4_20u'
+CONCURRENCY = 16    # parallel jsDelivr requests
+reader = commonReader(logger=logger, debug=True, per_host=CONCURRENCY)
 
 
 if __name__ == '__main__':
@@ -52,10 +53,14 @@ if __name__ == '__main__':
                 `year hits` bigint  DEFAULT NULL
             ''')
         
+        # One request per version, CONCURRENCY at a time
+        stats = reader.read_many(
+            [{'libname': github_direct, 'source': "gh", 'version_tag': version_tag, 'period': "year"} for version_tag in version_list],
+            concurrency=CONCURRENCY
+        )
         rank = 1
-        for version_tag in version_list:
+        for version_tag, data in zip(version_list, stats):
             hits = 0
-            data = reader.read_jsDelivr(github_direct, "gh", version_tag, "year")
             if data:
                 hits = data['hits']['total']
             db_gh.upsert(libname, data={
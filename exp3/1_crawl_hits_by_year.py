@@ -19,6 +19,7 @@ LIB_TABLE = 'libs_cdnjs_all_4_20u'
 CRAWL_START = 1
 CRAWL_INTERVAL = 0.1    # sleep seconds between iterations
 START_FLAG = "Update table HITS_2024Q3 entry jqvmap"
+UPSERT_BATCH = 50       # rows written per upsert statement; restart from the last "Flushed" flag
 
 START_YEAR = 2025
 END_YEAR = 2025
@@ -100,6 +101,7 @@ if __name__ == "__main__":
                                     `# hits (gh)` bigint DEFAULT NULL,
                                     `# hits` bigint DEFAULT NULL
                                     ''')
+            rows = []
             for i, entry in enumerate(res):
                 libname = entry['libname']
 
@@ -112,15 +114,18 @@ if __name__ == "__main__":
                 h1 = get_jsdelivr_hits(libname, 'npm', period=f'{year}-Q{quater}')
                 h2 = get_jsdelivr_hits(libname, 'gh', period=f'{year}-Q{quater}')
                 h = h1 + h2
-                db.upsert(table_name=hits_table_name,
-                          data={
-                              "libname": libname,
-                              "# hits (npm)": h1,
-                              "# hits (gh)": h2,
-                              "# hits": h
-                          },
-                          condition_fields="libname")
+                rows.append({
+                    "libname": libname,
+                    "# hits (npm)": h1,
+                    "# hits (gh)": h2,
+                    "# hits": h
+                })
                 logger.info(f"{flag} (hits: {h}).")
+                if len(rows) >= UPSERT_BATCH:
+                    db.upsert_many(hits_table_name, rows, key_fields="libname")
+                    logger.info(f"Flushed {len(rows)} entries. Next START_FLAG: \"{flag}\"")
+                    rows = []
                 logger.leftTimeEstimator((END_YEAR - year) * 4 * len(res) + (4 - quater) * len(res) + (len(res) - i))
+            db.upsert_many(hits_table_name, rows, key_fields="libname")
 
     db.close()
\ No newline at end of file
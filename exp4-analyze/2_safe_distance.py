@@ -28,24 +28,31 @@ if __name__ == "__main__":
     safe_distance_sum = 0
     cross_major_hits_sum = 0
 
+    npm_names = {}
+    for entry in vul_libnames:
+        libname = entry[0]
+        res = db.fetchone(f"SELECT `npm` FROM {LIB_TABLE} WHERE `libname`=%s", (libname,))
+        npm_names[libname] = res[0]
+    # Read the npm tables of many libraries per query
+    npm_versions = db_npm.read_many_tables([name for name in npm_names.values() if name], ['version', 'vuls', 'year hits'])
+
     for i, entry in enumerate(vul_libnames):
         # Iterate through libraries
         libname = entry[0]
-        res = db.fetchone(f"SELECT `npm` FROM {LIB_TABLE} WHERE `libname`='{libname}'")
-        npm_name = res[0]
+        npm_name = npm_names[libname]
         if not npm_name:
             logger.warning(f"Library {libname} does not have an npm name.")
             continue
 
         # Check if the library exists in the npm database
-        if npm_name not in db_npm.show_tables():
+        if npm_name not in npm_versions:
             logger.warning(f"Library {libname} does not exist in the npm database.")
             continue
 
         # logger.info(f"({i}/{len(vul_libnames)}) Start {libname} ({npm_name}).")
 
-        # Select all rows from the npm table
-        version_rows = db_npm.select_all(npm_name, ['version', 'vuls', 'year hits'])
+        # All rows of the npm table
+        version_rows = npm_versions[npm_name]
         # Get the latest version
         
         cloest_safe_version = None
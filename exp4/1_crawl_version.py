@@ -58,7 +58,7 @@ def readurl(url:str) -> object:
 
 def crawlByRelease(libname, github_direct=None):
     table_name = github_direct[:50] # Table name cannot be too long
-    if table_name in conn2.show_tables():
+    if conn2.has_table(table_name):
         logger.info(f'The table {table_name} already exists in the release database.')
         return conn2.entry_count(table_name)
     
@@ -80,16 +80,17 @@ def crawlByRelease(libname, github_direct=None):
         release_info_list = readurl(release_url)
 
         if release_info_list and isinstance(release_info_list, list) and len(release_info_list) > 0:
+            rows = []
             for release_info in release_info_list:
                 if release_info:
-                    conn2.insert(table_name,
-                                 data={
-                                     'tag_name': release_info['tag_name'],
-                                     'name': release_info['name'],
-                                     'publish_date': release_info['published_at'][:10],
-                                     'url': release_info['url']
-                                 })
-                    release_no += 1
+                    rows.append({
+                        'tag_name': release_info['tag_name'],
+                        'name': release_info['name'],
+                        'publish_date': release_info['published_at'][:10],
+                        'url': release_info['url']
+                    })
+            # Write the whole page in one statement
+            release_no += conn2.insert_many(table_name, rows)
         else:
             break
 
@@ -102,7 +103,7 @@ def crawlByRelease(libname, github_direct=None):
 
 def crawlByTag(libname, github_direct=None):
     table_name = github_direct[:50] # Table name cannot be too long
-    if table_name in conn3.show_tables():
+    if conn3.has_table(table_name):
         logger.info(f'The table {table_name} already exists in the tag database.')
         return conn3.entry_count(table_name)
     
@@ -125,6 +126,7 @@ def crawlByTag(libname, github_direct=None):
         tag_info_list = readurl(tag_url)
 
         if tag_info_list and isinstance(tag_info_list, list) and len(tag_info_list) > 0:
+            rows = []
             for tag_info in tag_info_list:
                 commit_url = None
                 try:
@@ -141,14 +143,14 @@ def crawlByTag(libname, github_direct=None):
                     except:
                         logger.warning('Github API miss element 2.')
                         continue
-                    conn3.insert(table_name, 
-                                 data={
-                                    'tag_name': tag_info['name'],
-                                    'name': '',
-                                    'publish_date': date[:10],
-                                    'url': commit_url
+                    rows.append({
+                        'tag_name': tag_info['name'],
+                        'name': '',
+                        'publish_date': date[:10],
+                        'url': commit_url
                     })
-                    tag_no += 1
+            # Write the whole page in one statement
+            tag_no += conn3.insert_many(table_name, rows)
                 
         else:
             break
@@ -187,6 +187,7 @@ if __name__ == '__main__':
     db.add_column(VUL_TABLE, 'vgroup', 'varchar(100) DEFAULT NULL', after_column='vulnerability')   # vulnerability group
 
     res = db.select_all(VUL_TABLE, ['vulnerability', 'synk'])
+    groups = {}
     for entry in res:
         vul, synk = entry['vulnerability'], entry['synk']
         
@@ -194,5 +195,6 @@ if __name__ == '__main__':
         if vul in GROUP_MAPPING:
             group = GROUP_MAPPING[vul]
             
-        db.update(VUL_TABLE, {'vgroup': group}, "`synk`=%s", (synk,))
+        groups[synk] = {'vgroup': group}
+    db.update_many(VUL_TABLE, 'synk', groups)
     db.close()
\ No newline at end of file
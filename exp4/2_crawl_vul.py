@@ -32,7 +32,7 @@ CRAWL_INTERVAL = 0.5
 
 def crawlFromSynk(libname):
     url = f"https://snyk.io/vuln/npm:{libname}"
-    vul_num = 0
+    vul_rows = []
 
     # Fetch the page content
     response = requests.get(url)
@@ -81,19 +81,16 @@ def crawlFromSynk(libname):
                     if abbr:
                         severity = abbr.get('title', '').strip()
 
-                    db.upsert(table_name=VUL_TABLE, 
-                              data={'libname': libname,
-                                    'vulnerability': vulnerability_type,
-                                    'severity': severity,
-                                    'synk': href,
-                                    'version1': versions[0],
-                                    'version2': versions[1],
-                                    'version3': versions[2],
-                                    'version4': versions[3],
-                                    'version5': versions[4],
-                                    'version6': versions[5]},
-                              condition_fields='synk')
-                    vul_num += 1
+                    vul_rows.append({'libname': libname,
+                                     'vulnerability': vulnerability_type,
+                                     'severity': severity,
+                                     'synk': href,
+                                     'version1': versions[0],
+                                     'version2': versions[1],
+                                     'version3': versions[2],
+                                     'version4': versions[3],
+                                     'version5': versions[4],
+                                     'version6': versions[5]})
 
                 else:
                     logger.warning("Target anchor not found in the tbody.")
@@ -102,7 +99,8 @@ def crawlFromSynk(libname):
     else:
         logger.warning("Target table not found on the page.")
 
-    return vul_num
+    db.upsert_many(VUL_TABLE, vul_rows, key_fields='synk')
+    return len(vul_rows)
 
 def crawlAll():
 
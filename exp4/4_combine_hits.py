@@ -28,13 +28,15 @@ if __name__ == '__main__':
 
     res = db.select_all(VUL_TABLE, ['synk', '# hits (npm)', '# hits (gh)'], return_as='tuple')
 
+    total_hits = {}
     for entry in res:
         hits = 0
         if entry[1]:
             hits += entry[1]
         if entry[2]:
             hits += entry[2]
-        db.update(VUL_TABLE, {'# hits': hits}, "`synk`=%s", (entry[0],))
+        total_hits[entry[0]] = {'# hits': hits}
+    db.update_many(VUL_TABLE, 'synk', total_hits)
     
 
     
@@ -3,8 +3,6 @@
 from packaging import version
 from packaging.specifiers import SpecifierSet
 import re
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
 from dotenv import load_dotenv
 load_dotenv()
@@ -15,7 +13,9 @@ parent_dir = Path(__file__).resolve().parent.parent
 sys.path.append(str(parent_dir))
 from utils.sqlHelper import ConnDatabase
 from utils.logger import getLogger
+from utils.api_reader import commonReader
 logger = getLogger()
+reader = commonReader(logger=logger, cache=True)
 db = ConnDatabase('Libraries')
 
 LIB_TABLE = 'libs_cdnjs_all_4_20u'
@@ -70,25 +70,11 @@ def get_jsdelivr_hits(libname:str, source:str, version_tag:str=None, period:str=
     if period:
         stats_url += f"?period={period}"
 
-    req = Request(
-        url=stats_url,
-        headers={'User-Agent': 'Mozilla/5.0'}
-    )
-    
-    try:
-        with urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            return data['hits']['total']
-    except HTTPError as e:
-        if e.code == 404:
-            logger.warning(f"HTTP Error for {libname}: {e.code}")
-            return 0  # Package not found
-    except URLError as e:
-        logger.warning(f"URL Error for {libname}: {e.reason}")
-    except Exception as e:
-        logger.warning(f"Error processing {libname}: {e}")
-    
-    return 0   
+    # Served from the response cache on re-runs
+    data = reader.read_url(stats_url)
+    if data:
+        return data['hits']['total']
+    return 0
 
 def extract_version_part(version_str):
     """
@@ -183,24 +169,9 @@ def getVersionDict(libname:str, source:str) -> dict:
         owner, repo = normalized_url.split('/')
         stats_url += f"gh/{owner}/{repo}"
 
-    req = Request(
-        url=stats_url,
-        headers={'User-Agent': 'Mozilla/5.0'}
-    )
-    
-    version_info_list = []
-    try:
-        with urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            version_info_list = data['versions']
-    except HTTPError as e:
-        if e.code == 404:
-            logger.warning(f"HTTP Error for {libname}: {stats_url}")
-            return {}  # Package not found
-    except URLError as e:
-        logger.warning(f"URL Error for {libname}: {stats_url}")
-    except Exception as e:
-        logger.warning(f"Error processing {libname}: {stats_url} ({e})")
+    # Served from the response cache on re-runs
+    data = reader.read_url(stats_url)
+    version_info_list = data['versions'] if data else []
     
     for version_info in version_info_list:
         # Check whether this version is vulnerable
@@ -103,7 +103,7 @@ if __name__ == "__main__":
             continue
 
         # Check if the library exists in the npm database
-        if npm_name not in db_npm.show_tables():
+        if not db_npm.has_table(npm_name):
             logger.warning(f"Library {libname} does not exist in the npm database.")
             continue
 
@@ -1,13 +1,74 @@
 import json
 from datetime import datetime
-from urllib.request import Request, urlopen
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 import time
 import os
 import logging
-from typing import Optional, Tuple, Dict, Any, List
+from typing import Optional, Tuple, Dict, Any, List, Iterable, Iterator, Union
+import urllib3
+from utils.httpCache import ResponseCache, resolve_cache
 
 default_logger = logging.getLogger(__name__)
 
+# Keep-alive connections shared by all readers and threads, one pool per host
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "16"))
+_DEFAULT_HEADERS = urllib3.util.make_headers(keep_alive=True, accept_encoding=True)
+# Retry failed connects, and reads of reused sockets closed by the server; follow redirects like urlopen
+_RETRIES = urllib3.Retry(total=None, connect=2, read=2, redirect=10, status=0, raise_on_redirect=True, raise_on_status=False)
+_http_pool: Optional[urllib3.PoolManager] = None
+_http_pool_lock = threading.Lock()
+
+
+def http_pool() -> urllib3.PoolManager:
+    """The pool manager of the keep-alive connections (thread-safe)."""
+    global _http_pool
+    with _http_pool_lock:
+        if _http_pool is None:
+            _http_pool = urllib3.PoolManager(num_pools=50, maxsize=HTTP_POOL_SIZE, retries=_RETRIES)
+        return _http_pool
+
+
+def http_get(url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> urllib3.BaseHTTPResponse:
+    """
+    GET a URL on a pooled keep-alive connection (gzip responses are decoded).
+
+    Args:
+        url: The URL to read
+        headers: Additional request headers
+        timeout: Optional connect and read timeout in seconds
+
+    Returns:
+        The response, with the body in response.data
+
+    Raises:
+        HTTPError: For 4xx and 5xx responses, as urlopen does
+        urllib3.exceptions.HTTPError: If the request fails
+    """
+    return http_request('GET', url, headers, timeout=timeout)
+
+
+def http_request(
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    body: Optional[bytes] = None,
+    timeout: Optional[float] = None
+) -> urllib3.BaseHTTPResponse:
+    """Send a request on a pooled keep-alive connection, see http_get."""
+    response = http_pool().request(
+        method, url,
+        body=body,
+        headers={**_DEFAULT_HEADERS, **(headers or {})},
+        timeout=urllib3.Timeout(connect=timeout, read=timeout) if timeout is not None else urllib3.Timeout.DEFAULT_TIMEOUT
+    )
+    if response.status >= 400:
+        raise HTTPError(url, response.status, response.reason, response.headers, None)
+    return response
+
+
 class GitHubAPIReader:
     """
     A library for reading GitHub API content with multiple token support and rate limit handling.
@@ -17,15 +78,26 @@ class GitHubAPIReader:
     - Automatic rate limit detection and recovery
     - Token usage statistics tracking
     - Consecutive failure tracking
+    - Optional on-disk response cache (see utils/httpCache.py)
     """
     
-    def __init__(self, tokens: Optional[List[str]] = None, logger: object = None, debug: bool = False):
+    def __init__(
+        self,
+        tokens: Optional[List[str]] = None,
+        logger: object = None,
+        debug: bool = False,
+        cache: Union[bool, ResponseCache, None] = None,
+        revalidate: bool = False
+    ):
         """
         Initialize the GitHub API reader with multiple tokens.
         
         Args:
             tokens: List of GitHub personal access tokens. If None, tries to get from GITHUB_TOKENS env var.
             logger: optional logger
+            cache: ResponseCache to consult, True for the shared one. Defaults to the HTTP_CACHE env var.
+            revalidate: Check fresh cached responses with a conditional request too, for recrawls
+                (304 Not Modified responses don't count against the rate limit)
         """
         self.consecutive_failures = 0
         self.tokens = tokens or os.getenv("GITHUB_TOKEN", "").split(",")
@@ -49,6 +121,9 @@ class GitHubAPIReader:
         }
         self.debug = debug
         self.current_token_index = 0 if self.tokens else -1
+        self.cache = resolve_cache(cache)
+        self.revalidate = revalidate
+        self.not_modified = 0  # Cached responses confirmed by a 304
     
     def _get_current_token(self) -> Optional[str]:
         """Get the currently active token."""
@@ -126,13 +201,29 @@ class GitHubAPIReader:
                 self.logger.warning(f"Token ...{token[-4:]} rate limited. Waiting {wait_seconds:.1f} seconds...")
                 time.sleep(wait_seconds + 1)  # Add 1 second buffer
     
+    def _wait_for_any_token(self) -> bool:
+        """Wait until the first token resets when all tokens are rate limited. False if no reset time is known."""
+        soonest_reset = min(
+            (status['reset_time'] for status in self.token_status.values() 
+             if status['reset_time']),
+            default=None
+        )
+        
+        if soonest_reset:
+            wait_time = (soonest_reset - datetime.now()).total_seconds()
+            self.logger.warning(f"All tokens rate limited. Waiting {wait_time:.1f} seconds...")
+            time.sleep(max(wait_time, 0) + 1)
+            return True
+        self.logger.error("All tokens exhausted with unknown reset times")
+        return False
+    
     def _update_token_status(self, token: str, response) -> None:
         """Update the status of a token after a successful request."""
         if not token or token not in self.token_status:
             return
             
-        self.token_status[token]['remaining'] = int(response.getheader('X-RateLimit-Remaining', 0))
-        reset_timestamp = response.getheader('X-RateLimit-Reset')
+        self.token_status[token]['remaining'] = int(response.headers.get('X-RateLimit-Remaining', 0))
+        reset_timestamp = response.headers.get('X-RateLimit-Reset')
         
         if reset_timestamp:
             self.token_status[token]['reset_time'] = datetime.fromtimestamp(int(reset_timestamp))
@@ -153,6 +244,9 @@ class GitHubAPIReader:
             url: The GitHub API URL to read
             max_retries: Maximum number of retries if rate limited
             
+        With a cache, fresh responses are served from it, and stale ones (or all,
+        with revalidate) are revalidated with If-None-Match / If-Modified-Since.
+
         Returns:
             Tuple of (response_data, should_stop)
             response_data: Parsed JSON response or None if failed
@@ -161,56 +255,69 @@ class GitHubAPIReader:
         stop_flag = False
         retry_count = 0
 
-        
+        cached = self.cache.get(url) if self.cache else None
+        if cached and (self.cache.offline or cached.fresh and not self.revalidate):
+            return (json.loads(cached.body) if cached.status == 200 else None), False
+        if self.cache and self.cache.offline:
+            self.logger.warning(f"Not in the cache (offline mode): {url}")
+            return None, False
         
         while retry_count <= max_retries:
             # Select the best available token (this may rotate the token)
             current_token = self._get_best_token() if self.tokens else None
             
             if not current_token and self.tokens:
-                # All tokens are rate limited - find the one that resets soonest
-                soonest_reset = min(
-                    (status['reset_time'] for status in self.token_status.values() 
-                     if status['reset_time']),
-                    default=None
-                )
-                
-                if soonest_reset:
-                    wait_time = (soonest_reset - datetime.now()).total_seconds()
-                    self.logger.warning(f"All tokens rate limited. Waiting {wait_time:.1f} seconds...")
-                    time.sleep(max(wait_time, 0) + 1)
+                if self._wait_for_any_token():
                     continue
-                else:
-                    self.logger.error("All tokens exhausted with unknown reset times")
-                    return None, True
+                return None, True
             
             # Wait if current token is rate limited
             self._wait_for_rate_limit_reset(current_token)
             
             # Prepare the request with the current token
-            req = Request(url)
+            headers = {}
             if current_token:
-                req.add_header('Authorization', f'token {current_token}')
+                headers['Authorization'] = f'token {current_token}'
                 if self.debug:
                     self.logger.debug(f"Using token ending with ...{current_token[-4:]}")
+            if cached and cached.status == 200:
+                # Conditional request: a 304 reuses the cached body
+                if cached.etag:
+                    headers['If-None-Match'] = cached.etag
+                if cached.last_modified:
+                    headers['If-Modified-Since'] = cached.last_modified
             
             try:
-                # Make the request
-                with urlopen(req) as response:
-                    if current_token:
-                        self._update_token_status(current_token, response)
-                    
-                    self.consecutive_failures = 0  # Reset on success
-                    
-                    # Parse and return the response
-                    response_data = json.loads(response.read())
-                    return response_data, False
+                # Make the request on a kept-alive connection
+                response = http_get(url, headers)
+                if current_token:
+                    self._update_token_status(current_token, response)
+                
+                self.consecutive_failures = 0  # Reset on success
+
+                if response.status == 304:
+                    self.cache.touch(url)
+                    self.not_modified += 1
+                    return json.loads(cached.body), False
+                
+                # Parse and return the response
+                response_data = json.loads(response.data)
+                if self.cache:
+                    self.cache.put(url, response.status, response.data,
+                                   response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                return response_data, False
                     
             except KeyboardInterrupt:
                 self.logger.info("Request interrupted by user")
                 return None, True
                 
             except Exception as e:
+                if isinstance(e, HTTPError) and e.code == 404:
+                    # Missing repository or commit: retrying won't help
+                    if self.cache:
+                        self.cache.put(url, 404, None)
+                    self.logger.warning(f"Not found: {url}")
+                    return None, False
                 self.consecutive_failures += 1
                 if current_token:
                     self._mark_token_failure(current_token)
@@ -242,15 +349,341 @@ class GitHubAPIReader:
             }
             for token, status in self.token_status.items()
         }
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Statistics of the response cache, with the number of 304 revalidations."""
+        if not self.cache:
+            return {}
+        return {**self.cache.info(), 'not_modified': self.not_modified}
+    
+
+# Fields of a tag ref: its name and the commit it points to (through the tag object of annotated tags)
+_TAG_FRAGMENT = """
+fragment tagInfo on Ref {
+  name
+  target {
+    __typename
+    ... on Commit { oid author { date } }
+    ... on Tag { target { ... on Commit { oid author { date } } } }
+  }
+}
+"""
+
+_REPO_FRAGMENT = """
+fragment repoInfo on Repository {
+  nameWithOwner
+  stargazerCount
+  createdAt
+  updatedAt
+  tags: refs(refPrefix: "refs/tags/") { totalCount }
+  lastTag: refs(refPrefix: "refs/tags/", first: 1, orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) { nodes { ...tagInfo } }
+  firstTag: refs(refPrefix: "refs/tags/", first: 1, orderBy: {field: TAG_COMMIT_DATE, direction: ASC}) { nodes { ...tagInfo } }
+}
+"""
+
+# Errors of a query that is too large or too slow; it may succeed with fewer repositories
+_QUERY_TOO_LARGE = {'MAX_NODE_LIMIT_EXCEEDED', 'RESOURCE_LIMITS_EXCEEDED', 'TIMEOUT'}
+
+
+def _split_repo(repo: str) -> Optional[Tuple[str, str]]:
+    parts = repo.strip('/').split('/')
+    if len(parts) != 2 or not all(parts):
+        return None
+    return parts[0], parts[1]
+
+
+def _tag_info(node: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """{'name', 'sha', 'date'} of a tag ref, date being the author date of its commit."""
+    if not node:
+        return None
+    target = node.get('target') or {}
+    if target.get('__typename') == 'Tag':
+        target = target.get('target') or {}
+    return {'name': node['name'], 'sha': target.get('oid'), 'date': (target.get('author') or {}).get('date')}
+
+
+class GitHubGraphQLReader(GitHubAPIReader):
+    """
+    Read repository metadata and tags of many repositories through the GitHub GraphQL API.
+
+    Repositories are queried together under aliases. The number of repositories
+    per query is bounded by batch_size and by max_nodes (the connection nodes a
+    query may request), and halved whenever GitHub rejects a query as too large or
+    times out. The remaining points of each token are taken from the rateLimit
+    field of the responses, with the token rotation of GitHubAPIReader.
+    """
+
+    endpoint = "https://api.github.com/graphql"
+    rate_limit_backoff = 60  # seconds to wait when a rate limit error has no reset time
+
+    def __init__(
+        self,
+        tokens: Optional[List[str]] = None,
+        logger: object = None,
+        debug: bool = False,
+        batch_size: int = 50,
+        max_nodes: int = 5000
+    ):
+        """
+        Args:
+            tokens: List of GitHub personal access tokens. If None, tries to get from GITHUB_TOKEN env var.
+            logger: optional logger
+            batch_size: maximum number of repositories per query
+            max_nodes: maximum number of connection nodes (e.g. tags) requested per query
+        """
+        super().__init__(tokens, logger, debug, cache=False)
+        self.batch_size = batch_size
+        self.max_nodes = max_nodes
+        self.query_count = 0
+        self.total_cost = 0  # Rate limit points spent
+        self._stopped = False
+
+    def query(self, query: str, variables: Optional[Dict[str, Any]] = None, max_retries: int = 3) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Run a GraphQL query with rate limit handling and token rotation.
+
+        Args:
+            query: The GraphQL query
+            variables: Values of the query variables
+            max_retries: Maximum number of retries of failed requests
+
+        Returns:
+            Tuple of (response, should_stop)
+            response: {'data': ..., 'errors': [...]} or None if failed
+            should_stop: True if we should stop making requests (permanent failure)
+        """
+        body = json.dumps({'query': query, 'variables': variables or {}}).encode('utf-8')
+        retry_count = 0
+        while retry_count <= max_retries:
+            current_token = self._get_best_token() if self.tokens else None
+            if not current_token and self.tokens:
+                if self._wait_for_any_token():
+                    continue
+                return None, True
+            self._wait_for_rate_limit_reset(current_token)
+
+            headers = {'Content-Type': 'application/json'}
+            if current_token:
+                headers['Authorization'] = f'bearer {current_token}'
+            try:
+                response = http_request('POST', self.endpoint, headers, body)
+                if current_token:
+                    self._update_token_status(current_token, response)
+                self.consecutive_failures = 0
+                result = json.loads(response.data)
+            except KeyboardInterrupt:
+                self.logger.info("Request interrupted by user")
+                return None, True
+            except Exception as e:
+                if isinstance(e, HTTPError) and e.code in (502, 504):
+                    # GitHub gave up on the query; a smaller one may pass
+                    self.logger.warning(f"GraphQL query timed out: {e}")
+                    return None, False
+                self.consecutive_failures += 1
+                if current_token:
+                    self._mark_token_failure(current_token)
+                    self._rotate_token()
+                self.logger.warning(f"GraphQL request failed ({retry_count + 1}/{max_retries}): {str(e)}")
+                if self.consecutive_failures >= 5:
+                    self.logger.error("Too many consecutive failures, stopping")
+                    return None, True
+                time.sleep(2 ** retry_count)
+                retry_count += 1
+                continue
+
+            self.query_count += 1
+            if any(error.get('type') == 'RATE_LIMITED' for error in result.get('errors') or []):
+                retry_count += 1
+                status = self.token_status.get(current_token) if current_token else None
+                if status and status['reset_time'] and status['reset_time'] > datetime.now():
+                    # The token selection of the next attempt waits for the reset (or rotates)
+                    status['remaining'] = 0
+                    self.logger.warning("GraphQL rate limit exceeded.")
+                else:
+                    self.logger.warning(f"GraphQL rate limit exceeded, reset time unknown. Waiting {self.rate_limit_backoff} seconds...")
+                    time.sleep(self.rate_limit_backoff)
+                continue
+            self._record_rate_limit(current_token, (result.get('data') or {}).get('rateLimit'))
+            return result, False
+
+        self.logger.error(f"GraphQL query failed after {max_retries} retries")
+        return None, False
+
+    def _record_rate_limit(self, token: Optional[str], rate_limit: Optional[Dict[str, Any]]) -> None:
+        """Track the points spent and left from the rateLimit field of a response."""
+        if not rate_limit:
+            return
+        self.total_cost += rate_limit['cost']
+        if token and token in self.token_status:
+            status = self.token_status[token]
+            # Too few points for another query of the same cost
+            status['remaining'] = rate_limit['remaining'] if rate_limit['remaining'] >= rate_limit['cost'] else 0
+            reset_at = datetime.fromisoformat(rate_limit['resetAt'].replace('Z', '+00:00'))
+            status['reset_time'] = reset_at.astimezone().replace(tzinfo=None)
+        if self.debug:
+            self.logger.debug(f"GraphQL query cost {rate_limit['cost']}, {rate_limit['remaining']} points left")
+
+    def _batches(self, items: List[Any], nodes_per_item: int, run) -> None:
+        """
+        Call run(chunk) on chunks of items until it has no follow-up items.
+
+        run returns the items to query again (e.g. the next tag page), or None if
+        the query was too large, in which case the chunk size is halved.
+        """
+        self._stopped = False
+        size = max(1, min(self.batch_size, self.max_nodes // max(nodes_per_item, 1)))
+        queue = list(items)
+        while queue and not self._stopped:
+            chunk = queue[:size]
+            follow_up = run(chunk)
+            if follow_up is None:
+                if size > 1:
+                    size = max(1, size // 2)
+                    self.logger.warning(f"GraphQL query too large; retrying with {size} repositories per query.")
+                    continue
+                self.logger.warning(f"Failed to read {chunk[0]} through GraphQL.")
+                follow_up = []
+            queue = queue[len(chunk):] + follow_up
+
+    def _run_query(self, query: str, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run a batch query; None if it should be retried in smaller batches."""
+        result, should_stop = self.query(query, variables)
+        if should_stop:
+            self._stopped = True
+            return {}
+        if result is None:
+            return None
+        errors = result.get('errors') or []
+        if any(error.get('type') in _QUERY_TOO_LARGE for error in errors):
+            return None
+        # Other errors (bad credentials, invalid arguments, ...) don't depend on the batch size
+        for error in errors:
+            if error.get('type') != 'NOT_FOUND':
+                self.logger.warning(f"GraphQL error: {error.get('message')}")
+        return result.get('data') or {}
+
+    def read_repos(self, repos: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Read the metadata of many repositories, a few dozens per query.
+
+        Args:
+            repos: Repositories as "owner/name"
+
+        Returns:
+            {repo: info or None if not found}, info being {'name_with_owner',
+            'stargazers_count', 'created_at', 'updated_at', 'tag_count',
+            'first_tag', 'last_tag'}; the tags (oldest and newest by commit date)
+            are {'name', 'sha', 'date'} or None
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {repo: None for repo in repos}
+
+        def run(chunk: List[str]) -> Optional[List[str]]:
+            variables, fields, declarations = {}, [], []
+            for i, repo in enumerate(chunk):
+                variables[f"o{i}"], variables[f"n{i}"] = _split_repo(repo)
+                declarations.append(f"$o{i}: String!, $n{i}: String!")
+                fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...repoInfo }}")
+            query = (
+                f"query({', '.join(declarations)}) {{\n  rateLimit {{ cost remaining resetAt }}\n  "
+                + "\n  ".join(fields) + "\n}" + _REPO_FRAGMENT + _TAG_FRAGMENT
+            )
+            data = self._run_query(query, variables)
+            if data is None:
+                return None
+            for i, repo in enumerate(chunk):
+                info = data.get(f"r{i}")
+                if info:
+                    results[repo] = {
+                        'name_with_owner': info['nameWithOwner'],
+                        'stargazers_count': info['stargazerCount'],
+                        'created_at': info['createdAt'],
+                        'updated_at': info['updatedAt'],
+                        'tag_count': info['tags']['totalCount'],
+                        'first_tag': _tag_info(next(iter(info['firstTag']['nodes']), None)),
+                        'last_tag': _tag_info(next(iter(info['lastTag']['nodes']), None)),
+                    }
+            return []
+
+        self._batches([repo for repo in results if _split_repo(repo)], 3, run)
+        return results
+
+    def read_tags(self, repos: Iterable[str], page_size: int = 100) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Read all tags of many repositories, newest commit first, paginating each repository.
+
+        Args:
+            repos: Repositories as "owner/name"
+            page_size: Tags per repository and query (at most 100)
+
+        Returns:
+            {repo: [{'name', 'sha', 'date'}, ...] or None if not found}
+        """
+        results: Dict[str, Optional[List[Dict[str, Any]]]] = {repo: None for repo in repos}
+        cursors: Dict[str, Optional[str]] = {}
+
+        def run(chunk: List[str]) -> Optional[List[str]]:
+            variables, fields, declarations = {'page': page_size}, [], ["$page: Int!"]
+            for i, repo in enumerate(chunk):
+                variables[f"o{i}"], variables[f"n{i}"] = _split_repo(repo)
+                variables[f"c{i}"] = cursors.get(repo)
+                declarations.append(f"$o{i}: String!, $n{i}: String!, $c{i}: String")
+                fields.append(
+                    f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ refs(refPrefix: \"refs/tags/\", first: $page, "
+                    f"after: $c{i}, orderBy: {{field: TAG_COMMIT_DATE, direction: DESC}}) "
+                    f"{{ pageInfo {{ hasNextPage endCursor }} nodes {{ ...tagInfo }} }} }}"
+                )
+            query = (
+                f"query({', '.join(declarations)}) {{\n  rateLimit {{ cost remaining resetAt }}\n  "
+                + "\n  ".join(fields) + "\n}" + _TAG_FRAGMENT
+            )
+            data = self._run_query(query, variables)
+            if data is None:
+                return None
+            next_pages = []
+            for i, repo in enumerate(chunk):
+                info = data.get(f"r{i}")
+                if not info:
+                    continue
+                if results[repo] is None:
+                    results[repo] = []
+                results[repo].extend(_tag_info(node) for node in info['refs']['nodes'])
+                if info['refs']['pageInfo']['hasNextPage']:
+                    cursors[repo] = info['refs']['pageInfo']['endCursor']
+                    next_pages.append(repo)
+            return next_pages
+
+        self._batches([repo for repo in results if _split_repo(repo)], page_size, run)
+        return results
+
+    def get_usage_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Token statistics (remaining GraphQL points), with the queries and points spent."""
+        return {**super().get_usage_stats(), 'total': {'queries': self.query_count, 'cost': self.total_cost}}
     
 
 class commonReader:
-    def __init__(self, logger: object = None, debug:bool = False):
+    def __init__(
+        self,
+        logger: object = None,
+        debug:bool = False,
+        per_host: int = 8,
+        cache: Union[bool, ResponseCache, None] = None
+    ):
+        """
+        Args:
+            logger: optional logger
+            debug: log every visited URL
+            per_host: maximum number of concurrent requests to one host in read_many / iter_many
+            cache: ResponseCache to consult, True for the shared one. Defaults to the HTTP_CACHE env var.
+        """
         if logger:
             self.logger = logger
         else:
             self.logger = default_logger
         self.debug = debug
+        self.per_host = per_host
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        self.cache = resolve_cache(cache)
 
 
     def read_jsDelivr(self, libname:str, source:str, version_tag:str=None, period:str=None, stats:bool = True):
@@ -268,6 +701,10 @@ class commonReader:
         Returns:
             response_data: Parsed JSON response or None if failed
         """
+        return self.read_url(self.jsDelivr_url(libname, source, version_tag, period, stats))
+
+    def jsDelivr_url(self, libname:str, source:str, version_tag:str=None, period:str=None, stats:bool = True) -> str:
+        """URL of a jsDelivr API request, with the arguments of read_jsDelivr."""
         if stats:
             base_url = f"https://data.jsdelivr.com/v1/stats/packages/{source}/{libname}"
         else:
@@ -279,7 +716,7 @@ class commonReader:
         if period:
             base_url += f"?period={period}"
 
-        return self.read_url(base_url)
+        return base_url
     
 
     def read_npm(self, libname:str):
@@ -302,20 +739,83 @@ class commonReader:
             response_data: Parsed JSON response or None if failed
             should_stop: True if we should stop making requests (permanent failure)
         """
+        if self.cache:
+            cached = self.cache.get(url)
+            if cached and cached.fresh:
+                if cached.status != 200:
+                    self.logger.warning(f"Error visiting {url}: HTTP Error {cached.status} (cached)")
+                    return None
+                return json.loads(cached.body.decode('utf-8'))
+            if self.cache.offline:
+                self.logger.warning(f"Not in the cache (offline mode): {url}")
+                return None
         if self.debug:
             self.logger.debug(f'Visit: {url}')
-        req = Request(
-            url=url,
-            headers={'User-Agent': 'Mozilla/5.0'}
-        )
         try:
-            with urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                return data
+            response = http_get(url, {'User-Agent': 'Mozilla/5.0'}, timeout=10)
+            data = json.loads(response.data.decode('utf-8'))
+            if self.cache:
+                self.cache.put(url, response.status, response.data)
+            return data
         except KeyboardInterrupt:
             self.logger.info("Request interrupted by user")
             return None
         except Exception as e:
+            if self.cache and isinstance(e, HTTPError) and e.code == 404:
+                self.cache.put(url, 404, None)
             self.logger.warning(f"Error visiting {url}: {e}")
         
-        return None
\ No newline at end of file
+        return None
+
+    def read_many(self, specs: Iterable[Union[str, Dict[str, Any]]], concurrency: int = 16) -> List[object]:
+        """
+        Read many URLs concurrently, see iter_many.
+
+        Returns:
+            List of parsed JSON responses (None for failed requests), in the order of specs
+        """
+        return [data for _, data in self.iter_many(specs, concurrency, ordered=True)]
+
+    def iter_many(
+        self,
+        specs: Iterable[Union[str, Dict[str, Any]]],
+        concurrency: int = 16,
+        ordered: bool = False
+    ) -> Iterator[Tuple[int, object]]:
+        """
+        Read many URLs on a thread pool, at most per_host requests to the same host at a time.
+
+        Args:
+            specs: URLs, or dicts of read_jsDelivr arguments, e.g.
+                {'libname': 'jquery', 'source': 'npm', 'version_tag': '3.7.1', 'period': 'year'}
+            concurrency: number of worker threads
+            ordered: yield in the order of specs instead of as the requests complete
+
+        Yields:
+            (index in specs, parsed JSON response or None if failed)
+        """
+        urls = [spec if isinstance(spec, str) else self.jsDelivr_url(**spec) for spec in specs]
+        if not urls:
+            return
+        executor = ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(urls))))
+        try:
+            futures = {executor.submit(self._read_limited, url): i for i, url in enumerate(urls)}
+            if ordered:
+                for future, i in futures.items():
+                    yield i, future.result()
+            else:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+        finally:
+            # Interrupted or abandoned: drop the requests that have not started
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _read_limited(self, url: str) -> object:
+        """read_url, waiting for a free slot of the host of the URL."""
+        host = urlsplit(url).netloc
+        with self._host_slots_lock:
+            slots = self._host_slots.get(host)
+            if slots is None:
+                slots = self._host_slots[host] = threading.Semaphore(self.per_host)
+        with slots:
+            return self.read_url(url)
@@ -0,0 +1,177 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, aclosing
+from functools import partial
+from typing import Optional, Any, List, Dict, Union, Tuple, AsyncIterator
+
+from utils.sqlHelper import ConnDatabase
+
+_END = object()  # Marks an exhausted generator
+
+
+class AsyncConnDatabase:
+    """ConnDatabase for asyncio code, with the same method names as coroutines.
+
+    The statements run on a dedicated single-thread executor that owns the
+    connection, in the order they were awaited, so the event loop keeps running
+    network fetches while the database works. The connection is opened on that
+    executor by the first statement (or by 'async with'), never on the event
+    loop. Bulk writes (insert_many, upsert_many, update_many) and batch() keep
+    the number of executor round trips low.
+
+    While iter_rows() streams, the other statements of other tasks wait until
+    the stream is exhausted or closed, since the unbuffered cursor holds the
+    connection; running one from the task consuming the stream raises
+    RuntimeError.
+
+    Args:
+        database_name (str): The name of the database to connect to.
+        **kwargs: The other arguments of ConnDatabase (profile, backend, ...).
+    """
+
+    def __init__(self, database_name: str, **kwargs) -> None:
+        self.database_name = database_name
+        self._kwargs = kwargs
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"db-{database_name}")
+        self._db: Optional[ConnDatabase] = None
+        self._stream_lock: Optional[asyncio.Lock] = None  # Held by iter_rows() while its cursor is open
+        self._stream_task: Optional[asyncio.Task] = None
+
+    def _database(self) -> ConnDatabase:
+        """The connection, opened on first use. Runs on the executor thread only."""
+        if self._db is None:
+            self._db = ConnDatabase(self.database_name, **self._kwargs)
+        return self._db
+
+    async def connect(self) -> "AsyncConnDatabase":
+        """Open the connection now rather than on the first statement."""
+        await self._run(self._database)
+        return self
+
+    def _lock(self) -> asyncio.Lock:
+        if self._stream_lock is None:
+            self._stream_lock = asyncio.Lock()
+        return self._stream_lock
+
+    async def _call(self, function, *args, **kwargs) -> Any:
+        """Run a blocking call on the executor of the connection."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+    async def _run(self, function, *args, **kwargs) -> Any:
+        """Run a blocking call on the executor once no iter_rows() stream holds the connection."""
+        if self._stream_task is not None and self._stream_task is asyncio.current_task():
+            raise RuntimeError(
+                "The connection is streaming iter_rows(); close the stream before running other statements, "
+                "or use a second AsyncConnDatabase."
+            )
+        async with self._lock():
+            return await self._call(function, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose the ConnDatabase methods as coroutines and its attributes as they are."""
+        if name.startswith('__') or name in ('_db', '_kwargs', '_executor', '_stream_lock', '_stream_task'):
+            raise AttributeError(name)
+        function = getattr(ConnDatabase if self._db is None else type(self._db), name, None)
+        if not callable(function):
+            if self._db is None:
+                raise AttributeError(f"'{name}' is not available before the connection is opened (await connect())")
+            return getattr(self._db, name)
+
+        async def method(*args, **kwargs):
+            return await self._run(lambda: getattr(self._database(), name)(*args, **kwargs))
+        method.__name__ = name
+        method.__doc__ = function.__doc__
+        return method
+
+    async def _iterate(self, generator, run) -> AsyncIterator[Any]:
+        """Advance a blocking generator on the executor with run (_run, or _call under the stream lock)."""
+        try:
+            while True:
+                item = await run(next, generator, _END)
+                if item is _END:
+                    return
+                yield item
+        finally:
+            await run(generator.close)
+
+    async def iter_rows(
+        self,
+        table_name: str,
+        fields: Union[List[str], str] = "*",
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        batch_size: int = 1000,
+        as_batches: bool = False,
+        return_as: str = "dict"
+    ) -> AsyncIterator[Union[Dict[str, Any], Tuple[Any, ...], List[Any]]]:
+        """Stream records like ConnDatabase.iter_rows, one executor round trip per batch.
+
+        The connection is reserved for the stream until it is exhausted or
+        closed (use contextlib.aclosing() when breaking out of the loop early).
+        """
+        batches = await self._run(lambda: self._database().iter_rows(
+            table_name, fields, condition, condition_values, order_by, descending,
+            batch_size=batch_size, as_batches=True, return_as=return_as))
+        async with self._lock():
+            self._stream_task = asyncio.current_task()
+            try:
+                # Close the cursor before releasing the lock, also when the stream is closed early
+                async with aclosing(self._iterate(batches, self._call)) as stream:
+                    async for batch in stream:
+                        if as_batches:
+                            yield batch
+                        else:
+                            for row in batch:
+                                yield row
+            finally:
+                self._stream_task = None
+
+    async def select_pages(self, *args, **kwargs) -> AsyncIterator[List[Union[Dict[str, Any], Tuple[Any, ...]]]]:
+        """Yield pages like ConnDatabase.select_pages."""
+        pages = await self._run(lambda: self._database().select_pages(*args, **kwargs))
+        async with aclosing(self._iterate(pages, self._run)) as stream:
+            async for page in stream:
+                yield page
+
+    @asynccontextmanager
+    async def batch(self, commit_every: int = 500, commit_interval: Optional[float] = None) -> AsyncIterator["AsyncConnDatabase"]:
+        """Group the statements of an 'async with' block into larger transactions (see ConnDatabase.batch)."""
+        context = await self._run(lambda: self._database().batch(commit_every, commit_interval))
+        await self._run(context.__enter__)
+        try:
+            yield self
+        except BaseException as e:
+            if not await self._run(context.__exit__, type(e), e, e.__traceback__):
+                raise
+        else:
+            await self._run(context.__exit__, None, None, None)
+
+    @asynccontextmanager
+    async def write_behind(self, max_rows: Optional[int] = 500, max_delay: Optional[float] = 5.0) -> AsyncIterator["AsyncConnDatabase"]:
+        """Queue the single-row writes of an 'async with' block (see ConnDatabase.write_behind)."""
+        context = await self._run(lambda: self._database().write_behind(max_rows, max_delay))
+        await self._run(context.__enter__)
+        try:
+            yield self
+        except BaseException as e:
+            if not await self._run(context.__exit__, type(e), e, e.__traceback__):
+                raise
+        else:
+            await self._run(context.__exit__, None, None, None)
+
+    async def close(self) -> None:
+        """Close the connection and stop the executor."""
+        # Queued after any pending statement, which may still open the connection. A stream
+        # left open by this task (e.g. by an exception in its loop) is closed with the connection.
+        run = self._call if self._stream_task is asyncio.current_task() else self._run
+        await run(lambda: self._db is not None and self._db.close())
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncConnDatabase":
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -0,0 +1,204 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional, Any, List, Dict, Tuple, NamedTuple, Union
+
+# Seconds a response stays fresh, by URL (first match wins); None never expires, 0 disables caching
+DEFAULT_TTLS: List[Tuple[str, Optional[float]]] = [
+    (r'https://api\.github\.com/repos/[^/]+/[^/]+/(git/)?commits/[0-9a-f]{40}\b', None),  # immutable
+    (r'https://data\.jsdelivr\.com/', 24 * 3600),
+    (r'https://registry\.npmjs\.org/', 24 * 3600),
+    (r'https://api\.cdnjs\.com/', 7 * 24 * 3600),
+    (r'https://api\.github\.com/', 24 * 3600),
+]
+DEFAULT_TTL = 24 * 3600
+
+# Statuses worth remembering: the data, and "does not exist"
+CACHED_STATUSES = (200, 404)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    body BLOB,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class CachedResponse(NamedTuple):
+    url: str
+    status: int
+    body: Optional[bytes]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    fresh: bool
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").lower() in ("1", "true", "yes")
+
+
+class ResponseCache:
+    """
+    Persistent cache of HTTP responses in an SQLite file, shared by scripts and runs.
+
+    Responses are stored under the SHA-256 of their URL (request headers such as
+    tokens are not part of the key), with a zlib-compressed body. A response is
+    fresh for the TTL of the first matching URL pattern. In offline mode, every
+    cached response is served regardless of its age and nothing is fetched.
+
+    Args:
+        path: SQLite file. Defaults to the HTTP_CACHE_PATH environment variable, or <repo>/cache/http.sqlite3.
+        ttls: [(URL regex, seconds)] checked before DEFAULT_TTLS
+        default_ttl: TTL of URLs matching no pattern
+        offline: Serve only from the cache. Defaults to the HTTP_CACHE_OFFLINE environment variable.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttls: Optional[List[Tuple[str, Optional[float]]]] = None,
+        default_ttl: Optional[float] = DEFAULT_TTL,
+        offline: Optional[bool] = None
+    ) -> None:
+        if path is None:
+            path = os.getenv("HTTP_CACHE_PATH") or str(Path(__file__).resolve().parent.parent / 'cache' / 'http.sqlite3')
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in (ttls or []) + DEFAULT_TTLS]
+        self.default_ttl = default_ttl
+        self.offline = _env_flag("HTTP_CACHE_OFFLINE") if offline is None else offline
+        self.hits = 0
+        self.misses = 0
+
+        # One connection shared by the reader threads; WAL lets several scripts use the file at once
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def ttl(self, url: str) -> Optional[float]:
+        """Seconds a response of the URL stays fresh (None: forever)."""
+        for pattern, ttl in self.ttls:
+            if pattern.match(url):
+                return ttl
+        return self.default_ttl
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Look up the cached response of a URL, fresh or not.
+
+        Returns:
+            The cached response, or None if the URL was never stored
+        """
+        ttl = self.ttl(url)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, body, etag, last_modified, fetched_at FROM responses WHERE key=?", (self.key(url),)
+            ).fetchone()
+            fresh = row is not None and (self.offline or ttl is None or time.time() - row[4] < ttl)
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if row is None:
+            return None
+        status, body, etag, last_modified, fetched_at = row
+        return CachedResponse(url, status, zlib.decompress(body) if body is not None else None,
+                              etag, last_modified, fetched_at, fresh)
+
+    def put(
+        self,
+        url: str,
+        status: int,
+        body: Optional[bytes],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store a response (ignored for uncached statuses and URLs with a TTL of 0)."""
+        if status not in CACHED_STATUSES or self.ttl(url) == 0:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, url, status, body, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.key(url), url, status, zlib.compress(body) if body is not None else None,
+                 etag, last_modified, time.time())
+            )
+
+    def touch(self, url: str) -> None:
+        """Mark the cached response of a URL as fetched now (e.g. after it was revalidated)."""
+        with self._lock:
+            self._connection.execute("UPDATE responses SET fetched_at=? WHERE key=?", (time.time(), self.key(url)))
+
+    def clear(self, pattern: Optional[str] = None) -> int:
+        """
+        Delete cached responses.
+
+        Args:
+            pattern: Optional URL regex; by default everything is deleted
+
+        Returns:
+            int: Number of deleted responses
+        """
+        with self._lock:
+            if pattern is None:
+                return self._connection.execute("DELETE FROM responses").rowcount
+            regex = re.compile(pattern)
+            keys = [(key,) for key, url in self._connection.execute("SELECT key, url FROM responses")
+                    if regex.search(url)]
+            self._connection.executemany("DELETE FROM responses WHERE key=?", keys)
+            return len(keys)
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM responses"
+            ).fetchone()
+        return {'entries': entries, 'bytes': size, 'hits': self.hits, 'misses': self.misses, 'offline': self.offline}
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    """The ResponseCache shared by the readers of this process."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+        return _shared_cache
+
+
+def resolve_cache(cache: Union[bool, ResponseCache, None]) -> Optional[ResponseCache]:
+    """
+    The cache a reader should use.
+
+    Args:
+        cache: A ResponseCache, True for the shared one, False for none, or None to
+            follow the HTTP_CACHE / HTTP_CACHE_OFFLINE environment variables
+    """
+    if isinstance(cache, ResponseCache):
+        return cache
+    if cache is None:
+        cache = _env_flag("HTTP_CACHE") or _env_flag("HTTP_CACHE_OFFLINE")
+    return get_cache() if cache else None
@@ -0,0 +1,196 @@
+import hashlib
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Any, List, Dict
+from urllib.parse import quote
+
+from utils.sqlHelper import ConnDatabase
+
+# Tables of each database included in a snapshot (full-match patterns)
+SNAPSHOT_TABLES = {
+    'Libraries': [r'libs_cdnjs_all_4_20u', r'vulnerabilities', r'HITS_.*', r'versions'],
+    'version_npm': [r'.*'],
+    'version_gh': [r'.*'],
+}
+MANIFEST = 'manifest.json'
+
+# Column types of the imported tables, by Arrow type
+_ARROW_TYPES = [
+    ('is_boolean', 'bool'),
+    ('is_integer', 'bigint'),
+    ('is_floating', 'double'),
+    ('is_decimal', 'double'),
+    ('is_date', 'date'),
+    ('is_timestamp', 'datetime'),
+]
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def export_snapshot(
+    snapshot_dir: str,
+    tables: Optional[Dict[str, List[str]]] = None,
+    compression: str = 'zstd',
+    logger: object = None
+) -> Dict[str, Any]:
+    """Dump database tables into Parquet files with a manifest (requires pyarrow).
+
+    Every table is written to {snapshot_dir}/{database}/{table}.parquet. The
+    manifest records the rows, columns, indexes and SHA-256 of every file.
+
+    Args:
+        snapshot_dir: Output folder
+        tables: {database: [table name pattern, ...]}, default SNAPSHOT_TABLES
+        compression: Parquet compression codec
+        logger: Optional logger for the progress
+
+    Returns:
+        Dict[str, Any]: The manifest
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    root = Path(snapshot_dir)
+    manifest = {'created': datetime.now().isoformat(timespec='seconds'), 'format': 'parquet', 'databases': {}}
+    for database_name, patterns in (tables or SNAPSHOT_TABLES).items():
+        entries = manifest['databases'][database_name] = {}
+        (root / database_name).mkdir(parents=True, exist_ok=True)
+        with ConnDatabase(database_name) as db:
+            names = [t for t in db.show_tables() if any(re.fullmatch(p, t) for p in patterns)]
+            columns = db.columns_of(names)
+            for i, table in enumerate(names):
+                rows = db.select_all(table, columns[table], return_as='tuple')
+                data = list(zip(*rows)) if rows else [()] * len(columns[table])
+                arrow_table = pa.table({c: pa.array(list(v)) for c, v in zip(columns[table], data)})
+                path = root / database_name / f"{quote(table, safe='')}.parquet"
+                pq.write_table(arrow_table, path, compression=compression)
+                entries[table] = {
+                    'file': str(path.relative_to(root)),
+                    'rows': len(rows),
+                    'columns': columns[table],
+                    'indexes': {name: [unique, cols] for name, (unique, cols) in db.show_indexes(table).items()},
+                    'sha256': _file_hash(path),
+                }
+                if logger:
+                    logger.leftTimeEstimator(len(names) - i)
+        if logger:
+            logger.info(f"Exported {len(entries)} tables of {database_name}.")
+
+    with open(root / MANIFEST, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_manifest(snapshot_dir: str) -> Dict[str, Any]:
+    with open(Path(snapshot_dir) / MANIFEST) as f:
+        return json.load(f)
+
+
+def _table_file(snapshot_dir: str, manifest: Dict[str, Any], database_name: str, table: str, verify: bool) -> Path:
+    try:
+        entry = manifest['databases'][database_name][table]
+    except KeyError:
+        raise KeyError(f"{database_name}.{table} is not in the snapshot {snapshot_dir}.") from None
+    path = Path(snapshot_dir) / entry['file']
+    if verify and _file_hash(path) != entry['sha256']:
+        raise ValueError(f"Hash mismatch of {path}; the snapshot is corrupted or was modified.")
+    return path
+
+
+def load_table(snapshot_dir: str, database_name: str, table: str, verify: bool = True):
+    """Read one table of a snapshot as a pandas DataFrame (requires pandas and pyarrow).
+
+    Args:
+        snapshot_dir: Snapshot folder
+        database_name: Database of the table
+        table: Table name
+        verify: Check the file hash against the manifest
+
+    Returns:
+        pandas.DataFrame: The table
+    """
+    import pyarrow.parquet as pq
+
+    manifest = read_manifest(snapshot_dir)
+    return pq.read_table(_table_file(snapshot_dir, manifest, database_name, table, verify)).to_pandas()
+
+
+def import_snapshot(
+    snapshot_dir: str,
+    databases: Optional[List[str]] = None,
+    backend: str = 'sqlite',
+    verify: bool = True,
+    logger: object = None
+) -> Dict[str, int]:
+    """Load a snapshot into databases of the given backend (requires pyarrow).
+
+    With the default SQLite backend, the scripts read the snapshot without a
+    MySQL server when run with DB_BACKEND=sqlite (and the same SQLITE_DIR).
+    Existing tables of the snapshot are replaced, with their primary keys
+    and indexes.
+
+    Args:
+        snapshot_dir: Snapshot folder
+        databases: Optional subset of the databases in the manifest
+        backend: Target backend of ConnDatabase
+        verify: Check the file hashes against the manifest
+        logger: Optional logger for the progress
+
+    Returns:
+        Dict[str, int]: {database: number of imported rows}
+    """
+    import pyarrow.parquet as pq
+
+    manifest = read_manifest(snapshot_dir)
+    counts = {}
+    for database_name, entries in manifest['databases'].items():
+        if databases is not None and database_name not in databases:
+            continue
+        counts[database_name] = 0
+        with ConnDatabase(database_name, backend=backend) as db:
+            for i, (table, entry) in enumerate(entries.items()):
+                arrow_table = pq.read_table(_table_file(snapshot_dir, manifest, database_name, table, verify))
+                schema = ", ".join(
+                    f"`{name}` {_column_type(column)}" for name, column in zip(arrow_table.column_names, arrow_table.columns)
+                )
+                db.create_new_table(table, schema)
+                rows = arrow_table.to_pylist()
+                if rows:
+                    with db.batch():
+                        db.insert_many(table, rows)
+                for name, (unique, cols) in entry['indexes'].items():
+                    if name == 'PRIMARY':
+                        # ALTER TABLE ... ADD PRIMARY KEY (emulated with a unique index by SQLite)
+                        db.set_primary_key(table, cols)
+                    else:
+                        db.ensure_index(table, cols, unique=unique, index_name=name)
+                counts[database_name] += len(rows)
+                if logger:
+                    logger.leftTimeEstimator(len(entries) - i)
+        if logger:
+            logger.info(f"Imported {len(entries)} tables of {database_name}.")
+    return counts
+
+
+def _column_type(column) -> str:
+    """Column definition of an Arrow column in an imported table."""
+    import pyarrow.compute as pc
+    import pyarrow.types as types
+
+    for check, column_type in _ARROW_TYPES:
+        if getattr(types, check)(column.type):
+            return column_type
+    if types.is_string(column.type):
+        # Short strings stay indexable in MySQL
+        longest = pc.max(pc.utf8_length(column)).as_py() or 0
+        if longest <= 500:
+            return 'varchar(500)'
+    return 'text'
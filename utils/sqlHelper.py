@@ -1,21 +1,230 @@
 import MySQLdb
+import MySQLdb.cursors
 from dotenv import load_dotenv
-from typing import Optional, Any, List, Dict, Union, Tuple
+from typing import Optional, Any, List, Dict, Union, Tuple, Iterator
 load_dotenv()
 import os
+import re
+import time
+import logging
+import sys
+import threading
+import datetime
+from collections import OrderedDict
+from decimal import Decimal
+from contextlib import contextmanager
+
+default_logger = logging.getLogger(__name__)
+
+# Patterns used to group statements by template in the query statistics
+_WHITESPACE = re.compile(r"\s+")
+_TABLE_REF = re.compile(r"\b(FROM|INTO|(?<!KEY )UPDATE|JOIN|TABLE|EXISTS)\s+`[^`]*`", re.IGNORECASE)
+_PLACEHOLDER_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+_VALUE_ROWS = re.compile(r"(\(\.\.\.\))(?:\s*,\s*\(\.\.\.\))+")
+_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\b\d+\b")
+
+# MySQL client errors after which the connection is gone:
+# can't connect, server has gone away, lost connection, disconnected by the server
+_CONNECTION_LOST_ERRORS = {2003, 2006, 2013, 2055, 4031}
+# Duplicate entry for a unique key (ER_DUP_ENTRY)
+_DUPLICATE_ENTRY_ERROR = 1062
+
+# Tables referenced by a statement, for the query result cache
+_READ_STATEMENT = re.compile(r"^\s*\(?\s*(SELECT|SHOW|PRAGMA|DESCRIBE|DESC|EXPLAIN)\b", re.IGNORECASE)
+_READ_TABLES = re.compile(r"\b(?:FROM|JOIN)\s+(?:`([^`]+)`|([\w.$]+))", re.IGNORECASE)
+_IDEMPOTENT_WRITE = re.compile(r"\bON\s+(DUPLICATE\s+KEY\s+UPDATE|CONFLICT)\b", re.IGNORECASE)
+_SESSION_STATEMENT = re.compile(r"^\s*(SET|USE)\b", re.IGNORECASE)
+_SESSION_SCOPE = re.compile(r"^(session\s+|local\s+|@@session\.|@@local\.|@@)")
+_WRITE_TABLES = re.compile(r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE|EXISTS|TO|ON)\s+(?:`([^`]+)`|([\w.$]+))", re.IGNORECASE)
+
+# Update conditions on a single key that the write-behind queue can coalesce
+_KEY_CONDITION = re.compile(r"^\s*`?(\w+)`?\s*=\s*%s\s*$")
+
+def _session_key(query: str) -> str:
+    """What a SET / USE statement sets, e.g. 'set time_zone' or 'use', so a later one replaces it."""
+    match = _SESSION_STATEMENT.match(query)
+    if match.group(1).upper() == "USE":
+        return "use"
+    target = query[match.end():].replace("`", "").lower()
+    if "=" in target:
+        target = " ".join(target.split("=", 1)[0].split())
+    else:
+        target = target.split()[0]  # SET NAMES ..., SET CHARACTER SET ..., SET TRANSACTION ...
+    return "set " + _SESSION_SCOPE.sub("", target)
+
+
+def normalize_query(query: str) -> str:
+    """Reduce a statement to its template, e.g. for grouping query statistics.
+
+    Whitespace is collapsed, literals and placeholder lists become '?' or '(...)',
+    and table names are replaced, so the statements on thousands of per-library
+    tables share one template.
+    """
+    query = _WHITESPACE.sub(" ", query).strip()
+    query = _TABLE_REF.sub(lambda m: f"{m.group(1)} `?`", query)
+    query = _PLACEHOLDER_LIST.sub("(...)", query)
+    query = _VALUE_ROWS.sub(r"\1", query)
+    return _LITERAL.sub("?", query)
+
+
+def is_duplicate_entry(error: BaseException) -> bool:
+    """Whether an error, or one it was raised from, is a MySQL duplicate-entry error.
+
+    ConnDatabase wraps the driver errors, e.g. when ensure_index() cannot add a
+    unique key because the table already holds duplicated values.
+    """
+    while error is not None:
+        if error.args and error.args[0] == _DUPLICATE_ENTRY_ERROR:
+            return True
+        error = error.__cause__
+    return False
+
+def _to_array(values: List[Any], dtype: Optional[str] = None):
+    """Build a NumPy array from the values of a result column.
+
+    Without dtype, it is inferred from the values: datetime64 for dates, int64
+    for integers (float64 if there are NULLs), float64 for floats and decimals,
+    object otherwise. NULLs become NaT / NaN.
+    """
+    import numpy as np
+
+    if dtype is None:
+        sample = next((value for value in values if value is not None), None)
+        has_null = any(value is None for value in values)
+        if isinstance(sample, datetime.datetime):
+            dtype = "datetime64[us]"
+        elif isinstance(sample, datetime.date):
+            dtype = "datetime64[D]"
+        elif isinstance(sample, bool):
+            dtype = object if has_null else bool
+        elif isinstance(sample, int):
+            dtype = "float64" if has_null else "int64"
+        elif isinstance(sample, (float, Decimal)):
+            dtype = "float64"
+        else:
+            dtype = object
+    if np.dtype(dtype).kind == "f":
+        values = [np.nan if value is None else value for value in values]
+    return np.array(values, dtype=dtype)
+
+def _estimate_size(rows: Tuple[tuple, ...]) -> int:
+    """Approximate memory used by fetched rows, for bounding the query result cache."""
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+    return size
+
 
 class ConnDatabase:
     """A class to manage MySQL database connections using environment variables.
 
     Args:
         database_name (str): The name of the database to connect to.
+        profile (bool): Record time and rows of every statement, grouped by
+            query template. Defaults to the DB_PROFILE environment variable.
+        slow_query_threshold (float): Log statements slower than this many
+            seconds. Defaults to the DB_SLOW_QUERY_SECONDS environment variable.
+        logger: Optional logger (e.g. utils.logger.getLogger()) for slow
+            queries and the statistics summary written at close().
+        auto_index (bool): Make sure the fields compared with '=' in the conditions
+            of update, upsert and select_one are indexed. Defaults to the
+            DB_AUTO_INDEX environment variable.
+        backend (str): 'mysql' or 'sqlite'. Defaults to the DB_BACKEND environment
+            variable. With 'sqlite', an SQLiteDatabase (utils/sqliteHelper.py)
+            with the same interface is returned instead.
+        cache (bool): Keep the results of SELECT queries, dropped when this
+            connection writes to one of their tables. Defaults to the DB_CACHE
+            environment variable.
+        cache_max_bytes (int): Approximate memory bound of the cache, least
+            recently used results are evicted first. Defaults to DB_CACHE_MB
+            megabytes, or 64 MB.
+        max_reconnects (int): Reconnection attempts, with exponential backoff,
+            when the connection is lost. Defaults to DB_MAX_RECONNECTS, or 5.
     
     Raises:
         EnvironmentError: If required database environment variables are not set.
     """
 
-    def __init__(self, database_name: str) -> None:
+    # SQL dialect of the backend (overridden by SQLiteDatabase)
+    _show_tables_query = "SHOW TABLES;"
+    _supports_column_position = True
+
+    # Backoff between reconnection attempts: 1, 2, 4, ... seconds, at most 60
+    _reconnect_base_delay = 1.0
+    _reconnect_max_delay = 60.0
+
+    def __new__(cls, *args, backend: Optional[str] = None, **kwargs):
+        """Dispatch to the SQLite implementation when that backend is selected."""
+        backend = (backend or os.getenv("DB_BACKEND") or "mysql").lower()
+        if cls is ConnDatabase and backend == "sqlite":
+            from utils.sqliteHelper import SQLiteDatabase
+            return super().__new__(SQLiteDatabase)
+        if backend not in ("mysql", "sqlite"):
+            raise ValueError(f"Unknown database backend: {backend}")
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        database_name: str,
+        profile: Optional[bool] = None,
+        slow_query_threshold: Optional[float] = None,
+        logger: object = None,
+        auto_index: Optional[bool] = None,
+        backend: Optional[str] = None,
+        cache: Optional[bool] = None,
+        cache_max_bytes: Optional[int] = None,
+        max_reconnects: Optional[int] = None
+    ) -> None:
         """Initialize the database connection using environment variables."""
+        self.database_name = database_name
+        self.connection = self._connect()
+        self.cursor = self.connection.cursor()
+        self._indexes: Dict[str, Dict[str, Tuple[bool, List[str]]]] = {}  # {table: {index: (unique, columns)}}
+        # Schema metadata cache, kept up to date by the DDL helpers of this class.
+        # Call refresh_schema() after changing tables by other means.
+        self._tables: Optional[set] = None
+        self._columns: Dict[str, List[str]] = {}
+        self._batch: Optional[Dict[str, Any]] = None  # State of the active batch() block
+
+        # Query instrumentation
+        if profile is None:
+            profile = os.getenv("DB_PROFILE", "").lower() in ("1", "true", "yes")
+        if slow_query_threshold is None and os.getenv("DB_SLOW_QUERY_SECONDS"):
+            slow_query_threshold = float(os.getenv("DB_SLOW_QUERY_SECONDS"))
+        self.profile = profile
+        self.slow_query_threshold = slow_query_threshold
+        self.logger = logger if logger else default_logger
+        self._query_stats: Dict[str, Dict[str, Any]] = {}
+
+        if auto_index is None:
+            auto_index = os.getenv("DB_AUTO_INDEX", "").lower() in ("1", "true", "yes")
+        self.auto_index = auto_index
+        self._auto_index_failures = set()  # (table, fields) that could not be indexed
+
+        # Query result cache, invalidated by the writes of this connection only.
+        # Call clear_cache() after changing tables by other means.
+        if cache is None:
+            cache = os.getenv("DB_CACHE", "").lower() in ("1", "true", "yes")
+        if cache_max_bytes is None:
+            cache_max_bytes = int(float(os.getenv("DB_CACHE_MB", "64")) * 1024 * 1024)
+        self.cache = cache
+        self.cache_max_bytes = cache_max_bytes
+        self._cache: "OrderedDict[Tuple[str, tuple], Tuple[Dict[str, int], List[tuple], int]]" = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._write_counters: Dict[str, int] = {}  # {table: number of writes}
+
+        # Reconnection when the server closes the connection (e.g. during multi-hour crawls)
+        if max_reconnects is None:
+            max_reconnects = int(os.getenv("DB_MAX_RECONNECTS", "5"))
+        self.max_reconnects = max_reconnects
+        self._session_statements: Dict[str, Tuple[str, tuple]] = {}  # Latest SET / USE per variable, replayed after a reconnect
+
+        self._write_queue: Optional[Dict[str, Any]] = None  # State of the active write_behind() block
+
+    def _connect(self):
+        """Open the MySQL connection configured by the environment variables."""
         db_host = os.getenv("DB_HOST")
         db_user = os.getenv("DB_USERNAME")
         db_password = os.getenv("DB_PASSWORD")
@@ -26,21 +235,84 @@ class ConnDatabase:
                 "Please set DB_HOST, DB_USERNAME, and DB_PASSWORD in the .env file."
             )
 
-        self.database_name = database_name
-        self.connection = MySQLdb.connect(
+        return MySQLdb.connect(
             host=db_host,
             user=db_user,
             passwd=db_password,
-            db=database_name,
+            db=self.database_name,
             autocommit=True,
         )
-        self.cursor = self.connection.cursor()
 
     def close(self) -> None:
-        """Close the database connection and cursor."""
+        """Close the database connection and cursor.
+
+        With profiling enabled, a summary of the query statistics is logged.
+        """
+        self.flush()
+        if self.profile and self._query_stats:
+            self.log_query_stats()
         self.cursor.close()
         self.connection.close()
 
+    def query_stats(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the recorded statistics per query template, most expensive first.
+        
+        Args:
+            top: Optional maximum number of templates to return.
+        
+        Returns:
+            List of dicts with keys 'query', 'count', 'total_time', 'avg_time',
+            'max_time' and 'rows'.
+        """
+        stats = [
+            {
+                'query': template,
+                'count': entry['count'],
+                'total_time': entry['total_time'],
+                'avg_time': entry['total_time'] / entry['count'],
+                'max_time': entry['max_time'],
+                'rows': entry['rows'],
+            }
+            for template, entry in self._query_stats.items()
+        ]
+        stats.sort(key=lambda x: x['total_time'], reverse=True)
+        return stats[:top] if top else stats
+
+    def log_query_stats(self, top: int = 20) -> None:
+        """Write a summary of the most expensive query templates to the logger."""
+        stats = self.query_stats()
+        total_time = sum(entry['total_time'] for entry in stats)
+        total_count = sum(entry['count'] for entry in stats)
+        self.logger.info(
+            f"Query statistics of {self.database_name}: "
+            f"{total_count} statements, {total_time:.2f}s in total."
+        )
+        for entry in stats[:top]:
+            self.logger.info(
+                f"{entry['total_time']:9.2f}s {entry['count']:8d}x "
+                f"avg {entry['avg_time'] * 1000:8.2f}ms rows {entry['rows']:9d}  {entry['query'][:200]}"
+            )
+
+    def reset_query_stats(self) -> None:
+        """Discard the recorded query statistics."""
+        self._query_stats = {}
+
+    def _record_query(self, query: str, elapsed: float, rows: int) -> None:
+        """Add a statement to the statistics and report it if it was slow."""
+        if self.slow_query_threshold is not None and elapsed >= self.slow_query_threshold:
+            self.logger.warning(f"Slow query ({elapsed:.3f}s, {rows} rows): {_WHITESPACE.sub(' ', query)[:500]}")
+        if not self.profile:
+            return
+        template = normalize_query(query)
+        entry = self._query_stats.get(template)
+        if entry is None:
+            entry = {'count': 0, 'total_time': 0.0, 'max_time': 0.0, 'rows': 0}
+            self._query_stats[template] = entry
+        entry['count'] += 1
+        entry['total_time'] += elapsed
+        entry['max_time'] = max(entry['max_time'], elapsed)
+        entry['rows'] += max(rows, 0)
+
     def _validate_table_name(self, table_name: str) -> None:
         """Validate a table name to prevent SQL injection (basic example).
         
@@ -54,21 +326,299 @@ class ConnDatabase:
         #     raise ValueError(f"Invalid table name: {table_name}")
         pass
 
-    def execute(self, query: str, params: Optional[tuple] = None) -> None:
+    def execute(self, query: str, params: Optional[tuple] = None, idempotent: Optional[bool] = None) -> None:
         """Execute a SQL query safely.
 
+        If the connection is lost, it is re-established. Idempotent statements
+        are then run again; others raise, since they may have been applied.
+
         Args:
             query: The SQL query to execute.
             params: Optional parameters for the query (prevents SQL injection).
+            idempotent: Whether the statement can safely run twice. Defaults to
+                True for reads and upserts (ON DUPLICATE KEY UPDATE / ON CONFLICT).
         
         Raises:
             MySQLdb.Error: If the query execution fails.
         """
+        self._run("execute", query, params or (), idempotent)
+        if _SESSION_STATEMENT.match(query):
+            key = _session_key(query)
+            self._session_statements.pop(key, None)  # Replay in the order they were last set
+            self._session_statements[key] = (query, params or ())
+
+    def executemany(self, query: str, params_list: List[tuple], idempotent: Optional[bool] = None) -> None:
+        """Execute a SQL query once per parameter tuple.
+
+        For INSERT ... VALUES statements MySQLdb folds all parameter tuples
+        into a single multi-row statement, i.e. one round trip.
+
+        Args:
+            query: The SQL query to execute.
+            params_list: A list of parameter tuples.
+            idempotent: Whether the statement can safely run twice (see execute).
+
+        Raises:
+            MySQLdb.Error: If the query execution fails.
+        """
+        self._run("executemany", query, params_list, idempotent)
+
+    def _run(self, method: str, query: str, params: Any, idempotent: Optional[bool]) -> None:
+        """Run a cursor method with instrumentation, cache invalidation and reconnection."""
+        # Statements see the writes queued before them
+        self.flush()
+        if self.cache and not _READ_STATEMENT.match(query):
+            self._record_write(query)
+        if idempotent is None:
+            idempotent = bool(_READ_STATEMENT.match(query) or _IDEMPOTENT_WRITE.search(query))
+        start = time.perf_counter()
+        retries = 0
+        while True:
+            try:
+                # Looked up on every attempt, the cursor is replaced by a reconnect
+                getattr(self.cursor, method)(query, params)
+                break
+            except MySQLdb.Error as e:
+                if not self._is_connection_lost(e):
+                    self.connection.rollback()
+                    raise MySQLdb.Error(f"Database error: {e}") from e
+                # The uncommitted statements of a batch are lost with the connection
+                in_transaction = self._batch is not None
+                self._reconnect(e)
+                if not idempotent or in_transaction or retries >= self.max_reconnects:
+                    raise MySQLdb.Error(f"Database error (connection lost, statement not retried): {e}") from e
+                retries += 1
+                self.logger.warning(f"Retrying after reconnect: {_WHITESPACE.sub(' ', query).strip()[:200]}")
+        if self.profile or self.slow_query_threshold is not None:
+            self._record_query(query, time.perf_counter() - start, self.cursor.rowcount)
+        self._count_batch_statement()
+
+    def _is_connection_lost(self, error: Exception) -> bool:
+        """Whether an error means that the connection to the server is gone."""
+        if not isinstance(error, MySQLdb.OperationalError) or not error.args:
+            return False
+        return error.args[0] in _CONNECTION_LOST_ERRORS
+
+    def _reconnect(self, error: Optional[Exception] = None) -> None:
+        """Re-open the connection with exponential backoff and restore its settings.
+
+        The autocommit mode of an active batch() and the SET / USE statements
+        run on this connection are restored.
+
+        Raises:
+            MySQLdb.Error: If no connection could be made in max_reconnects attempts.
+        """
         try:
-            self.cursor.execute(query, params or ())
-        except MySQLdb.Error as e:
+            self.connection.close()
+        except MySQLdb.Error:
+            pass
+        delay = self._reconnect_base_delay
+        for attempt in range(1, self.max_reconnects + 1):
+            self.logger.warning(
+                f"Lost the connection to {self.database_name} ({error}). "
+                f"Reconnecting in {delay:.0f}s (attempt {attempt}/{self.max_reconnects})."
+            )
+            time.sleep(delay)
+            delay = min(delay * 2, self._reconnect_max_delay)
+            try:
+                self.connection = self._connect()
+                self.cursor = self.connection.cursor()
+                if self._batch is not None:
+                    self.connection.autocommit(False)
+                    self._batch['pending'] = 0
+                for query, params in self._session_statements.values():
+                    self.cursor.execute(query, params)
+                self.logger.info(f"Reconnected to {self.database_name}.")
+                return
+            except MySQLdb.Error as e:
+                error = e
+        raise MySQLdb.Error(f"Failed to reconnect to {self.database_name} after {self.max_reconnects} attempts: {error}")
+
+    @contextmanager
+    def batch(self, commit_every: int = 500, commit_interval: Optional[float] = None) -> Iterator["ConnDatabase"]:
+        """Group the statements of a 'with' block into larger transactions.
+
+        Autocommit is turned off inside the block. A commit is issued every
+        commit_every statements, when commit_interval seconds passed since the
+        last commit, and at the end of the block. If the block raises, the
+        uncommitted statements are rolled back. Note that a failing statement
+        also rolls back the uncommitted part of the batch, and that DDL
+        statements commit implicitly in MySQL. Nested blocks join the outer one.
+
+        Args:
+            commit_every: Number of statements per transaction.
+            commit_interval: Optional maximum number of seconds between commits.
+
+        Raises:
+            ValueError: If commit_every is not positive.
+            MySQLdb.Error: If the commit or rollback fails.
+        """
+        if commit_every <= 0:
+            raise ValueError("commit_every must be positive.")
+        if self._batch is not None:
+            yield self
+            return
+
+        self.connection.autocommit(False)
+        self._batch = {
+            'commit_every': commit_every,
+            'commit_interval': commit_interval,
+            'pending': 0,
+            'last_commit': time.monotonic(),
+        }
+        try:
+            yield self
+            self.connection.commit()
+        except BaseException:
             self.connection.rollback()
-            raise MySQLdb.Error(f"Database error: {e}") from e
+            raise
+        finally:
+            self._batch = None
+            self.connection.autocommit(True)
+
+    def _count_batch_statement(self) -> None:
+        """Count a statement of the active batch and commit when a limit is reached."""
+        if self._batch is None:
+            return
+        self._batch['pending'] += 1
+        interval = self._batch['commit_interval']
+        if self._batch['pending'] >= self._batch['commit_every'] or (
+            interval is not None and time.monotonic() - self._batch['last_commit'] >= interval
+        ):
+            self.connection.commit()
+            self._batch['pending'] = 0
+            self._batch['last_commit'] = time.monotonic()
+
+    @contextmanager
+    def write_behind(self, max_rows: Optional[int] = 500, max_delay: Optional[float] = 5.0) -> Iterator["ConnDatabase"]:
+        """Queue the single-row writes of a 'with' block and send them in bulk.
+
+        Inside the block, insert(), upsert() and update() with a single-key
+        condition (e.g. "`libname`=%s") are queued instead of executed, and
+        consecutive calls of the same kind on the same table and columns are
+        written together by insert_many(), upsert_many() and update_many().
+        The queue is flushed when it holds max_rows rows, when a write is
+        queued max_delay seconds after the oldest queued one, before any other
+        statement (so reads, including iter_rows, see the queued writes), at
+        the end of the block and by flush(). Nested blocks join the outer one.
+
+        The age of the queue is only checked when the connection is used:
+        the connection is not thread-safe, so no background thread writes on
+        it. A loop that stops writing for a long time (e.g. a stalled crawl)
+        should call flush() first, since the queued rows are lost if the
+        process is killed.
+
+        Queued calls return None instead of a row id or count, and errors are
+        raised by the statement that flushes the queue. Queued upserts go
+        through upsert_many(), so the table must already have a unique key on
+        the condition fields; upsert() raises ValueError otherwise instead of
+        changing the schema inside the block.
+
+        Args:
+            max_rows: Number of queued rows that triggers a flush, or None.
+            max_delay: Maximum number of seconds a write stays queued while
+                the connection is in use, or None. With both None, the queue
+                is only written by flush(), other statements and the end of
+                the block, e.g. to log what has been committed.
+
+        Raises:
+            ValueError: If max_rows is not positive.
+            MySQLdb.Error: If flushing the queue fails.
+        """
+        if max_rows is not None and max_rows <= 0:
+            raise ValueError("max_rows must be positive.")
+        if self._write_queue is not None:
+            yield self
+            return
+
+        self._write_queue = {
+            'max_rows': max_rows,
+            'max_delay': max_delay,
+            'groups': [],  # [(kind, table, shape, rows)] in the order of the calls
+            'rows': 0,
+            'oldest': None,
+            'flushing': False,
+        }
+        try:
+            yield self
+        finally:
+            # The queued writes happened before the exception, if any
+            try:
+                self.flush()
+            finally:
+                self._write_queue = None
+
+    def _enqueue(self, kind: str, table_name: str, shape: tuple, row: Any) -> None:
+        """Add a write to the queue, joining the last group if it has the same kind, table and shape."""
+        queue = self._write_queue
+        groups = queue['groups']
+        if groups and groups[-1][:3] == (kind, table_name, shape):
+            rows = groups[-1][3]
+        else:
+            rows = {} if kind == 'update' else []
+            groups.append((kind, table_name, shape, rows))
+        if kind == 'update':
+            key, data = row
+            if key not in rows:
+                queue['rows'] += 1
+            rows[key] = data
+        else:
+            rows.append(row)
+            queue['rows'] += 1
+
+        now = time.monotonic()
+        if queue['oldest'] is None:
+            queue['oldest'] = now
+        if ((queue['max_rows'] is not None and queue['rows'] >= queue['max_rows'])
+                or (queue['max_delay'] is not None and now - queue['oldest'] >= queue['max_delay'])):
+            self.flush()
+
+    def _queues_writes(self) -> bool:
+        return self._write_queue is not None and not self._write_queue['flushing']
+
+    def flush(self) -> int:
+        """Write the rows queued by write_behind().
+
+        If a statement fails, the rest of the queue is discarded (and logged)
+        since the later writes may depend on the failed one.
+
+        Returns:
+            int: Number of queued rows that were written
+
+        Raises:
+            MySQLdb.Error: If a statement fails
+        """
+        queue = self._write_queue
+        if queue is None or queue['flushing'] or not queue['groups']:
+            return 0
+
+        groups = queue['groups']
+        queue['groups'] = []
+        queue['rows'] = 0
+        queue['oldest'] = None
+        queue['flushing'] = True
+        written = 0
+        try:
+            for i, (kind, table_name, shape, rows) in enumerate(groups):
+                try:
+                    if kind == 'insert':
+                        self.insert_many(table_name, rows)
+                    elif kind == 'upsert':
+                        self.upsert_many(table_name, rows, list(shape[1]))
+                    elif len(rows) == 1:
+                        (key, data), = rows.items()
+                        self.update(table_name, data, f"`{shape[0]}`=%s", (key,))
+                    else:
+                        self.update_many(table_name, shape[0], rows)
+                except (MySQLdb.Error, ValueError):
+                    lost = sum(len(group[3]) for group in groups[i + 1:])
+                    if lost:
+                        self.logger.error(f"Write-behind flush failed on {table_name}; discarded {lost} queued rows.")
+                    raise
+                written += len(rows)
+            return written
+        finally:
+            queue['flushing'] = False
 
     def fetchone(self, query: str, params: Optional[tuple] = None) -> tuple:
         """Execute a query and fetch a single result.
@@ -80,6 +630,9 @@ class ConnDatabase:
         Returns:
             The first row of the result, or None if no results.
         """
+        if self.cache:
+            rows = self._cached_fetchall(query, params)
+            return rows[0] if rows else None
         self.execute(query, params)
         return self.cursor.fetchone()
     
@@ -93,9 +646,78 @@ class ConnDatabase:
         Returns:
             The first row of the result, or None if no results.
         """
+        if self.cache:
+            return self._cached_fetchall(query, params)
         self.execute(query, params)
         return self.cursor.fetchall()
 
+    def _cached_fetchall(self, query: str, params: Optional[tuple] = None) -> List[tuple]:
+        """Fetch all rows of a query through the result cache."""
+        self.flush()
+        tables = self._cacheable_tables(query)
+        if tables is None:
+            self.execute(query, params)
+            return self.cursor.fetchall()
+
+        key = (query, tuple(params or ()))
+        entry = self._cache.get(key)
+        if entry is not None:
+            versions, rows, size = entry
+            if all(self._write_counters.get(table, 0) == count for table, count in versions.items()):
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return list(rows)
+            self._evict(key)
+        self._cache_misses += 1
+
+        self.execute(query, params)
+        rows = tuple(self.cursor.fetchall())
+        size = _estimate_size(rows)
+        if size <= self.cache_max_bytes:
+            self._cache[key] = ({table: self._write_counters.get(table, 0) for table in tables}, rows, size)
+            self._cache_bytes += size
+            while self._cache_bytes > self.cache_max_bytes:
+                self._evict(next(iter(self._cache)))
+        return list(rows)
+
+    def _cacheable_tables(self, query: str) -> Optional[set]:
+        """Return the tables read by a cacheable SELECT, or None if it must not be cached."""
+        match = _READ_STATEMENT.match(query)
+        if not match or match.group(1).upper() != "SELECT":
+            return None
+        tables = {quoted or plain for quoted, plain in _READ_TABLES.findall(query)}
+        # Metadata queries (INFORMATION_SCHEMA, sqlite_master) change without writes to them
+        if not tables or any("." in table or table.lower().startswith("sqlite_") for table in tables):
+            return None
+        return tables
+
+    def _record_write(self, query: str) -> None:
+        """Count a write to the tables of a statement, invalidating their cached results."""
+        tables = {quoted or plain for quoted, plain in _WRITE_TABLES.findall(query)}
+        if not tables:
+            self.clear_cache()
+            return
+        for table in tables:
+            self._write_counters[table] = self._write_counters.get(table, 0) + 1
+
+    def _evict(self, key: Tuple[str, tuple]) -> None:
+        _, _, size = self._cache.pop(key)
+        self._cache_bytes -= size
+
+    def clear_cache(self) -> None:
+        """Drop all cached query results (after changing tables outside this connection)."""
+        self._cache.clear()
+        self._cache_bytes = 0
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return the hits, misses, entries and approximate bytes of the query result cache."""
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'entries': len(self._cache),
+            'bytes': self._cache_bytes,
+        }
+
     def create_if_not_exists(self, table_name: str, schema: str) -> None:
         """Create a table if it does not already exist.
         
@@ -108,7 +730,8 @@ class ConnDatabase:
             MySQLdb.Error: If the query fails.
         """
         self._validate_table_name(table_name)
-        self.execute(f"CREATE TABLE IF NOT EXISTS `{table_name}` ({schema});")
+        self.execute(f"CREATE TABLE IF NOT EXISTS `{table_name}` ({self._translate_schema(schema)});")
+        self._invalidate_schema(table_name, exists=True)
 
     def create_new_table(self, table_name: str, schema: str) -> None:
         """Create a new table, dropping it first if it exists.
@@ -123,7 +746,12 @@ class ConnDatabase:
         """
         self._validate_table_name(table_name)
         self.drop(table_name)
-        self.execute(f"CREATE TABLE `{table_name}` ({schema});")
+        self.execute(f"CREATE TABLE `{table_name}` ({self._translate_schema(schema)});")
+        self._invalidate_schema(table_name, exists=True)
+
+    def _translate_schema(self, schema: str) -> str:
+        """Adapt a MySQL column definition list to the backend (unchanged for MySQL)."""
+        return schema
 
     def drop(self, table_name: str) -> None:
         """Drop a table if it exists.
@@ -137,6 +765,7 @@ class ConnDatabase:
         """
         self._validate_table_name(table_name)
         self.execute(f"DROP TABLE IF EXISTS `{table_name}`;")
+        self._invalidate_schema(table_name, exists=False)
 
     def entry_count(self, table_name: str, condition: Optional[str] = None, condition_values: Optional[tuple] = None) -> int:
         """Return the number of entries in a table.
@@ -165,21 +794,32 @@ class ConnDatabase:
     def show_tables(self) -> List[str]:
         """Return a list of all table names in the current database.
         
+        The table list is cached per connection after the first call.
+        
         Returns:
             List[str]: A list of table names.
         
         Raises:
             MySQLdb.Error: If the query fails.
         """
-        try:
-            result = self.fetchall("SHOW TABLES;")
-            return [entry[0] for entry in result]  # List comprehension
-        except MySQLdb.Error as e:
-            raise MySQLdb.Error(f"Failed to fetch tables: {e}") from e
+        return sorted(self._get_tables())
+
+    def has_table(self, table_name: str) -> bool:
+        """Check whether a table exists in the current database (cached).
+        
+        Args:
+            table_name (str): The name of the table.
+        
+        Returns:
+            bool: True if the table exists.
+        """
+        return table_name in self._get_tables()
 
     def show_columns(self, table_name: str) -> List[str]:
         """Return a list of column names for the specified table.
         
+        The column list is cached per connection after the first call.
+        
         Args:
             table_name (str): The name of the table.
         
@@ -190,18 +830,94 @@ class ConnDatabase:
             ValueError: If the table name is invalid.
             MySQLdb.Error: If the query fails.
         """
-        self._validate_table_name(table_name)    
+        self._validate_table_name(table_name)
+        return list(self.columns_of([table_name])[table_name])
+
+    def has_column(self, table_name: str, column_name: str) -> bool:
+        """Check whether a table has the specified column (cached).
+        
+        Args:
+            table_name (str): The name of the table.
+            column_name (str): The name of the column.
+        
+        Returns:
+            bool: True if the column exists.
+        """
+        return column_name in self.columns_of([table_name])[table_name]
+
+    def columns_of(self, tables: List[str], chunk_size: int = 1000) -> Dict[str, List[str]]:
+        """Return the column names of many tables, fetching uncached ones in bulk.
+        
+        Args:
+            tables: Names of the tables.
+            chunk_size: Maximum number of tables looked up in one query.
+        
+        Returns:
+            Dict[str, List[str]]: {table: [column, ...]}; tables that do not exist map to [].
+        
+        Raises:
+            MySQLdb.Error: If the query fails.
+        """
+        missing = [table for table in dict.fromkeys(tables) if table not in self._columns]
         try:
-            query = """
-                SELECT COLUMN_NAME
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_NAME = %s;
-            """
-            result = self.fetchall(query, (table_name,))  # Parameterized query
-            return [entry[0] for entry in result]
+            for start in range(0, len(missing), chunk_size):
+                chunk = missing[start:start + chunk_size]
+                fetched = {table: [] for table in chunk}
+                # Table names may come back with different letter case (case-insensitive
+                # servers); their columns are stored under the requested name
+                requested = {table.lower(): table for table in chunk}
+                for table, column in self._fetch_columns(chunk):
+                    name = table if table in fetched else requested.get(table.lower())
+                    if name is not None:
+                        fetched[name].append(column)
+                self._columns.update(fetched)
         except MySQLdb.Error as e:
             raise MySQLdb.Error(f"Failed to fetch columns: {e}") from e
+        return {table: self._columns.get(table, []) for table in tables}
+
+    def _fetch_columns(self, tables: List[str]) -> List[Tuple[str, str]]:
+        """Query (table, column) pairs of the given tables in column order."""
+        placeholders = ", ".join(["%s"] * len(tables))
+        return self.fetchall(f"""
+            SELECT TABLE_NAME, COLUMN_NAME
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME IN ({placeholders})
+            ORDER BY TABLE_NAME, ORDINAL_POSITION;
+        """, tuple(tables))
+
+    def refresh_schema(self) -> None:
+        """Drop all cached schema metadata (after changing tables outside this class)."""
+        self._tables = None
+        self._columns = {}
+        self._indexes = {}
+
+    def _get_tables(self) -> set:
+        """Return the cached set of table names, loading it on first use."""
+        if self._tables is None:
+            try:
+                result = self.fetchall(self._show_tables_query)
+            except MySQLdb.Error as e:
+                raise MySQLdb.Error(f"Failed to fetch tables: {e}") from e
+            self._tables = {entry[0] for entry in result}
+        return self._tables
+
+    def _invalidate_schema(self, table_name: str, exists: Optional[bool] = None) -> None:
+        """Forget cached metadata of a table after a DDL statement.
         
+        Args:
+            table_name: The changed table.
+            exists: True if the table was created, False if dropped, None if unchanged.
+        """
+        self._columns.pop(table_name, None)
+        self._indexes.pop(table_name, None)
+        self._write_counters[table_name] = self._write_counters.get(table_name, 0) + 1
+        if self._tables is not None:
+            if exists is True:
+                self._tables.add(table_name)
+            elif exists is False:
+                self._tables.discard(table_name)
+
     def insert(
         self,
         table_name: str,
@@ -214,7 +930,8 @@ class ConnDatabase:
             data: Dictionary where keys are column names and values are data to insert.
         
         Returns:
-            Optional[int]: The last inserted row ID (if applicable), or None if failed.
+            Optional[int]: The last inserted row ID (if applicable), or None if
+                failed or queued by write_behind().
         
         Raises:
             ValueError: If dictionary is empty or table name is invalid.
@@ -224,6 +941,9 @@ class ConnDatabase:
         if not data:
             raise ValueError("Data dictionary cannot be empty.")
         self._validate_table_name(table_name)
+        if self._queues_writes():
+            self._enqueue('insert', table_name, tuple(data.keys()), data)
+            return None
 
         # Extract fields and values from dictionary
         fields = list(data.keys())
@@ -240,15 +960,67 @@ class ConnDatabase:
         except MySQLdb.Error as e:
             self.connection.rollback()
             raise MySQLdb.Error(f"Insert failed: {e}") from e
-            
-    
+
+    def insert_many(
+        self,
+        table_name: str,
+        rows: List[Dict[str, Any]],
+        chunk_size: int = 1000
+    ) -> int:
+        """Insert multiple records into the specified table in batches.
+
+        Every row must have the same keys as the first one. Each chunk is
+        sent as a single multi-row INSERT statement (via executemany).
+
+        Args:
+            table_name: Name of the table to insert into.
+            rows: List of dictionaries where keys are column names.
+            chunk_size: Maximum number of rows sent in one statement.
+
+        Returns:
+            int: Number of inserted rows.
+
+        Raises:
+            ValueError: If a row has different keys or chunk size is invalid.
+            MySQLdb.Error: If the query fails.
+        """
+        if not rows:
+            return 0
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+        self._validate_table_name(table_name)
+
+        fields = list(rows[0].keys())
+        if not fields:
+            raise ValueError("Data dictionary cannot be empty.")
+        values = []
+        for row in rows:
+            if set(row.keys()) != set(fields):
+                raise ValueError(f"All rows must have the same fields: {', '.join(fields)}")
+            values.append(tuple(row[field] for field in fields))
+
+        fields_str = "`, `".join(fields)
+        placeholders = ", ".join(["%s"] * len(fields))
+        query = f"INSERT INTO `{table_name}` (`{fields_str}`) VALUES ({placeholders})"
+
+        total_rows = 0
+        try:
+            for start in range(0, len(values), chunk_size):
+                self.executemany(query, values[start:start + chunk_size])
+                total_rows += self.cursor.rowcount
+            return total_rows
+        except MySQLdb.Error as e:
+            self.connection.rollback()
+            raise MySQLdb.Error(f"Insert failed: {e}") from e
+
+
     def update(
         self,
         table_name: str,
         data: Dict[str, Any],
         condition: str,
         condition_values: Optional[tuple] = None
-    ) -> int:
+    ) -> Optional[int]:
         """Update records in the specified table based on a condition.
         
         Args:
@@ -258,7 +1030,7 @@ class ConnDatabase:
             condition_values: Tuple of values for condition placeholders
             
         Returns:
-            int: Number of affected rows
+            Optional[int]: Number of affected rows, or None if queued by write_behind()
             
         Raises:
             ValueError: If data is empty or table name is invalid
@@ -267,6 +1039,13 @@ class ConnDatabase:
         if not data:
             raise ValueError("Data dictionary cannot be empty.")
         self._validate_table_name(table_name)
+        if self._queues_writes():
+            key_match = _KEY_CONDITION.match(condition)
+            if key_match and condition_values and len(condition_values) == 1 and key_match.group(1) not in data:
+                for field in data:
+                    self._validate_field_name(field)
+                self._enqueue('update', table_name, (key_match.group(1), tuple(data.keys())), (condition_values[0], data))
+                return None
 
         # Build SET clause
         set_fields = [f"`{k}`=%s" for k in data.keys()]
@@ -274,6 +1053,9 @@ class ConnDatabase:
         
         # Combine all values (SET values + condition values)
         all_values = (*set_values, *(condition_values or ()))
+
+        if self.auto_index:
+            self._auto_index(table_name, self._condition_fields(condition))
         
         query = f"UPDATE `{table_name}` SET {', '.join(set_fields)} WHERE {condition}"
         
@@ -285,12 +1067,91 @@ class ConnDatabase:
             raise MySQLdb.Error(f"Update failed: {e}") from e
 
 
+    def update_many(
+        self,
+        table_name: str,
+        key_field: str,
+        updates: Dict[Any, Dict[str, Any]],
+        chunk_size: int = 1000
+    ) -> int:
+        """Set different values on many records in a few statements.
+
+        The new values are staged in a temporary table (with the column types
+        of the target table) and applied with a single joined UPDATE. The key
+        field must be indexable, i.e. not a TEXT/BLOB column.
+        
+        Args:
+            table_name: Name of the table to update
+            key_field: Column identifying the records (e.g. 'libname')
+            updates: {key value: {column: new value}}; every entry must set the same columns
+            chunk_size: Maximum number of rows staged in one statement
+            
+        Returns:
+            int: Number of affected rows
+            
+        Raises:
+            ValueError: If updates are empty or inconsistent
+            MySQLdb.Error: If the query fails
+        """
+        if not updates:
+            return 0
+        self._validate_table_name(table_name)
+        self._validate_field_name(key_field)
+
+        fields = list(next(iter(updates.values())).keys())
+        if not fields:
+            raise ValueError("Data dictionary cannot be empty.")
+        if key_field in fields:
+            raise ValueError(f"Key field {key_field} cannot be updated.")
+        for field in fields:
+            self._validate_field_name(field)
+
+        rows = []
+        for key, data in updates.items():
+            if set(data.keys()) != set(fields):
+                raise ValueError(f"All updates must set the same fields: {', '.join(fields)}")
+            rows.append({key_field: key, **data})
+
+        stage_table = "_update_many_stage"
+
+        try:
+            self._create_stage_table(stage_table, table_name, key_field, fields)
+            self.insert_many(stage_table, rows, chunk_size=chunk_size)
+            self.execute(self._update_from_stage_query(table_name, stage_table, key_field, fields))
+            return self.cursor.rowcount
+        except MySQLdb.Error as e:
+            self.connection.rollback()
+            raise MySQLdb.Error(f"Update failed: {e}") from e
+        finally:
+            self._drop_stage_table(stage_table)
+
+    def _drop_stage_table(self, stage_table: str) -> None:
+        """Drop the temporary table used by update_many."""
+        self.execute(f"DROP TEMPORARY TABLE IF EXISTS `{stage_table}`")
+
+    def _create_stage_table(self, stage_table: str, table_name: str, key_field: str, fields: List[str]) -> None:
+        """Create an empty temporary table with the key and fields of a table, indexed on the key."""
+        fields_str = "`, `".join([key_field] + fields)
+        self._drop_stage_table(stage_table)
+        self.execute(
+            f"CREATE TEMPORARY TABLE `{stage_table}` (INDEX (`{key_field}`)) AS "
+            f"SELECT `{fields_str}` FROM `{table_name}` WHERE 1=0"
+        )
+
+    def _update_from_stage_query(self, table_name: str, stage_table: str, key_field: str, fields: List[str]) -> str:
+        """Build the UPDATE copying the fields of matching keys from the stage table."""
+        set_str = ", ".join([f"t.`{field}`=s.`{field}`" for field in fields])
+        return (
+            f"UPDATE `{table_name}` t JOIN `{stage_table}` s "
+            f"ON t.`{key_field}`=s.`{key_field}` SET {set_str}"
+        )
+
     def upsert(
         self,
         table_name: str,
         data: Dict[str, Any],
         condition_fields: Union[str, List[str]]
-    ) -> int:
+    ) -> Optional[int]:
         """Update record if exists, otherwise insert (upsert operation).
         
         Args:
@@ -299,10 +1160,13 @@ class ConnDatabase:
             condition_fields: Single field or list of fields to check for existing record
             
         Returns:
-            int: Last inserted ID if created, or rowcount if updated
+            Optional[int]: Last inserted ID if created, rowcount if updated, or
+                None if queued by write_behind()
             
         Raises:
-            ValueError: If data is empty or condition fields missing
+            ValueError: If data is empty or condition fields missing, or if the
+                upsert is queued by write_behind() and the table has no unique
+                key on the condition fields
             MySQLdb.Error: If the operation fails
         """
         if not data:
@@ -318,6 +1182,16 @@ class ConnDatabase:
             raise ValueError(f"Condition fields missing in data: {', '.join(missing_fields)}")
         
         self._validate_table_name(table_name)
+        if self._queues_writes():
+            if not self.has_index(table_name, condition_fields, unique=True):
+                raise ValueError(
+                    f"Queued upserts need a unique key on {', '.join(condition_fields)} of {table_name}; "
+                    f"add it with ensure_index() before write_behind()."
+                )
+            self._enqueue('upsert', table_name, (tuple(data.keys()), tuple(condition_fields)), data)
+            return None
+        if self.auto_index:
+            self._auto_index(table_name, condition_fields)
         
         # Prepare condition values and where clause
         condition_values = [data[field] for field in condition_fields]
@@ -338,124 +1212,502 @@ class ConnDatabase:
                 return self.insert(table_name, data)
                 
         except MySQLdb.Error as e:
-            self.connection.rollback()
-            raise MySQLdb.Error(f"Upsert operation failed: {e}") from e
-    
+            self.connection.rollback()
+            raise MySQLdb.Error(f"Upsert operation failed: {e}") from e
+    
+
+    def upsert_many(
+        self,
+        table_name: str,
+        rows: List[Dict[str, Any]],
+        key_fields: Union[str, List[str]],
+        chunk_size: int = 1000
+    ) -> int:
+        """Batched upsert using INSERT ... ON DUPLICATE KEY UPDATE.
+
+        A unique key on the key fields is created first if the table has none,
+        so each chunk is written in a single round trip without a prior lookup.
+        Note that creating the unique key fails if the table already contains
+        duplicated key values, and rows whose key contains NULL never match.
+        
+        Args:
+            table_name: Name of the table
+            rows: List of {column: value} dictionaries sharing the same keys
+            key_fields: Single field or list of fields identifying a record
+            chunk_size: Maximum number of rows sent in one statement
+            
+        Returns:
+            int: Affected rows as reported by MySQL (1 per insert, 2 per changed update)
+            
+        Raises:
+            ValueError: If rows are inconsistent or key fields missing
+            MySQLdb.Error: If the operation fails
+        """
+        if not rows:
+            return 0
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+
+        # Convert single field to list for consistent processing
+        if isinstance(key_fields, str):
+            key_fields = [key_fields]
+
+        fields = list(rows[0].keys())
+        missing_fields = [field for field in key_fields if field not in fields]
+        if missing_fields:
+            raise ValueError(f"Key fields missing in data: {', '.join(missing_fields)}")
+
+        self._validate_table_name(table_name)
+        for field in fields:
+            self._validate_field_name(field)
+
+        values = []
+        for row in rows:
+            if set(row.keys()) != set(fields):
+                raise ValueError(f"All rows must have the same fields: {', '.join(fields)}")
+            values.append(tuple(row[field] for field in fields))
+
+        self.ensure_index(table_name, key_fields, unique=True)
+
+        # Key fields are never updated; fall back to a no-op assignment
+        update_fields = [field for field in fields if field not in key_fields] or key_fields[:1]
+        query = self._upsert_query(table_name, fields, key_fields, update_fields)
+
+        total_rows = 0
+        try:
+            for start in range(0, len(values), chunk_size):
+                self.executemany(query, values[start:start + chunk_size])
+                total_rows += self.cursor.rowcount
+            return total_rows
+        except MySQLdb.Error as e:
+            self.connection.rollback()
+            raise MySQLdb.Error(f"Upsert operation failed: {e}") from e
+
+    def _upsert_query(self, table_name: str, fields: List[str], key_fields: List[str], update_fields: List[str]) -> str:
+        """Build a single-row INSERT that updates update_fields on a duplicated key."""
+        update_str = ", ".join([f"`{field}`=VALUES(`{field}`)" for field in update_fields])
+        fields_str = "`, `".join(fields)
+        placeholders = ", ".join(["%s"] * len(fields))
+        return (
+            f"INSERT INTO `{table_name}` (`{fields_str}`) VALUES ({placeholders}) "
+            f"ON DUPLICATE KEY UPDATE {update_str}"
+        )
+
+    def select_one(
+        self,
+        table_name: str,
+        fields: Union[List[str], str] = "*",
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None,
+        return_as: str = "dict"  # 'dict' or 'tuple'
+    ) -> Optional[Dict[str, Any]]:
+        """Select a single record from the specified table.
+        
+        Args:
+            table_name: Name of the table to query
+            fields: List of field names or "*" for all fields
+            condition: WHERE clause (use %s for placeholders)
+            condition_values: Tuple of values for condition placeholders
+            return_as: Return format ('dict' or 'tuple')
+            
+        Returns:
+            Optional[Dict[str, Any]]: A dictionary of {field: value} or None if not found
+            
+        Raises:
+            ValueError: If table name is invalid
+            MySQLdb.Error: If the query fails
+        """
+        self._validate_table_name(table_name)
+        
+        # Handle fields selection
+        fields_str = self._format_fields(fields)
+        
+        # Build query
+        query = f"SELECT {fields_str} FROM `{table_name}`"
+        if condition:
+            query += f" WHERE {condition}"
+            if self.auto_index:
+                self._auto_index(table_name, self._condition_fields(condition))
+        
+        try:
+            row = self.fetchone(query, condition_values)
+            if not row:
+                return None
+                
+            # Convert to dictionary if fields were specified
+            if return_as == "dict" and isinstance(fields, list):
+                return dict(zip(fields, row))
+            return row  # For "*" queries, return raw tuple
+        except MySQLdb.Error as e:
+            raise MySQLdb.Error(f"Select failed: {e}") from e
+
+    def select_all(
+        self,
+        table_name: str,
+        fields: Union[List[str], str] = "*",
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        return_as: str = "dict"  # 'dict' or 'tuple'
+    ) -> List[Union[Dict[str, Any], Tuple[Any, ...]]]:
+        """Select multiple records from the specified table with various options.
+        
+        Args:
+            table_name: Name of the table to query
+            fields: List of field names or "*" for all fields
+            condition: WHERE clause (use %s for placeholders)
+            condition_values: Tuple of values for condition placeholders
+            limit: Maximum number of records to return
+            offset: Number of records to skip
+            order_by: Field to sort by
+            descending: Sort in descending order
+            return_as: Return format ('dict' or 'tuple')
+            
+        Returns:
+            List of records in specified format
+            
+        Raises:
+            ValueError: For invalid parameters
+            MySQLdb.Error: If the query fails
+        """
+        self._validate_table_name(table_name)
+        
+        # Handle fields selection
+        fields_str = self._format_fields(fields)
+        
+        # Build query
+        query = f"SELECT {fields_str} FROM `{table_name}`"
+        
+        # WHERE clause
+        if condition:
+            query += f" WHERE {condition}"
+        
+        # ORDER BY clause
+        if order_by:
+            self._validate_field_name(order_by)
+            query += f" ORDER BY `{order_by}`"
+            if descending:
+                query += " DESC"
+        
+        # LIMIT/OFFSET clause
+        if limit is not None:
+            query += f" LIMIT {limit}"
+            if offset is not None:
+                query += f" OFFSET {offset}"
+        
+        try:
+            rows = self.fetchall(query, condition_values)
+            
+            # Format results
+            if return_as == "dict" and isinstance(fields, list):
+                return [dict(zip(fields, row)) for row in rows]
+            return rows
+        except MySQLdb.Error as e:
+            raise MySQLdb.Error(f"Select failed: {e}") from e
+
+    def select_arrays(
+        self,
+        table_name: str,
+        fields: List[str],
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        dtypes: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Select records as one NumPy array per field (requires numpy).
+
+        Dtypes are inferred from the values (datetime64[D] for dates, int64 for
+        integer columns without NULLs, ...) unless given in dtypes.
+
+        Args:
+            table_name: Name of the table to query
+            fields: List of field names
+            condition: WHERE clause (use %s for placeholders)
+            condition_values: Tuple of values for condition placeholders
+            order_by: Field to sort by
+            descending: Sort in descending order
+            dtypes: Optional {field: NumPy dtype} overriding the inferred ones
+
+        Returns:
+            Dict[str, numpy.ndarray]: {field: column values}
+
+        Raises:
+            ValueError: For invalid parameters
+            MySQLdb.Error: If the query fails
+        """
+        if not isinstance(fields, list):
+            raise ValueError("Fields must be a list of strings.")
+        rows = self.select_all(table_name, fields, condition, condition_values,
+                               order_by=order_by, descending=descending, return_as="tuple")
+        return self._rows_to_arrays(rows, fields, dtypes)
+
+    def select_frame(
+        self,
+        table_name: str,
+        fields: List[str],
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        dtypes: Optional[Dict[str, str]] = None
+    ):
+        """Select records as a pandas DataFrame with typed columns (requires pandas).
+
+        Takes the same arguments as select_arrays.
+
+        Returns:
+            pandas.DataFrame: One column per field
+        """
+        import pandas as pd
+
+        arrays = self.select_arrays(table_name, fields, condition, condition_values,
+                                    order_by=order_by, descending=descending, dtypes=dtypes)
+        return pd.DataFrame(arrays, columns=fields)
+
+    def _rows_to_arrays(
+        self,
+        rows: List[Tuple[Any, ...]],
+        fields: List[str],
+        dtypes: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Transpose result rows into {field: NumPy array}."""
+        columns = list(zip(*rows)) if rows else [()] * len(fields)
+        dtypes = dtypes or {}
+        return {field: _to_array(list(column), dtypes.get(field)) for field, column in zip(fields, columns)}
+
+    def iter_rows(
+        self,
+        table_name: str,
+        fields: Union[List[str], str] = "*",
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        batch_size: int = 1000,
+        as_batches: bool = False,
+        return_as: str = "dict"  # 'dict' or 'tuple'
+    ) -> Iterator[Union[Dict[str, Any], Tuple[Any, ...], List[Any]]]:
+        """Stream records from the specified table with an unbuffered server-side cursor.
+
+        Rows are fetched from the server batch_size at a time, so memory use does
+        not depend on the table size and the first rows can be processed before
+        the last ones arrive. The connection cannot run other queries until the
+        generator is exhausted or closed.
+        
+        Args:
+            table_name: Name of the table to query
+            fields: List of field names or "*" for all fields
+            condition: WHERE clause (use %s for placeholders)
+            condition_values: Tuple of values for condition placeholders
+            order_by: Field to sort by
+            descending: Sort in descending order
+            batch_size: Number of rows fetched from the server at a time
+            as_batches: Yield lists of up to batch_size records instead of single records
+            return_as: Return format ('dict' or 'tuple')
+            
+        Yields:
+            Records (or lists of records) in specified format
+            
+        Raises:
+            ValueError: For invalid parameters
+            MySQLdb.Error: If the query fails
+        """
+        self._validate_table_name(table_name)
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive.")
+
+        fields_str = self._format_fields(fields)
+        query = f"SELECT {fields_str} FROM `{table_name}`"
+        if condition:
+            query += f" WHERE {condition}"
+        if order_by:
+            self._validate_field_name(order_by)
+            query += f" ORDER BY `{order_by}`"
+            if descending:
+                query += " DESC"
+
+        as_dict = return_as == "dict" and isinstance(fields, list)
+        # The stream sees the writes queued by write_behind()
+        self.flush()
+        cursor = self.connection.cursor(MySQLdb.cursors.SSCursor)
+        try:
+            start = time.perf_counter()
+            cursor.execute(query, condition_values or ())
+            if self.profile or self.slow_query_threshold is not None:
+                # Unbuffered: only the time to the first row is known here
+                self._record_query(query, time.perf_counter() - start, 0)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                if as_dict:
+                    rows = [dict(zip(fields, row)) for row in rows]
+                if as_batches:
+                    yield list(rows)
+                else:
+                    yield from rows
+        except MySQLdb.Error as e:
+            raise MySQLdb.Error(f"Select failed: {e}") from e
+        finally:
+            # Closing drains any unread rows so the connection stays usable
+            cursor.close()
 
-    def select_one(
+    def select_pages(
         self,
         table_name: str,
+        key_field: str,
+        page_size: int = 1000,
         fields: Union[List[str], str] = "*",
         condition: Optional[str] = None,
         condition_values: Optional[Tuple[Any, ...]] = None,
         return_as: str = "dict"  # 'dict' or 'tuple'
-    ) -> Optional[Dict[str, Any]]:
-        """Select a single record from the specified table.
+    ) -> Iterator[List[Union[Dict[str, Any], Tuple[Any, ...]]]]:
+        """Yield pages of records ordered by a key, seeking past the previous page.
+
+        Unlike select_all with limit/offset, each page starts with `key > last key`,
+        so the server never rescans skipped rows. The key should be unique and
+        indexed; rows with a NULL key are not returned.
         
         Args:
             table_name: Name of the table to query
+            key_field: Unique ordered column to page by
+            page_size: Number of records per page
             fields: List of field names or "*" for all fields
             condition: WHERE clause (use %s for placeholders)
             condition_values: Tuple of values for condition placeholders
             return_as: Return format ('dict' or 'tuple')
             
-        Returns:
-            Optional[Dict[str, Any]]: A dictionary of {field: value} or None if not found
+        Yields:
+            Lists of up to page_size records in specified format
             
         Raises:
-            ValueError: If table name is invalid
+            ValueError: For invalid parameters
             MySQLdb.Error: If the query fails
         """
         self._validate_table_name(table_name)
-        
-        # Handle fields selection
+        self._validate_field_name(key_field)
+        if page_size <= 0:
+            raise ValueError("Page size must be positive.")
+
+        # The key is selected as an extra last column to find the next page
         fields_str = self._format_fields(fields)
-        
-        # Build query
-        query = f"SELECT {fields_str} FROM `{table_name}`"
+        base_query = f"SELECT {fields_str}, `{key_field}` FROM `{table_name}` WHERE "
         if condition:
-            query += f" WHERE {condition}"
-        
-        try:
-            self.execute(query, condition_values)
-            row = self.cursor.fetchone()
-            if not row:
-                return None
-                
-            # Convert to dictionary if fields were specified
+            base_query += f"({condition}) AND "
+        values = tuple(condition_values or ())
+
+        last_key = None
+        while True:
+            if last_key is None:
+                query = f"{base_query}`{key_field}` IS NOT NULL"
+                params = values
+            else:
+                query = f"{base_query}`{key_field}` > %s"
+                params = values + (last_key,)
+            query += f" ORDER BY `{key_field}` LIMIT {page_size}"
+            try:
+                self.execute(query, params)
+                rows = self.cursor.fetchall()
+            except MySQLdb.Error as e:
+                raise MySQLdb.Error(f"Select failed: {e}") from e
+            if not rows:
+                break
+
+            last_key = rows[-1][-1]
             if return_as == "dict" and isinstance(fields, list):
-                return dict(zip(fields, row))
-            return row  # For "*" queries, return raw tuple
-        except MySQLdb.Error as e:
-            raise MySQLdb.Error(f"Select failed: {e}") from e
+                yield [dict(zip(fields, row[:-1])) for row in rows]
+            else:
+                yield [row[:-1] for row in rows]
+            if len(rows) < page_size:
+                break
 
-    def select_all(
+    def read_many_tables(
         self,
-        table_name: str,
+        tables: List[str],
         fields: Union[List[str], str] = "*",
         condition: Optional[str] = None,
         condition_values: Optional[Tuple[Any, ...]] = None,
-        limit: Optional[int] = None,
-        offset: Optional[int] = None,
         order_by: Optional[str] = None,
         descending: bool = False,
-        return_as: str = "dict"  # 'dict' or 'tuple'
-    ) -> List[Union[Dict[str, Any], Tuple[Any, ...]]]:
-        """Select multiple records from the specified table with various options.
-        
+        batch: int = 50,
+        return_as: str = "dict",  # 'dict', 'tuple' or 'arrays'
+        dtypes: Optional[Dict[str, str]] = None
+    ) -> Dict[str, List[Union[Dict[str, Any], Tuple[Any, ...]]]]:
+        """Select the same fields from many tables, several tables per round trip.
+
+        The tables of a batch are read with one UNION ALL query that adds the
+        table name as a discriminator column, so reading the per-library tables
+        takes len(tables) / batch round trips instead of len(tables).
+
         Args:
-            table_name: Name of the table to query
-            fields: List of field names or "*" for all fields
-            condition: WHERE clause (use %s for placeholders)
+            tables: Names of the tables to query (missing tables are skipped)
+            fields: List of field names, or "*" if all tables have the same columns
+            condition: WHERE clause applied to every table (use %s for placeholders)
             condition_values: Tuple of values for condition placeholders
-            limit: Maximum number of records to return
-            offset: Number of records to skip
-            order_by: Field to sort by
+            order_by: Field to sort the records of each table by
             descending: Sort in descending order
-            return_as: Return format ('dict' or 'tuple')
-            
+            batch: Number of tables per query
+            return_as: Return format ('dict', 'tuple' or 'arrays', i.e. one
+                NumPy array per field like select_arrays)
+            dtypes: Optional {field: NumPy dtype} for return_as='arrays'
+
         Returns:
-            List of records in specified format
-            
+            Dict[str, List]: {table: records in specified format}, in the order of
+            tables; an existing table without matching records maps to [] (or
+            empty arrays).
+
         Raises:
-            ValueError: For invalid parameters
+            ValueError: For invalid parameters or "*" on tables with different columns
             MySQLdb.Error: If the query fails
         """
-        self._validate_table_name(table_name)
-        
-        # Handle fields selection
+        if batch <= 0:
+            raise ValueError("Batch size must be positive.")
+        tables = [table for table in dict.fromkeys(tables) if self.has_table(table)]
+        if not tables:
+            return {}
+        for table in tables:
+            self._validate_table_name(table)
+
+        if fields == "*":
+            columns = self.columns_of(tables)
+            fields = columns[tables[0]]
+            different = [table for table in tables if columns[table] != fields]
+            if different:
+                raise ValueError(f"Tables have different columns, select fields explicitly: {', '.join(different[:5])}")
         fields_str = self._format_fields(fields)
-        
-        # Build query
-        query = f"SELECT {fields_str} FROM `{table_name}`"
-        
-        # WHERE clause
-        if condition:
-            query += f" WHERE {condition}"
-        
-        # ORDER BY clause
+        where = f" WHERE {condition}" if condition else ""
+        order = ""
         if order_by:
             self._validate_field_name(order_by)
-            query += f" ORDER BY `{order_by}`"
-            if descending:
-                query += " DESC"
-        
-        # LIMIT/OFFSET clause
-        if limit is not None:
-            query += f" LIMIT {limit}"
-            if offset is not None:
-                query += f" OFFSET {offset}"
-        
-        try:
-            self.execute(query, condition_values)
-            rows = self.cursor.fetchall()
-            
-            # Format results
-            if return_as == "dict" and isinstance(fields, list):
-                return [dict(zip(fields, row)) for row in rows]
-            return rows
-        except MySQLdb.Error as e:
-            raise MySQLdb.Error(f"Select failed: {e}") from e
+            order = f" ORDER BY `_table`, `{order_by}`{' DESC' if descending else ''}"
+
+        result = {table: [] for table in tables}
+        for start in range(0, len(tables), batch):
+            chunk = tables[start:start + batch]
+            query = " UNION ALL ".join(
+                f"SELECT %s AS `_table`, {fields_str} FROM `{table}`{where}" for table in chunk
+            ) + order
+            params = []
+            for table in chunk:
+                params.append(table)
+                params.extend(condition_values or ())
+            try:
+                rows = self.fetchall(query, tuple(params))
+            except MySQLdb.Error as e:
+                raise MySQLdb.Error(f"Select failed: {e}") from e
+
+            for row in rows:
+                if return_as == "dict":
+                    result[row[0]].append(dict(zip(fields, row[1:])))
+                else:
+                    result[row[0]].append(row[1:])
+        if return_as == "arrays":
+            return {table: self._rows_to_arrays(rows, fields, dtypes) for table, rows in result.items()}
+        return result
 
     def _format_fields(self, fields: Union[List[str], str]) -> str:
         """Format fields list into SQL string."""
@@ -496,7 +1748,7 @@ class ConnDatabase:
         if not condition.strip():
             raise ValueError("Condition cannot be empty")
         
-        query = f"DELETE FROM `{table_name}` WHERE {condition} LIMIT 1"
+        query = self._delete_query(table_name, condition, 1)
         
         try:
             self.execute(query, condition_values)
@@ -536,11 +1788,7 @@ class ConnDatabase:
                 "Either provide a condition or set batch_size."
             )
         
-        base_query = f"DELETE FROM `{table_name}`"
-        if condition:
-            base_query += f" WHERE {condition}"
-        if batch_size:
-            base_query += f" LIMIT {batch_size}"
+        base_query = self._delete_query(table_name, condition, batch_size)
         
         total_deleted = 0
         
@@ -560,6 +1808,15 @@ class ConnDatabase:
             self.connection.rollback()
             raise MySQLdb.Error(f"Failed to delete records: {e}") from e
         
+    def _delete_query(self, table_name: str, condition: Optional[str], limit: Optional[int]) -> str:
+        """Build a DELETE statement deleting at most limit rows."""
+        query = f"DELETE FROM `{table_name}`"
+        if condition:
+            query += f" WHERE {condition}"
+        if limit:
+            query += f" LIMIT {limit}"
+        return query
+
     def select_with_join(
         self,
         table_name: str,
@@ -605,8 +1862,7 @@ class ConnDatabase:
             query += f" WHERE {condition}"
         
         try:
-            self.execute(query, condition_values)
-            rows = self.cursor.fetchall()
+            rows = self.fetchall(query, condition_values)
             
             if return_as == "dict" and isinstance(fields, list):
                 return [dict(zip(fields, row)) for row in rows]
@@ -683,6 +1939,129 @@ class ConnDatabase:
         except MySQLdb.Error as e:
             raise MySQLdb.Error(f"Group query failed: {e}") from e
     
+    def show_indexes(self, table_name: str) -> Dict[str, Tuple[bool, List[str]]]:
+        """Return the indexes of a table (cached per connection).
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Dict[str, Tuple[bool, List[str]]]: {index name: (is unique, [column, ...])}
+        """
+        self._validate_table_name(table_name)
+        if table_name not in self._indexes:
+            indexes = {}
+            for index_name, non_unique, column_name in self._fetch_indexes(table_name):
+                indexes.setdefault(index_name, (not non_unique, []))[1].append(column_name)
+            self._indexes[table_name] = indexes
+        return self._indexes[table_name]
+
+    def _fetch_indexes(self, table_name: str) -> List[Tuple[str, int, str]]:
+        """Query (index, non-unique flag, column) rows of a table in index column order."""
+        return self.fetchall("""
+            SELECT INDEX_NAME, NON_UNIQUE, COLUMN_NAME
+            FROM INFORMATION_SCHEMA.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME = %s
+            ORDER BY INDEX_NAME, SEQ_IN_INDEX
+        """, (table_name,))
+
+    def has_index(self, table_name: str, fields: Union[str, List[str]], unique: bool = False) -> bool:
+        """Check whether lookups on these fields can use an index.
+        
+        Args:
+            table_name: Name of the table
+            fields: Column name or list of column names
+            unique: Require a unique index on exactly these columns
+            
+        Returns:
+            bool: True if a usable index exists
+        """
+        if isinstance(fields, str):
+            fields = [fields]
+        for is_unique, columns in self.show_indexes(table_name).values():
+            if unique:
+                if is_unique and set(columns) == set(fields):
+                    return True
+            elif set(columns[:len(fields)]) == set(fields):
+                # The fields form a prefix of the index
+                return True
+        return False
+
+    def ensure_index(
+        self,
+        table_name: str,
+        fields: Union[str, List[str]],
+        unique: bool = False,
+        index_name: Optional[str] = None
+    ) -> bool:
+        """Create an index on the fields unless a usable one already exists.
+        
+        Args:
+            table_name: Name of the table to modify
+            fields: Column name or list of column names
+            unique: Create a unique index (fails if the table has duplicated values)
+            index_name: Optional index name (derived from the fields by default)
+            
+        Returns:
+            bool: True if an index was created, False if one already existed
+            
+        Raises:
+            ValueError: If no fields are given
+            MySQLdb.Error: If the operation fails
+        """
+        if isinstance(fields, str):
+            fields = [fields]
+        if not fields:
+            raise ValueError("Index fields cannot be empty.")
+        self._validate_table_name(table_name)
+        for field in fields:
+            self._validate_field_name(field)
+
+        if self.has_index(table_name, fields, unique):
+            return False
+
+        if not index_name:
+            index_name = (("uk_" if unique else "idx_") + "_".join(fields)).replace(" ", "_")[:64]
+        fields_str = "`, `".join(fields)
+        try:
+            self.execute(self._add_index_query(table_name, index_name, fields_str, unique))
+        except MySQLdb.Error as e:
+            hint = " Note: You may need to remove duplicated entries first." if unique else ""
+            raise MySQLdb.Error(f"Failed to add index: {e}.{hint}") from e
+        self._invalidate_schema(table_name)
+        return True
+
+    def _add_index_query(self, table_name: str, index_name: str, fields_str: str, unique: bool) -> str:
+        """Build the statement adding an index on the backquoted fields."""
+        return (
+            f"ALTER TABLE `{table_name}` "
+            f"ADD {'UNIQUE ' if unique else ''}INDEX `{index_name}` (`{fields_str}`)"
+        )
+
+    def _condition_fields(self, condition: str) -> List[str]:
+        """Return the fields compared with '= %s' in a condition made of ANDs only."""
+        if not condition or re.search(r"\bOR\b", condition, re.IGNORECASE):
+            return []
+        fields = []
+        for quoted, plain in re.findall(r"(?:`([^`]+)`|\b(\w+))\s*=\s*%s", condition):
+            field = quoted or plain
+            if field not in fields:
+                fields.append(field)
+        return fields
+
+    def _auto_index(self, table_name: str, fields: List[str]) -> None:
+        """Index lookup fields in auto_index mode; failures are logged once and skipped."""
+        key = (table_name, tuple(fields))
+        if not fields or key in self._auto_index_failures:
+            return
+        try:
+            if self.ensure_index(table_name, fields):
+                self.logger.info(f"Added index on {table_name} ({', '.join(fields)}).")
+        except MySQLdb.Error as e:
+            self._auto_index_failures.add(key)
+            self.logger.warning(f"Cannot index {table_name} ({', '.join(fields)}): {e}")
+
     def set_primary_key(
         self,
         table_name: str,
@@ -730,6 +2109,7 @@ class ConnDatabase:
                 f"ALTER TABLE `{table_name}` "
                 f"ADD PRIMARY KEY (`{columns_str}`)"
             )
+            self._invalidate_schema(table_name)
             return True
             
         except MySQLdb.Error as e:
@@ -766,6 +2146,7 @@ class ConnDatabase:
                     f"ALTER TABLE `{table_name}` "
                     "DROP PRIMARY KEY"
                 )
+            self._invalidate_schema(table_name)
             return True
         except MySQLdb.Error as e:
             self.connection.rollback()
@@ -778,7 +2159,8 @@ class ConnDatabase:
         preserve_ids: bool = False,
         where_clause: Optional[str] = None,
         where_values: Optional[tuple] = None,
-        chunk_size: Optional[int] = None
+        chunk_size: Optional[int] = None,
+        key_field: Optional[str] = None
     ) -> int:
         """Combine multiple tables with identical structure into a new table.
         
@@ -789,6 +2171,9 @@ class ConnDatabase:
             where_clause: Optional WHERE condition for source tables
             where_values: Values for WHERE placeholders
             chunk_size: Process in chunks of this size (for large tables)
+            key_field: Ordered (ideally indexed) column used to seek between chunks.
+                Defaults to the single-column primary key; without one, chunks fall
+                back to LIMIT/OFFSET paging, which rescans skipped rows.
             
         Returns:
             int: Total number of rows combined
@@ -824,6 +2209,7 @@ class ConnDatabase:
                 f"SELECT `{columns_str}` FROM `{old_tables[0]}` "
                 "WHERE 1=0"  # Creates structure without data
             )
+            self._invalidate_schema(new_table, exists=True)
             
             total_rows = 0
             
@@ -833,7 +2219,13 @@ class ConnDatabase:
                 if where_clause:
                     base_query += f" WHERE {where_clause}"
                 
-                if chunk_size:
+                chunk_key = (key_field or self._primary_key_column(table)) if chunk_size else None
+                if chunk_key:
+                    total_rows += self._copy_by_key(
+                        new_table, table, f"`{columns_str}`", chunk_key,
+                        chunk_size, where_clause, where_values
+                    )
+                elif chunk_size:
                     offset = 0
                     while True:
                         chunk_query = (
@@ -870,9 +2262,10 @@ class ConnDatabase:
             return []
         
         common_columns = None
+        columns = self.columns_of(tables)
         
         for table in tables:
-            current_columns = set(self.show_columns(table))
+            current_columns = set(columns[table])
             if common_columns is None:
                 common_columns = current_columns
             else:
@@ -881,6 +2274,58 @@ class ConnDatabase:
                     break
         
         return sorted(common_columns) if common_columns else []
+
+    def _primary_key_column(self, table_name: str) -> Optional[str]:
+        """Return the primary key column of a table, or None if it has no single-column one."""
+        primary = self.show_indexes(table_name).get('PRIMARY')
+        return primary[1][0] if primary and len(primary[1]) == 1 else None
+
+    def _copy_by_key(
+        self,
+        new_table: str,
+        source_table: str,
+        columns_str: str,
+        key_field: str,
+        chunk_size: int,
+        where_clause: Optional[str] = None,
+        where_values: Optional[tuple] = None
+    ) -> int:
+        """Copy rows chunk by chunk, seeking to the next chunk by key instead of OFFSET.
+
+        Each chunk ends at the key of its chunk_size-th row and includes all rows
+        sharing that key, so the key does not have to be unique. Rows with a NULL
+        key are copied in one final statement.
+        """
+        self._validate_field_name(key_field)
+        where_prefix = f"({where_clause}) AND " if where_clause else ""
+        values = tuple(where_values or ())
+        insert_query = f"INSERT INTO `{new_table}` SELECT {columns_str} FROM `{source_table}` WHERE {where_prefix}"
+
+        total_rows = 0
+        last_key = None
+        while True:
+            if last_key is None:
+                key_cond, key_values = f"`{key_field}` IS NOT NULL", ()
+            else:
+                key_cond, key_values = f"`{key_field}` > %s", (last_key,)
+            # Key of the last row in this chunk
+            bound = self.fetchone(
+                f"SELECT `{key_field}` FROM `{source_table}` WHERE {where_prefix}{key_cond} "
+                f"ORDER BY `{key_field}` LIMIT 1 OFFSET {chunk_size - 1}",
+                values + key_values
+            )
+            if bound:
+                self.execute(f"{insert_query}{key_cond} AND `{key_field}` <= %s", values + key_values + (bound[0],))
+            else:
+                self.execute(f"{insert_query}{key_cond}", values + key_values)
+            total_rows += self.cursor.rowcount
+            if not bound:
+                break
+            last_key = bound[0]
+
+        self.execute(f"{insert_query}`{key_field}` IS NULL", values)
+        total_rows += self.cursor.rowcount
+        return total_rows
     
 
     def duplicate_table(
@@ -892,7 +2337,8 @@ class ConnDatabase:
         include_indexes: bool = True,
         where_clause: Optional[str] = None,
         where_values: Optional[tuple] = None,
-        chunk_size: Optional[int] = None
+        chunk_size: Optional[int] = None,
+        key_field: Optional[str] = None
     ) -> int:
         """Create a copy of an existing table with optional data.
         
@@ -905,6 +2351,9 @@ class ConnDatabase:
             where_clause: Optional condition for filtering data
             where_values: Values for WHERE placeholders
             chunk_size: Process in chunks (for large tables)
+            key_field: Ordered (ideally indexed) column used to seek between chunks.
+                Defaults to the single-column primary key; without one, chunks fall
+                back to LIMIT/OFFSET paging, which rescans skipped rows.
             
         Returns:
             int: Number of rows copied (if copy_data=True)
@@ -932,15 +2381,14 @@ class ConnDatabase:
             if copy_structure:
                 if include_indexes:
                     # Copy with all constraints and indexes
-                    self.execute(
-                        f"CREATE TABLE `{new_table}` LIKE `{source_table}`"
-                    )
+                    self._create_table_like(source_table, new_table)
                 else:
                     # Basic structure without indexes
                     self.execute(
                         f"CREATE TABLE `{new_table}` AS "
                         f"SELECT * FROM `{source_table}` WHERE 1=0"
                     )
+                self._invalidate_schema(new_table, exists=True)
             
             # Copy data
             if copy_data and copy_structure:
@@ -948,7 +2396,13 @@ class ConnDatabase:
                 if where_clause:
                     base_query += f" WHERE {where_clause}"
                 
-                if chunk_size:
+                chunk_key = (key_field or self._primary_key_column(source_table)) if chunk_size else None
+                if chunk_key:
+                    rows_copied = self._copy_by_key(
+                        new_table, source_table, "*", chunk_key,
+                        chunk_size, where_clause, where_values
+                    )
+                elif chunk_size:
                     offset = 0
                     while True:
                         chunk_query = (
@@ -980,10 +2434,93 @@ class ConnDatabase:
             raise MySQLdb.Error(f"Failed to duplicate table: {e}") from e
 
 
+    def _create_table_like(self, source_table: str, new_table: str) -> None:
+        """Create an empty table with the columns and indexes of the source table."""
+        self.execute(f"CREATE TABLE `{new_table}` LIKE `{source_table}`")
+
     def clone_table_structure(self, source: str, new_table: str) -> None:
         """Convenience method for structure-only copy"""
         return self.duplicate_table(source, new_table, copy_data=False)
 
+    def dedupe_into(
+        self,
+        source_table: str,
+        target_table: str,
+        key_fields: Union[str, List[str]],
+        keep: str = "first",
+        order_by: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None
+    ) -> int:
+        """Copy one record per distinct key from a table into another, in one statement.
+
+        Within each group of records with equal key fields, the first (or last)
+        one by order_by is kept, and keys already in the target table are
+        skipped. Uses ROW_NUMBER() (MySQL 8+ / SQLite 3.25+).
+
+        Args:
+            source_table: Table to read
+            target_table: Existing table to insert into
+            key_fields: Field or fields defining duplicates
+            keep: 'first' or 'last' record of each group by order_by
+            order_by: Ordering field, defaults to the primary key of the source table
+            fields: Fields to copy, defaults to all fields of the source table
+                except its primary key (the copies get new keys)
+            condition: Optional WHERE clause on the source table
+            condition_values: Tuple of values for condition placeholders
+
+        Returns:
+            int: Number of inserted records
+
+        Raises:
+            ValueError: For invalid parameters or a missing ordering field
+            MySQLdb.Error: If the operation fails
+        """
+        self._validate_table_name(source_table)
+        self._validate_table_name(target_table)
+        if keep not in ("first", "last"):
+            raise ValueError("keep must be 'first' or 'last'.")
+        if isinstance(key_fields, str):
+            key_fields = [key_fields]
+
+        primary_key = self._primary_key_column(source_table)
+        order_by = order_by or primary_key
+        if not order_by:
+            raise ValueError(f"{source_table} has no single-column primary key. Please provide order_by.")
+        if fields is None:
+            fields = [column for column in self.show_columns(source_table) if column != primary_key]
+        for field in key_fields + fields + [order_by]:
+            self._validate_field_name(field)
+        missing = [field for field in key_fields if field not in fields]
+        if missing:
+            raise ValueError(f"Key fields must be copied: {', '.join(missing)}")
+
+        # Look up the keys of the target table with an index
+        self.ensure_index(target_table, key_fields)
+
+        fields_str = "`, `".join(fields)
+        keys_str = "`, `".join(key_fields)
+        direction = "ASC" if keep == "first" else "DESC"
+        where = f" WHERE {condition}" if condition else ""
+        exists = " AND ".join([f"t.`{field}` = d.`{field}`" for field in key_fields])
+        query = (
+            f"INSERT INTO `{target_table}` (`{fields_str}`) "
+            f"SELECT d.`{'`, d.`'.join(fields)}` FROM ("
+            f"SELECT `{fields_str}`, `{order_by}` AS `_order`, "
+            f"ROW_NUMBER() OVER (PARTITION BY `{keys_str}` ORDER BY `{order_by}` {direction}) AS `_row` "
+            f"FROM `{source_table}`{where}"
+            f") AS d "
+            f"WHERE d.`_row` = 1 AND NOT EXISTS (SELECT 1 FROM `{target_table}` AS t WHERE {exists}) "
+            f"ORDER BY d.`_order`"
+        )
+        try:
+            self.execute(query, condition_values)
+            return self.cursor.rowcount
+        except MySQLdb.Error as e:
+            self.connection.rollback()
+            raise MySQLdb.Error(f"Failed to deduplicate {source_table} into {target_table}: {e}") from e
+
     def rename_table(
         self,
         current_name: str,
@@ -1013,27 +2550,25 @@ class ConnDatabase:
         
         try:
             # Check if new table exists
-            self.cursor.execute(f"""
-                SELECT COUNT(*) 
-                FROM information_schema.tables 
-                WHERE table_schema = DATABASE() 
-                AND table_name = %s
-            """, (new_name,))
-            target_exists = self.cursor.fetchone()[0] > 0
-            
-            if target_exists:
+            if self.has_table(new_name):
                 if not overwrite:
                     return False
                 self.drop(new_name)
             
             # Perform the rename
-            self.execute(f"RENAME TABLE `{current_name}` TO `{new_name}`")
+            self.execute(self._rename_query(current_name, new_name))
+            self._invalidate_schema(current_name, exists=False)
+            self._invalidate_schema(new_name, exists=True)
             return True
         
         except MySQLdb.Error as e:
             self.connection.rollback()
             raise MySQLdb.Error(f"Failed to rename table: {e}") from e
     
+    def _rename_query(self, current_name: str, new_name: str) -> str:
+        """Build the statement renaming a table."""
+        return f"RENAME TABLE `{current_name}` TO `{new_name}`"
+
     def add_column(
         self,
         table_name: str,
@@ -1074,16 +2609,8 @@ class ConnDatabase:
         
         try:
             # Check if column already exists
-            if check_exists:
-                self.cursor.execute(f"""
-                    SELECT COUNT(*) 
-                    FROM information_schema.columns 
-                    WHERE table_schema = DATABASE() 
-                    AND table_name = %s 
-                    AND column_name = %s
-                """, (table_name, column_name))
-                if self.cursor.fetchone()[0] > 0:
-                    return False
+            if check_exists and self.has_column(table_name, column_name):
+                return False
             
             # Build ALTER TABLE statement
             alter_sql = f"ALTER TABLE `{table_name}` ADD COLUMN `{column_name}` {column_type}"
@@ -1100,10 +2627,11 @@ class ConnDatabase:
                     default_value = str(default)
                 alter_sql = alter_sql.replace("%s", default_value)
             
-            if after_column:
+            if after_column and self._supports_column_position:
                 alter_sql += f" AFTER `{after_column}`"
             
             self.execute(alter_sql)
+            self._invalidate_schema(table_name)
             return True
             
         except MySQLdb.Error as e:
@@ -1120,18 +2648,197 @@ class ConnDatabase:
         Returns:
             bool: True if column was dropped
         """
-        if column_name not in self.show_columns(table_name):
+        if not self.has_column(table_name, column_name):
             # Do not need to drop if not exist
             return True
         try:
             self.execute(f"ALTER TABLE `{table_name}` DROP COLUMN `{column_name}`")
+            self._invalidate_schema(table_name)
             return True
         except MySQLdb.Error as e:
             self.connection.rollback()
             raise MySQLdb.Error(f"Failed to drop column: {e}") from e
 
+    def __enter__(self) -> "ConnDatabase":
+        """Allow the connection to be used in a 'with' statement."""
+        return self
+
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Ensure resources are closed when exiting the context."""
         self.close()
 
-        
\ No newline at end of file
+
+class ConnPool:
+    """A thread-safe pool of ConnDatabase connections to one database.
+
+    ConnDatabase keeps a single cursor, so one instance must never be shared
+    between threads. The pool hands out a separate connection to each worker
+    and never opens more than max_size connections at the same time.
+
+    Args:
+        database_name (str): The name of the database to connect to.
+        max_size (int): Maximum number of open connections.
+        timeout (float): Seconds to wait for a free connection (None waits forever).
+        **conn_kwargs: Extra keyword arguments passed to every ConnDatabase.
+
+    Raises:
+        ValueError: If max_size is not positive.
+    """
+
+    def __init__(self, database_name: str, max_size: int = 8, timeout: Optional[float] = None, **conn_kwargs) -> None:
+        if max_size <= 0:
+            raise ValueError("Pool size must be positive.")
+        self.database_name = database_name
+        self.conn_kwargs = conn_kwargs
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle: List[ConnDatabase] = []
+        self._in_use = set()
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._closed = False
+
+    def acquire(self, timeout: Optional[float] = None) -> ConnDatabase:
+        """Check out a connection, opening a new one if the pool is not full.
+        
+        Args:
+            timeout: Seconds to wait for a free connection (defaults to the pool timeout)
+        
+        Returns:
+            ConnDatabase: A connection owned by the caller until released
+        
+        Raises:
+            TimeoutError: If no connection became free in time
+            RuntimeError: If the pool is closed
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed.")
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if len(self._in_use) < self.max_size:
+                    conn = None
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"No free connection to {self.database_name} "
+                        f"(pool size {self.max_size})."
+                    )
+                self._condition.wait(remaining)
+            # Reserve the slot before connecting outside the lock
+            placeholder = object()
+            self._in_use.add(placeholder)
+
+        try:
+            conn = self._check_alive(conn) if conn else ConnDatabase(self.database_name, **self.conn_kwargs)
+        except Exception:
+            with self._condition:
+                self._in_use.discard(placeholder)
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._in_use.discard(placeholder)
+            self._in_use.add(conn)
+        return conn
+
+    def release(self, conn: ConnDatabase) -> None:
+        """Return a connection to the pool.
+        
+        Args:
+            conn: A connection obtained from acquire()
+        
+        Raises:
+            ValueError: If the connection does not belong to this pool
+        """
+        with self._condition:
+            if conn not in self._in_use:
+                raise ValueError("Connection does not belong to this pool.")
+            self._in_use.remove(conn)
+            if self._closed:
+                conn.close()
+            else:
+                self._idle.append(conn)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[ConnDatabase]:
+        """Check out a connection for the duration of a 'with' block."""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def thread_connection(self) -> ConnDatabase:
+        """Return the connection bound to the calling thread.
+
+        The connection is checked out on first use and kept until
+        release_thread_connection() or close_all() is called.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self.acquire()
+            self._local.conn = conn
+        return conn
+
+    def release_thread_connection(self) -> None:
+        """Return the connection bound to the calling thread, if any."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            self.release(conn)
+
+    def close_all(self) -> None:
+        """Close idle connections now and checked-out ones when they are released."""
+        with self._condition:
+            self._closed = True
+            for conn in self._idle:
+                conn.close()
+            self._idle = []
+            self._condition.notify_all()
+
+    def _check_alive(self, conn: ConnDatabase) -> ConnDatabase:
+        """Replace an idle connection that the server has dropped."""
+        try:
+            conn.connection.ping()
+            return conn
+        except MySQLdb.Error:
+            try:
+                conn.close()
+            except MySQLdb.Error:
+                pass
+            return ConnDatabase(self.database_name, **self.conn_kwargs)
+
+    def __enter__(self) -> "ConnPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close_all()
+
+
+_pools: Dict[str, ConnPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(database_name: str, max_size: int = 8) -> ConnPool:
+    """Return the shared connection pool of a database, creating it on first use.
+    
+    Args:
+        database_name: The name of the database to connect to
+        max_size: Maximum number of open connections (only used on creation)
+    
+    Returns:
+        ConnPool: The process-wide pool for this database
+    """
+    with _pools_lock:
+        pool = _pools.get(database_name)
+        if pool is None or pool._closed:
+            pool = ConnPool(database_name, max_size=max_size)
+            _pools[database_name] = pool
+        return pool
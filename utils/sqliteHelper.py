@@ -0,0 +1,308 @@
+import MySQLdb
+import sqlite3
+import datetime
+from pathlib import Path
+from typing import Optional, List, Tuple, Union
+import os
+import re
+
+# Match string literals (kept as is) or the MySQLdb placeholders to translate
+_PARAM_TOKEN = re.compile(r"('(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\")|%s|%%")
+_AUTO_INCREMENT = re.compile(r"\b(?:INT|INTEGER|BIGINT)\b[^,]*?\bAUTO_INCREMENT\b[^,]*", re.IGNORECASE)
+_PRIMARY_KEY = re.compile(r",?\s*PRIMARY\s+KEY\s*\(\s*`?(\w+)`?\s*\)", re.IGNORECASE)
+_UNIQUE_KEY = re.compile(r"\bUNIQUE\s+(?:KEY|INDEX)\s+`?\w+`?\s*\(", re.IGNORECASE)
+_PLAIN_KEY = re.compile(r",\s*(?:KEY|INDEX)\s+`?\w+`?\s*\([^)]*\)", re.IGNORECASE)
+_TABLE_OPTIONS = re.compile(
+    r"\s+(?:COMMENT\s+'(?:[^'\\]|\\.|'')*'|(?:CHARACTER\s+SET|CHARSET|COLLATE)\s+\w+)", re.IGNORECASE
+)
+
+# The columns declared as DATE / DATETIME / TIMESTAMP come back as Python objects, like in MySQLdb
+sqlite3.register_adapter(datetime.date, lambda value: value.isoformat())
+sqlite3.register_adapter(datetime.datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("DATE", lambda value: datetime.date.fromisoformat(value.decode()))
+sqlite3.register_converter("DATETIME", lambda value: datetime.datetime.fromisoformat(value.decode()))
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.datetime.fromisoformat(value.decode()))
+
+from utils.sqlHelper import ConnDatabase
+
+
+def _translate_params(query: str) -> str:
+    """Translate MySQLdb placeholders (%s, %%) into the sqlite3 ones (?, %)."""
+    def replace(match):
+        if match.group(1):
+            return match.group(1)
+        return "?" if match.group(0) == "%s" else "%"
+    return _PARAM_TOKEN.sub(replace, query)
+
+
+class _SQLiteCursor:
+    """The subset of the MySQLdb cursor interface used by ConnDatabase."""
+
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self._cursor = cursor
+
+    def execute(self, query: str, params: Optional[tuple] = None) -> None:
+        try:
+            self._cursor.execute(_translate_params(query), tuple(params or ()))
+        except sqlite3.Error as e:
+            raise MySQLdb.Error(str(e)) from e
+
+    def executemany(self, query: str, params_list: List[tuple]) -> None:
+        try:
+            self._cursor.executemany(_translate_params(query), [tuple(params) for params in params_list])
+        except sqlite3.Error as e:
+            raise MySQLdb.Error(str(e)) from e
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self) -> int:
+        return self._cursor.lastrowid
+
+    def fetchone(self) -> Optional[tuple]:
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size: int) -> List[tuple]:
+        return self._cursor.fetchmany(size)
+
+    def fetchall(self) -> List[tuple]:
+        return self._cursor.fetchall()
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class _SQLiteConnection:
+    """The subset of the MySQLdb connection interface used by ConnDatabase."""
+
+    def __init__(self, path: str) -> None:
+        self._connection = sqlite3.connect(
+            path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,  # autocommit, like ConnDatabase's MySQL connection
+            check_same_thread=False,
+        )
+
+    def cursor(self, cursorclass: object = None) -> _SQLiteCursor:
+        # sqlite3 cursors already fetch rows lazily, so SSCursor needs no special handling
+        return _SQLiteCursor(self._connection.cursor())
+
+    def autocommit(self, on: bool) -> None:
+        if on and self._connection.in_transaction:
+            self._connection.commit()
+        self._connection.isolation_level = None if on else "DEFERRED"
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def rollback(self) -> None:
+        self._connection.rollback()
+
+    def ping(self) -> None:
+        try:
+            self._connection.execute("SELECT 1")
+        except sqlite3.Error as e:
+            raise MySQLdb.Error(str(e)) from e
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class SQLiteDatabase(ConnDatabase):
+    """ConnDatabase on an SQLite file, for local development and tests without a MySQL server.
+
+    Every database is a file {database_name}.sqlite3 in the SQLITE_DIR directory
+    (default: sqlite/ at the repository root). Set SQLITE_DIR=:memory: for
+    throwaway in-memory databases. The MySQL column definitions passed to
+    create_if_not_exists / create_new_table are translated to SQLite.
+
+    Usually created through ConnDatabase(database_name, backend='sqlite') or the
+    DB_BACKEND=sqlite environment variable.
+
+    Args:
+        database_name (str): The name of the database to connect to.
+        path (str): Optional path of the database file (or ':memory:').
+        **kwargs: The other arguments of ConnDatabase.
+    """
+
+    _show_tables_query = "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%';"
+    _supports_column_position = False
+
+    def __init__(self, database_name: str, path: Optional[str] = None, **kwargs) -> None:
+        """Initialize the database connection."""
+        if path is None:
+            directory = os.getenv("SQLITE_DIR") or str(Path(__file__).resolve().parent.parent / "sqlite")
+            if directory == ":memory:":
+                path = directory
+            else:
+                Path(directory).mkdir(parents=True, exist_ok=True)
+                path = str(Path(directory) / f"{database_name}.sqlite3")
+        self.path = path
+        super().__init__(database_name, **kwargs)
+
+    def _connect(self) -> _SQLiteConnection:
+        """Open the SQLite database file."""
+        return _SQLiteConnection(self.path)
+
+    def _translate_schema(self, schema: str) -> str:
+        """Adapt a MySQL column definition list to SQLite.
+
+        An AUTO_INCREMENT column becomes the INTEGER PRIMARY KEY, UNIQUE KEY
+        definitions become UNIQUE constraints, plain KEY / INDEX definitions are
+        dropped (use ensure_index) and column / table options are removed.
+        """
+        schema = _TABLE_OPTIONS.sub("", schema)
+        if _AUTO_INCREMENT.search(schema):
+            schema = _AUTO_INCREMENT.sub("INTEGER PRIMARY KEY AUTOINCREMENT", schema)
+            schema = _PRIMARY_KEY.sub("", schema)
+        schema = _UNIQUE_KEY.sub("UNIQUE (", schema)
+        schema = _PLAIN_KEY.sub("", schema)
+        return schema
+
+    def _fetch_columns(self, tables: List[str]) -> List[Tuple[str, str]]:
+        """Query (table, column) pairs of the given tables in column order."""
+        result = []
+        for table in tables:
+            result.extend((table, row[1]) for row in self.fetchall(f"PRAGMA table_info(`{table}`)"))
+        return result
+
+    def _fetch_indexes(self, table_name: str) -> List[Tuple[str, int, str]]:
+        """Query (index, non-unique flag, column) rows of a table in index column order.
+
+        The primary key is reported as 'PRIMARY' like in MySQL, and the names of the
+        indexes added by ensure_index lose their table prefix.
+        """
+        rows = []
+        primary = sorted((row[5], row[1]) for row in self.fetchall(f"PRAGMA table_info(`{table_name}`)") if row[5])
+        rows.extend(("PRIMARY", 0, column) for _, column in primary)
+        for _, index_name, unique, origin, _ in self.fetchall(f"PRAGMA index_list(`{table_name}`)"):
+            if origin == "pk":
+                continue
+            columns = self.fetchall(f"PRAGMA index_info(`{index_name}`)")
+            if index_name.startswith(f"{table_name}__"):
+                index_name = index_name[len(table_name) + 2:]
+            rows.extend((index_name, 0 if unique else 1, row[2]) for row in sorted(columns))
+        return rows
+
+    def _add_index_query(self, table_name: str, index_name: str, fields_str: str, unique: bool) -> str:
+        """Build the statement adding an index; SQLite index names are global, so prefix the table."""
+        return (
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX `{table_name}__{index_name}` "
+            f"ON `{table_name}` (`{fields_str}`)"
+        )
+
+    def _delete_query(self, table_name: str, condition: Optional[str], limit: Optional[int]) -> str:
+        """Build a DELETE statement deleting at most limit rows."""
+        where = f" WHERE {condition}" if condition else ""
+        if limit:
+            return (
+                f"DELETE FROM `{table_name}` WHERE rowid IN "
+                f"(SELECT rowid FROM `{table_name}`{where} LIMIT {limit})"
+            )
+        return f"DELETE FROM `{table_name}`{where}"
+
+    def _upsert_query(self, table_name: str, fields: List[str], key_fields: List[str], update_fields: List[str]) -> str:
+        """Build a single-row INSERT that updates update_fields on a conflicting key."""
+        fields_str = "`, `".join(fields)
+        keys_str = "`, `".join(key_fields)
+        placeholders = ", ".join(["%s"] * len(fields))
+        if update_fields:
+            update_str = ", ".join([f"`{field}`=excluded.`{field}`" for field in update_fields])
+            action = f"DO UPDATE SET {update_str}"
+        else:
+            action = "DO NOTHING"
+        return (
+            f"INSERT INTO `{table_name}` (`{fields_str}`) VALUES ({placeholders}) "
+            f"ON CONFLICT (`{keys_str}`) {action}"
+        )
+
+    def _drop_stage_table(self, stage_table: str) -> None:
+        """Drop the temporary table used by update_many."""
+        self.execute(f"DROP TABLE IF EXISTS temp.`{stage_table}`")
+
+    def _create_stage_table(self, stage_table: str, table_name: str, key_field: str, fields: List[str]) -> None:
+        """Create an empty temporary table with the key and fields of a table, indexed on the key."""
+        fields_str = "`, `".join([key_field] + fields)
+        self._drop_stage_table(stage_table)
+        self.execute(f"CREATE TEMP TABLE `{stage_table}` AS SELECT `{fields_str}` FROM `{table_name}` WHERE 0")
+        self.execute(f"CREATE INDEX temp.`{stage_table}__key` ON `{stage_table}` (`{key_field}`)")
+
+    def _update_from_stage_query(self, table_name: str, stage_table: str, key_field: str, fields: List[str]) -> str:
+        """Build the UPDATE copying the fields of matching keys from the stage table."""
+        set_str = ", ".join([f"`{field}`=s.`{field}`" for field in fields])
+        return (
+            f"UPDATE `{table_name}` SET {set_str} FROM `{stage_table}` AS s "
+            f"WHERE `{table_name}`.`{key_field}`=s.`{key_field}`"
+        )
+
+    def _create_table_like(self, source_table: str, new_table: str) -> None:
+        """Create an empty table with the columns and indexes of the source table."""
+        (sql,) = self.fetchone(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = %s", (source_table,)
+        )
+        self.execute(re.sub(r"^CREATE TABLE\s+(?:`[^`]*`|\"[^\"]*\"|\S+)",
+                            f"CREATE TABLE `{new_table}`", sql, count=1, flags=re.IGNORECASE))
+        self._copy_indexes_from(self.show_indexes(source_table), new_table)
+
+    def _rename_query(self, current_name: str, new_name: str) -> str:
+        """Build the statement renaming a table."""
+        return f"ALTER TABLE `{current_name}` RENAME TO `{new_name}`"
+
+    def rename_table(self, current_name: str, new_name: str, overwrite: bool = False) -> bool:
+        """Rename a database table; the table prefix of its index names follows the new name."""
+        indexes = self.show_indexes(current_name) if self.has_table(current_name) else {}
+        if not super().rename_table(current_name, new_name, overwrite):
+            return False
+        for index_name in indexes:
+            if index_name != "PRIMARY" and not index_name.startswith("sqlite_autoindex_"):
+                self.execute(f"DROP INDEX IF EXISTS `{current_name}__{index_name}`")
+        if indexes:
+            self._copy_indexes_from(indexes, new_name)
+        return True
+
+    def _copy_indexes_from(self, indexes: dict, table_name: str) -> None:
+        """Create the given {index: (unique, columns)} indexes on a table."""
+        for index_name, (unique, columns) in indexes.items():
+            if index_name == "PRIMARY" or index_name.startswith("sqlite_autoindex_"):
+                continue
+            self.execute(self._add_index_query(table_name, index_name, "`, `".join(columns), unique))
+        self._invalidate_schema(table_name)
+
+    def set_primary_key(
+        self,
+        table_name: str,
+        primary_key: Union[str, List[str]],
+        drop_existing: bool = False,
+        constraint_name: Optional[str] = None
+    ) -> bool:
+        """Emulate adding a primary key with a unique index named 'pk'.
+
+        SQLite cannot add a primary key to an existing table. Note that the index
+        is not reported as 'PRIMARY' by show_indexes.
+        """
+        self._validate_table_name(table_name)
+        columns = [primary_key] if isinstance(primary_key, str) else primary_key
+        for col in columns:
+            self._validate_field_name(col)
+        try:
+            if drop_existing:
+                self.remove_primary_key(table_name, constraint_name)
+            self.execute(self._add_index_query(table_name, constraint_name or "pk", "`, `".join(columns), True))
+            self._invalidate_schema(table_name)
+            return True
+        except MySQLdb.Error as e:
+            self.connection.rollback()
+            raise MySQLdb.Error(f"Failed to set primary key: {e}") from e
+
+    def remove_primary_key(self, table_name: str, constraint_name: Optional[str] = None) -> bool:
+        """Remove the unique index added by set_primary_key."""
+        self._validate_table_name(table_name)
+        try:
+            self.execute(f"DROP INDEX IF EXISTS `{table_name}__{constraint_name or 'pk'}`")
+            self._invalidate_schema(table_name)
+            return True
+        except MySQLdb.Error as e:
+            self.connection.rollback()
+            raise MySQLdb.Error(f"Failed to remove primary key: {e}") from e
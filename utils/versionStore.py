@@ -0,0 +1,355 @@
+from typing import Optional, Any, List, Dict, Union, Tuple, Iterator
+import re
+
+from utils.sqlHelper import ConnDatabase
+
+# The consolidated version store: one row per (source, lib, version)
+STORE_DATABASE = 'Libraries'
+STORE_TABLE = 'versions'
+STORE_SCHEMA = '''
+    `id` int unsigned NOT NULL AUTO_INCREMENT,
+    `source` varchar(10) NOT NULL,
+    `lib` varchar(255) NOT NULL,
+    `version` varchar(500) NOT NULL,
+    `rank` int DEFAULT NULL,
+    `year_hits` bigint DEFAULT NULL,
+    `tag_date` date DEFAULT NULL,
+    `npm_date` date DEFAULT NULL,
+    `estimate_date` date DEFAULT NULL,
+    `vuls` json DEFAULT NULL,
+    PRIMARY KEY (`id`),
+    UNIQUE KEY `uk_source_lib_version` (`source`, `lib`, `version`)
+'''
+STORE_COLUMNS = ['source', 'lib', 'version', 'rank', 'year_hits', 'tag_date', 'npm_date', 'estimate_date', 'vuls']
+KEY_FIELDS = ['source', 'lib', 'version']
+
+# source: (legacy database with one table per library, {legacy column: store column})
+SOURCES = {
+    'npm': ('version_npm', {
+        'jsDelivr rank': 'rank', 'year hits': 'year_hits', 'tag date': 'tag_date',
+        'npm date': 'npm_date', 'estimate date': 'estimate_date',
+    }),
+    'gh': ('version_gh', {
+        'jsDelivr rank': 'rank', 'year hits': 'year_hits', 'tag date': 'tag_date',
+        'estimate date': 'estimate_date',
+    }),
+    # Releases and tags are in the GitHub API order (newest first), kept as the rank
+    'release': ('Releases_4_26', {'id': 'rank', 'tag_name': 'version', 'publish_date': 'tag_date'}),
+    'tag': ('Tags_4_26', {'id': 'rank', 'tag_name': 'version', 'publish_date': 'tag_date'}),
+}
+
+
+class VersionStore:
+    """The versions of all libraries in one indexed table instead of one table per library.
+
+    Args:
+        db (ConnDatabase): Optional connection to the database holding the store.
+            Defaults to a new connection to STORE_DATABASE.
+    """
+
+    def __init__(self, db: Optional[ConnDatabase] = None) -> None:
+        self.db = db if db else ConnDatabase(STORE_DATABASE)
+        self.db.create_if_not_exists(STORE_TABLE, STORE_SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def _check_source(self, source: str) -> None:
+        if source not in SOURCES:
+            raise ValueError(f"Unknown version source: {source}. Expected one of {', '.join(SOURCES)}.")
+
+    def libs(self, source: str) -> List[str]:
+        """Return the libraries of a source that have versions in the store."""
+        self._check_source(source)
+        rows = self.db.fetchall(f"SELECT DISTINCT `lib` FROM `{STORE_TABLE}` WHERE `source`=%s", (source,))
+        return sorted(row[0] for row in rows)
+
+    def versions(
+        self,
+        source: str,
+        lib: str,
+        fields: Union[List[str], str] = "*",
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = 'rank',
+        descending: bool = False,
+        return_as: str = "dict"
+    ) -> List[Union[Dict[str, Any], Tuple[Any, ...]]]:
+        """Return the versions of one library (the per-library table of before).
+
+        Args:
+            source: 'npm', 'gh', 'release' or 'tag'
+            lib: Library (or repository) name
+            fields: Store columns to select
+            condition: Optional additional WHERE clause on store columns
+            condition_values: Values of the condition placeholders
+            order_by: Store column to sort by
+            descending: Sort order
+            return_as: 'dict' or 'tuple'
+        """
+        self._check_source(source)
+        where, values = self._scope(source, lib, condition, condition_values)
+        return self.db.select_all(STORE_TABLE, fields, where, values,
+                                  order_by=order_by, descending=descending, return_as=return_as)
+
+    def scan(
+        self,
+        source: str,
+        fields: Union[List[str], str] = "*",
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None,
+        batch_size: int = 10000
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Stream the versions of all libraries of a source in one scan.
+
+        Whole-population analyses should use this instead of one query per library.
+
+        Args:
+            source: 'npm', 'gh', 'release' or 'tag'
+            fields: Store columns to select ('lib' is always included)
+            condition: Optional additional WHERE clause on store columns
+            condition_values: Values of the condition placeholders
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            (lib, [row dict, ...]) for every library, the rows ordered by rank.
+        """
+        self._check_source(source)
+        if fields != "*" and 'lib' not in fields:
+            fields = ['lib'] + list(fields)
+        where, values = self._scope(source, None, condition, condition_values)
+        current, rows = None, []
+        # The unique key (source, lib, version) serves the lib order; rank is sorted per library
+        for row in self.db.iter_rows(STORE_TABLE, fields, where, values, order_by='lib', batch_size=batch_size):
+            if row['lib'] != current:
+                if rows:
+                    yield current, sorted(rows, key=_rank_key)
+                current, rows = row['lib'], []
+            rows.append(row)
+        if rows:
+            yield current, sorted(rows, key=_rank_key)
+
+    def upsert_versions(self, source: str, lib: str, rows: List[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """Insert or update versions of a library, keyed by version.
+
+        Args:
+            source: 'npm', 'gh', 'release' or 'tag'
+            lib: Library (or repository) name
+            rows: Row dicts with a 'version' key and any other store columns
+            chunk_size: Number of rows per statement
+
+        Returns:
+            int: Number of affected rows
+        """
+        self._check_source(source)
+        rows = [{'source': source, 'lib': lib, **row} for row in rows]
+        return self.db.upsert_many(STORE_TABLE, rows, key_fields=KEY_FIELDS, chunk_size=chunk_size)
+
+    def delete_lib(self, source: str, lib: str) -> int:
+        """Delete all versions of a library."""
+        self._check_source(source)
+        return self.db.delete_all(STORE_TABLE, "`source`=%s AND `lib`=%s", (source, lib))
+
+    def tables(self, source: str) -> "VersionTables":
+        """Return a compatibility view with the per-library table interface of the legacy database."""
+        self._check_source(source)
+        return VersionTables(self, source)
+
+    def migrate(
+        self,
+        source: str,
+        legacy_db: Optional[ConnDatabase] = None,
+        libs: Optional[List[str]] = None,
+        logger: object = None
+    ) -> int:
+        """Copy the per-library tables of a legacy database into the store.
+
+        Re-running is safe: versions already in the store are updated.
+
+        Args:
+            source: 'npm', 'gh', 'release' or 'tag'
+            legacy_db: Optional connection to the legacy database of the source
+            libs: Optional subset of the tables to copy (default: all)
+            logger: Optional logger for the progress
+
+        Returns:
+            int: Number of copied rows
+        """
+        self._check_source(source)
+        database_name, column_map = SOURCES[source]
+        close = legacy_db is None
+        legacy_db = legacy_db if legacy_db else ConnDatabase(database_name)
+        total = 0
+        try:
+            tables = libs if libs is not None else legacy_db.show_tables()
+            columns = legacy_db.columns_of(tables)
+            for i, table in enumerate(tables):
+                # Legacy columns known to the store, under their store names
+                fields = [c for c in columns[table] if column_map.get(c, c) in STORE_COLUMNS]
+                if not any(column_map.get(c, c) == 'version' for c in fields):
+                    if logger:
+                        logger.warning(f"{database_name}.{table} has no version column. Skipped.")
+                    continue
+                for batch in legacy_db.iter_rows(table, fields, batch_size=1000, as_batches=True):
+                    rows = [{column_map.get(k, k): v for k, v in row.items()} for row in batch]
+                    rows = [row for row in rows if row['version'] is not None]
+                    if rows:
+                        self.upsert_versions(source, table, rows)
+                        total += len(rows)
+                if logger:
+                    logger.leftTimeEstimator(len(tables) - i)
+        finally:
+            if close:
+                legacy_db.close()
+        return total
+
+    def _scope(
+        self,
+        source: str,
+        lib: Optional[str],
+        condition: Optional[str],
+        condition_values: Optional[Tuple[Any, ...]]
+    ) -> Tuple[str, tuple]:
+        """Prefix a condition with the source (and library) of the rows."""
+        where, values = "`source`=%s", [source]
+        if lib is not None:
+            where += " AND `lib`=%s"
+            values.append(lib)
+        if condition:
+            where += f" AND ({condition})"
+            values.extend(condition_values or ())
+        return where, tuple(values)
+
+
+def _rank_key(row: Dict[str, Any]) -> Tuple[bool, int]:
+    rank = row.get('rank')
+    return (rank is None, rank or 0)
+
+
+class VersionTables:
+    """The legacy one-table-per-library interface on top of the version store.
+
+    Supports the ConnDatabase methods the version scripts use, with the library
+    name in place of the table name and the legacy column names ('year hits',
+    'tag date', ...), so a script can switch by replacing
+    ConnDatabase('version_npm') with VersionStore().tables('npm').
+
+    Args:
+        store (VersionStore): The store.
+        source (str): 'npm', 'gh', 'release' or 'tag'.
+    """
+
+    def __init__(self, store: VersionStore, source: str) -> None:
+        self.store = store
+        self.source = source
+        self._to_store = SOURCES[source][1]
+        self._to_legacy = {v: k for k, v in self._to_store.items()}
+        self._column_pattern = re.compile(
+            "|".join(f"`{re.escape(name)}`" for name in self._to_store)
+        ) if self._to_store else None
+
+    @property
+    def db(self) -> ConnDatabase:
+        return self.store.db
+
+    def _field(self, field: str) -> str:
+        field = self._to_store.get(field, field)
+        if field not in STORE_COLUMNS:
+            raise ValueError(f"Unknown version column: {field}")
+        return field
+
+    def _fields(self, fields: Union[List[str], str]) -> Union[List[str], str]:
+        if fields == "*":
+            return [self._to_legacy.get(c, c) for c in STORE_COLUMNS if c not in ('source', 'lib')]
+        return [fields] if isinstance(fields, str) else list(fields)
+
+    def _condition(self, condition: Optional[str]) -> Optional[str]:
+        if not condition or self._column_pattern is None:
+            return condition
+        return self._column_pattern.sub(lambda m: f"`{self._to_store[m.group(0)[1:-1]]}`", condition)
+
+    def _legacy_row(self, row: Union[Dict[str, Any], Tuple[Any, ...]], fields: List[str]) -> Union[Dict[str, Any], Tuple[Any, ...]]:
+        return dict(zip(fields, row.values())) if isinstance(row, dict) else row
+
+    def show_tables(self) -> List[str]:
+        return self.store.libs(self.source)
+
+    def has_table(self, table_name: str) -> bool:
+        return self.db.fetchone(
+            f"SELECT 1 FROM `{STORE_TABLE}` WHERE `source`=%s AND `lib`=%s LIMIT 1", (self.source, table_name)
+        ) is not None
+
+    def show_columns(self, table_name: str) -> List[str]:
+        return self._fields("*")
+
+    def has_column(self, table_name: str, column_name: str) -> bool:
+        return self._to_store.get(column_name, column_name) in STORE_COLUMNS
+
+    def create_if_not_exists(self, table_name: str, schema: str) -> None:
+        """No-op: a library exists in the store once it has versions."""
+
+    def add_column(self, table_name: str, column_name: str, *args, **kwargs) -> bool:
+        """No-op for the columns of the store, which already has them all."""
+        self._field(column_name)
+        return False
+
+    def entry_count(self, table_name: str, condition: Optional[str] = None, condition_values: Optional[tuple] = None) -> int:
+        where, values = self.store._scope(self.source, table_name, self._condition(condition), condition_values)
+        return self.db.entry_count(STORE_TABLE, where, values)
+
+    def select_all(
+        self,
+        table_name: str,
+        fields: Union[List[str], str] = "*",
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        return_as: str = "dict"
+    ) -> List[Union[Dict[str, Any], Tuple[Any, ...]]]:
+        fields = self._fields(fields)
+        rows = self.store.versions(
+            self.source, table_name, [self._field(f) for f in fields], self._condition(condition), condition_values,
+            order_by=self._field(order_by) if order_by else 'rank', descending=descending, return_as=return_as
+        )
+        return [self._legacy_row(row, fields) for row in rows]
+
+    def iter_rows(
+        self,
+        table_name: str,
+        fields: Union[List[str], str] = "*",
+        condition: Optional[str] = None,
+        condition_values: Optional[Tuple[Any, ...]] = None,
+        batch_size: int = 1000,
+        return_as: str = "dict"
+    ) -> Iterator[Union[Dict[str, Any], Tuple[Any, ...]]]:
+        fields = self._fields(fields)
+        where, values = self.store._scope(self.source, table_name, self._condition(condition), condition_values)
+        for row in self.db.iter_rows(STORE_TABLE, [self._field(f) for f in fields], where, values,
+                                     batch_size=batch_size, return_as=return_as):
+            yield self._legacy_row(row, fields)
+
+    def update(self, table_name: str, data: Dict[str, Any], condition: str, condition_values: Optional[tuple] = None) -> int:
+        where, values = self.store._scope(self.source, table_name, self._condition(condition), condition_values)
+        return self.db.update(STORE_TABLE, {self._field(k): v for k, v in data.items()}, where, values)
+
+    def upsert(self, table_name: str, data: Dict[str, Any], condition_fields: Union[str, List[str]] = "version") -> int:
+        return self.upsert_many(table_name, [data], condition_fields)
+
+    def upsert_many(
+        self,
+        table_name: str,
+        rows: List[Dict[str, Any]],
+        key_fields: Union[str, List[str]] = "version",
+        chunk_size: int = 1000
+    ) -> int:
+        if [self._field(f) for f in ([key_fields] if isinstance(key_fields, str) else key_fields)] != ['version']:
+            raise ValueError("The versions of a library are keyed by 'version'.")
+        rows = [{self._field(k): v for k, v in row.items()} for row in rows]
+        return self.store.upsert_versions(self.source, table_name, rows, chunk_size)
+
+    def drop(self, table_name: str) -> None:
+        self.store.delete_lib(self.source, table_name)
+
+    def close(self) -> None:
+        self.store.close()